@@ -9,12 +9,24 @@ from tkinter import filedialog
 from tkinter import messagebox
 import ttkthemes
 import json 
+import queue
 import threading
 import os 
 import time
+import tempfile
+import zlib
+from copy import copy
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 from datetime import datetime
+from types import SimpleNamespace
 from openpyxl import load_workbook
 from openpyxl.cell import _writer
+from openpyxl.utils import column_index_from_string
+from openpyxl.formula.tokenizer import Tokenizer, Token
+from openpyxl.formatting.formatting import ConditionalFormattingList, ConditionalFormatting
+from openpyxl.worksheet.cell_range import MultiCellRange
+from openpyxl.worksheet.formula import ArrayFormula
 import openpyxl
 import re
 from fpdf import FPDF
@@ -23,6 +35,14 @@ from fpdf import FPDF
 root_width = 1080
 root_height = 720
 
+# Autosave durability modes, selectable from the Settings window
+durability_mode_labels = {
+    "every_save": "Fsync Every Save",
+    "interval": "Fsync At Most Every N Seconds",
+    "checkpoint": "Fsync On Tab Switch And Export"
+}
+default_app_settings = {"durability_mode": "every_save", "fsync_interval_seconds": 5, "undo_history_limit": 500, "undo_history_cell_limit": 50000}
+
 def universal_locate_file_fn(file_name):
     """Finds the correct path to the file whether in script mode or PyInstaller .exe"""
     try:
@@ -60,6 +80,184 @@ def resource_path(relative_path):
 
     return os.path.join(base_path, relative_path)
 
+# Saved report files start with a one line header carrying a save sequence number and a crc32 of the body
+def frame_report_payload(body, save_sequence):
+    header = f"#TSHD seq={save_sequence} crc={zlib.crc32(body):08x} len={len(body)}\n".encode('utf-8')
+    return header + body
+
+def split_report_payload(payload):
+    # Returns (header fields, body), header is None for files written before checksums existed
+    if not payload.startswith(b"#TSHD "):
+        return None, payload
+    header_line, _, body = payload.partition(b"\n")
+    header = dict(field.split("=", 1) for field in header_line.decode('utf-8').split()[1:])
+    return header, body
+
+def read_report_json(path):
+    with open(path, 'rb') as file:
+        header, body = split_report_payload(file.read())
+    return json.loads(body)
+
+def verify_report_file(path, allow_unframed=True):
+    # Checksum only, no JSON parsing; returns the save sequence or None when the file is damaged
+    try:
+        with open(path, 'rb') as file:
+            header, body = split_report_payload(file.read())
+        if header is None:
+            return 0 if allow_unframed and body.strip() else None
+        if int(header['len']) != len(body) or int(header['crc'], 16) != zlib.crc32(body):
+            return None
+        return int(header['seq'])
+    except Exception:
+        return None
+
+def read_report_sequence(path):
+    # Header line only, for picking up the save numbering without reading the body
+    try:
+        with open(path, 'rb') as file:
+            header, body = split_report_payload(file.readline())
+        return int(header['seq']) if header is not None else 0
+    except Exception:
+        return None
+
+def list_report_file_versions(primary):
+    # {save sequence: path} over the primary/.tmp/.bak triple, the primary wins a shared number
+    versions = {}
+    for path in (primary, f"{primary}.tmp", f"{primary}.bak"):
+        if not os.path.exists(path):
+            continue
+        # A .tmp is only trusted when its checksum proves the write finished
+        candidate_seq = verify_report_file(path, allow_unframed=not path.endswith('.tmp'))
+        if candidate_seq is not None:
+            versions.setdefault(candidate_seq, path)
+    return versions
+
+def find_consistent_report_set(directory, report_name, bases):
+    # The newest manifest whose listed shard versions all survive wins, files are only ever
+    # restored together with it so a report never mixes shards from different saves
+    versions = {base: list_report_file_versions(os.path.join(directory, base)) for base in bases}
+    manifest_versions = versions.get(report_name, {})
+    for manifest_seq in sorted(manifest_versions, reverse=True):
+        try:
+            shard_seqs = read_report_json(manifest_versions[manifest_seq]).get('shard_seqs')
+        except Exception:
+            continue
+        if shard_seqs is None:
+            # Saved before shard numbers were recorded, take the newest valid version of each shard
+            chosen = {base: max(versions[base]) for base in bases - {report_name} if versions[base]}
+        else:
+            chosen = {f"{report_name}.{tab.replace(' ', '_')}.shard": shard_seq for tab, shard_seq in shard_seqs.items()}
+            if not all(shard_seq in versions.get(base, {}) for base, shard_seq in chosen.items()):
+                continue
+        chosen[report_name] = manifest_seq
+
+        # Shards first and the manifest last, the same order a save writes them in
+        restore_list = []
+        for base, chosen_seq in chosen.items():
+            primary = os.path.join(directory, base)
+            if versions[base][chosen_seq] != primary:
+                restore_list.append((primary, versions[base][chosen_seq], chosen_seq))
+        return manifest_seq, restore_list
+    return None, []
+
+def scan_for_recoverable_reports(directory):
+    # Group every report's manifest and shard files and list those that differ from its newest complete save
+    recoverable = {}
+    if not os.path.exists(directory):
+        return recoverable
+    report_files = {}
+    for filename in os.listdir(directory):
+        base = filename[:-4] if filename.endswith(('.tmp', '.bak')) else filename
+        if base.endswith(('.json', '.shard')):
+            report_name = base.split('.json')[0] + '.json'
+            report_files.setdefault(report_name, set()).add(base)
+
+    for report_name, bases in report_files.items():
+        manifest_seq, restore_list = find_consistent_report_set(directory, report_name, bases)
+        if restore_list:
+            recoverable[report_name] = (manifest_seq, restore_list)
+    return recoverable
+
+def restore_report_files(restore_list):
+    # Returns one line per restored file for the recovery message
+    restored = []
+    for primary, candidate, candidate_seq in restore_list:
+        if os.path.exists(primary):
+            if verify_report_file(primary) is None:
+                displaced = f"{primary}.corrupt"
+            elif candidate == f"{primary}.bak":
+                # Rolling a shard back to its backup, so the current file cannot take the .bak name
+                displaced = f"{primary}.rolledback"
+            else:
+                displaced = f"{primary}.bak"
+            os.replace(primary, displaced)
+        os.replace(candidate, primary)
+        restored.append(f"{os.path.basename(primary)} from {os.path.basename(candidate)} (save #{candidate_seq})")
+    return restored
+
+def start_recovery_scan(widmg, datmg, root, report_name=None):
+    # Runs off the Tk thread so startup is not held up by reading the saved reports,
+    # report_name limits the offer to one report and says so when nothing was found
+    scan_result = {}
+    directory = os.path.join(os.getcwd(), 'data_entry_files')
+
+    def scan():
+        try:
+            scan_result['recoverable'] = scan_for_recoverable_reports(directory)
+        except Exception as e:
+            logging.error(f"Error scanning for recoverable reports: {e}", exc_info=True)
+            scan_result['recoverable'] = {}
+
+    def offer_recovery():
+        if 'recoverable' not in scan_result:
+            root.after(250, offer_recovery)
+            return
+        recoverable = scan_result['recoverable']
+        if report_name is not None:
+            recoverable = {name: recoverable[name] for name in recoverable if name == report_name}
+            if not recoverable:
+                messagebox.showinfo("Recover Report", f"No other saved version of\n{report_name}\nwas found.")
+        for report_name_found, (manifest_seq, restore_list) in recoverable.items():
+            message = (f"A complete, undamaged saved version of\n{report_name_found}\nwas found (save #{manifest_seq}), "
+                       f"{len(restore_list)} of its files differ from it.\n\n"
+                       f"Restore it? The current files will be kept as .bak/.rolledback/.corrupt.")
+            if messagebox.askyesno("Recover Report", message):
+                try:
+                    restored = restore_report_files(restore_list)
+                    messagebox.showinfo("Recover Report", "Restored:\n" + "\n".join(restored))
+                except Exception as e:
+                    messagebox.showerror("Recover Report", f"Could not restore {report_name_found}: {e}")
+
+    threading.Thread(target=scan, daemon=True).start()
+    root.after(250, offer_recovery)
+
+def offer_report_recovery(widmg, datmg, root, filename):
+    # A report that fails to load is never opened half-read, the user is sent to the recovery scan instead
+    message = (f"{os.path.basename(filename)} could not be read and was not opened.\n\n"
+               f"Look for a newer or undamaged saved version of it?")
+    if messagebox.askyesno("Open Report", message, icon='error'):
+        start_recovery_scan(widmg, datmg, root, os.path.basename(filename))
+
+def get_app_settings_path():
+    return os.path.join(os.getcwd(), 'app_settings.json')
+
+def load_app_settings():
+    settings = dict(default_app_settings)
+    try:
+        if os.path.exists(get_app_settings_path()):
+            with open(get_app_settings_path(), 'r') as file:
+                settings.update(json.load(file))
+    except Exception as e:
+        logging.error(f"Error reading app settings: {e}", exc_info=True)
+    return settings
+
+def save_app_settings(settings):
+    try:
+        with open(get_app_settings_path(), 'w') as file:
+            json.dump(settings, file, indent=4)
+    except Exception as e:
+        logging.error(f"Error saving app settings: {e}", exc_info=True)
+
 # Determine the directory of the executable
 exe_dir = os.path.dirname(os.path.abspath(sys.executable))
 
@@ -87,9 +285,36 @@ class WidgetManager:
     def __init__(self, root):
         self.root = root
         self.font_widgets = {}
+        self.text_fit = TextFitEngine()
+        self.row_render_cache = {}
+        self.row_render_signature = None
+        self.row_applied_states = {}
+        self.row_render_targets = {}
+        self.row_fit_tables = {}
+        self.render_condition = threading.Condition()
+        self.render_job = None
+        self.prefetch_job = None
+        self.render_thread = None
+        self.render_busy = False
+        self.render_results = queue.Queue()
+        self.render_poll_after_id = None
+        self.row_render_context = None
+        self.prefetch_after_id = None
+        self.prefetch_min_depth = 3
+        self.prefetch_max_depth = 5
+        self.prefetch_budget_ms = 20.0
+        self.render_cost_ms = None
         self.resize_scheduled = False
         self.last_width = root_width
         self.last_height = root_height
+        self.last_configure_time = 0.0
+        self.visible_font_groups = set()
+        self.resize_fit_cache = OrderedDict()
+        self.resize_cache_scales = 8
+        self.resize_settle_after_id = None
+        self.resize_settle_ms = 250
+        self.resize_budget_ms = 40.0
+        self.resize_cost_ms = None
         self.tubing_or_drillpipe_menu = {'display_frame': {}, 'button': {}, 'label': {},'listbox': {}, 'scrollbar': {}, 'combobox': {}, 'entry': {}, 'checkbutton': {}, 'text': {}, 'calendar': {}}
         self.saved_file_select_window = {'display_frame': {}, 'button': {}, 'label': {},'listbox': {}, 'scrollbar': {}, 'combobox': {}, 'entry': {}, 'checkbutton': {}, 'text': {}, 'calendar': {}}
         self.branch_select_screen_widgets = {'display_frame': {}, 'button': {}, 'label': {},'listbox': {}, 'scrollbar': {}, 'combobox': {}, 'entry': {}, 'checkbutton': {}, 'text': {}, 'calendar': {}}
@@ -119,6 +344,7 @@ class WidgetManager:
             'button': {},
             'back_buttons': {},
             'label': {},
+            'entry': {},
             'header_col_labels': {},
             'col_entry_labels': {}
         }
@@ -159,6 +385,19 @@ class WidgetManager:
         self.micro_plus_one_stvar = tk.StringVar()
         self.micro_plus_two_stvar = tk.StringVar()
         self.first_entry_widget = None
+        self.joint_entry_widgets = []
+        self.joint_entry_vars = []
+        self.joint_entry_dirty = []
+        self.entry_columns = {}
+        self.pending_joint_target = None
+        self.joint_render_after_id = None
+        self.joint_autosave_after_id = None
+        self.frame_interval_ms = 16
+        self.max_joint_number = sys.maxsize
+        self.joint_page_size = 10
+        self.jump_to_joint_var = tk.StringVar()
+        self.heatmap_band_size = 100
+        self.burst_autosave_delay_ms = 300
 
         self.prev_first_row_label_list = []
         self.prev_sec_row_label_list = []
@@ -179,6 +418,7 @@ class WidgetManager:
             text_var = widget.cget("textvariable") if widget.cget("textvariable") else None
             if widget_dict_id not in self.font_widgets:
                 self.font_widgets[widget_dict_id] = {}
+            self.visible_font_groups.add(widget_dict_id)
             self.font_widgets[widget_dict_id][key] = {
                 'widget': widget,
                 'params': params,
@@ -202,6 +442,7 @@ class WidgetManager:
             text_var = widget.cget("textvariable") if widget.cget("textvariable") else None
             if widget_dict_id not in self.font_widgets:
                 self.font_widgets[widget_dict_id] = {}
+            self.visible_font_groups.add(widget_dict_id)
             self.font_widgets[widget_dict_id][key] = {
                 'widget': widget,
                 'params': params,
@@ -225,6 +466,7 @@ class WidgetManager:
             text_var = widget.cget("textvariable") if widget.cget("textvariable") else None
             if widget_dict_id not in self.font_widgets:
                 self.font_widgets[widget_dict_id] = {}
+            self.visible_font_groups.add(widget_dict_id)
             self.font_widgets[widget_dict_id][key] = {
                 'widget': widget,
                 'params': params,
@@ -235,12 +477,77 @@ class WidgetManager:
                 'text_var': text_var
             }
 
+  # Preview Render Worker
+    def submit_preview_render(self, render_context, pending_joints, prefetch=False):
+        # Latest-wins per slot: a newer joint move replaces a job the worker has not picked up yet,
+        # and visible rows always go ahead of prefetching
+        with self.render_condition:
+            if prefetch:
+                self.prefetch_job = (render_context, pending_joints)
+            else:
+                self.render_job = (render_context, pending_joints)
+            self.render_condition.notify()
+        if self.render_thread is None or not self.render_thread.is_alive():
+            self.render_thread = threading.Thread(target=self._preview_render_loop, daemon=True)
+            self.render_thread.start()
+        self.schedule_render_poll()
+
+    def schedule_render_poll(self):
+        if self.render_poll_after_id is None:
+            self.render_poll_after_id = self.root.after(self.frame_interval_ms, self.poll_preview_renders)
+
+    def poll_preview_renders(self):
+        # Tk thread side of the worker: results come back through a queue, never through Tk calls on the worker
+        self.render_poll_after_id = None
+        while True:
+            try:
+                render_context, results = self.render_results.get_nowait()
+            except queue.Empty:
+                break
+            apply_rendered_preview_rows(self, self.data_manager, self.root, render_context, results)
+        with self.render_condition:
+            busy = self.render_busy or self.render_job is not None or self.prefetch_job is not None
+        if busy or not self.render_results.empty():
+            self.schedule_render_poll()
+
+    def _preview_render_loop(self):
+        while True:
+            with self.render_condition:
+                self.render_condition.wait_for(lambda: self.render_job is not None or self.prefetch_job is not None)
+                if self.render_job is not None:
+                    render_context, pending_joints = self.render_job
+                    self.render_job = None
+                else:
+                    render_context, pending_joints = self.prefetch_job
+                    self.prefetch_job = None
+                self.render_busy = True
+            results = None
+            try:
+                start_time = time.perf_counter()
+                results = [(joint_key, joint_entry, compute_joint_cell_states(self.data_manager, render_context, joint_entry))
+                           for joint_key, joint_entry in pending_joints]
+                if results:
+                    # Smoothed cost of rendering one joint, used to size the prefetch window
+                    joint_cost_ms = (time.perf_counter() - start_time) * 1000 / len(results)
+                    self.render_cost_ms = joint_cost_ms if self.render_cost_ms is None else 0.8 * self.render_cost_ms + 0.2 * joint_cost_ms
+            except Exception as e:
+                logging.error(f"Error rendering preview rows: {e}", exc_info=True)
+            with self.render_condition:
+                if results is not None:
+                    self.render_results.put((render_context, results))
+                self.render_busy = False
+
+    def mark_entry_dirty(self, idx):
+        self.joint_entry_dirty[idx] = True
+
+    def clear_entry_dirty(self):
+        self.joint_entry_dirty = [False] * len(self.joint_entry_widgets)
+
     def hide_widget_grouping(self, widget_grouping):
         for key, widget_info in widget_grouping.items():
             widget = widget_info['widget']
             widget.place_forget()
-            if key in self.font_widgets:
-                self.font_widgets[key]['visible'] = False
+        self.set_font_group_visible(widget_grouping, False)
 
     def hide_all_page_widgets(self, page):
         for widget_type in page:
@@ -250,54 +557,38 @@ class WidgetManager:
         for key, widget_info in widget_grouping.items():
             widget = widget_info['widget']
             widget.place(**widget_info['params'])
-            if key in self.font_widgets:
-                self.font_widgets[key]['visible'] = True
+        self.set_font_group_visible(widget_grouping, True)
 
     def get_label_widget(self, widmg, frame_key, label_key):
         label_info = widmg.main_table_display_widgets['display_frame'][frame_key][label_key]['widget']
         return label_info
 
   # Interactions
-    def on_focus(self, event, root):
-        def adjust_font(label, text_variable, base_font_family, base_font_size, base_font_weight):
-            text = text_variable.get()
-            label_height = int(label.winfo_height())
-            label_width = int(label.winfo_width())
-            wrap_length = int(label_width * 0.98)
-
-            # Create a test label with similar configuration
-            test_label = tk.Label(label.master, text=text, bd=1, relief="solid", font=(base_font_family, base_font_size, base_font_weight))
-            test_label.config(wraplength=wrap_length)
-            test_label.update_idletasks()
-
-            # Adjust font size to fit text within the label
-            while (test_label.winfo_reqwidth() > wrap_length or test_label.winfo_reqheight() > label_height) and base_font_size > 5:
-                base_font_size -= 1
-                test_label.config(font=(base_font_family, base_font_size, base_font_weight))
-                test_label.update_idletasks()
-
-            # Destroy the test label after adjustments
-            test_label.destroy()
-
-            # Apply the adjusted font size to the actual label
-            label.config(font=(base_font_family, base_font_size, base_font_weight))
-
-            # Update the widmg.font_widgets dictionary
-            widget_dict_id = id(self.main_table_display_widgets['label'])
-            label_key = label._name
-            if widget_dict_id not in self.font_widgets:
-                self.font_widgets[widget_dict_id] = {}
-            self.font_widgets[widget_dict_id][label_key] = {
-                'widget': label,
-                'params': {},
-                'visible': True,
-                'initial_font': (base_font_family, base_font_size, base_font_weight)
-            }
+    def adjust_magnifier_font(self, label, text_variable, base_font_family, base_font_size, base_font_weight):
+        label_width = int(label.winfo_width())
+        label_height = int(label.winfo_height())
+        fitted_font = self.text_fit.fit_font(text_variable.get(), (base_font_family, base_font_size, base_font_weight), int(label_width * 0.98), label_height)
+
+        # Apply the adjusted font size to the actual label
+        label.config(font=fitted_font)
+
+        # Update the widmg.font_widgets dictionary
+        widget_dict_id = id(self.main_table_display_widgets['label'])
+        label_key = label._name
+        if widget_dict_id not in self.font_widgets:
+            self.font_widgets[widget_dict_id] = {}
+        self.visible_font_groups.add(widget_dict_id)
+        self.font_widgets[widget_dict_id][label_key] = {
+            'widget': label,
+            'params': {},
+            'visible': True,
+            'initial_font': fitted_font
+        }
 
-        col_header_display_frame = self.main_table_display_widgets['display_frame']['col_header_display_frame']['widget']
-        if event.widget.winfo_parent() == str(col_header_display_frame):
+    def on_focus(self, event, root):
+        column = self.entry_columns.get(event.widget)
+        if column is not None:
             active_tab = self.data_manager.json_data_dict['active_tab']
-            column = event.widget.grid_info()['column']
             headers_list = self.data_manager.json_data_dict['report_data'][active_tab]['users_column_select']
             header = headers_list[column]
             self.magni_header.set(header)
@@ -306,64 +597,37 @@ class WidgetManager:
 
             # Adjust font for magni_header_label
             magni_header_label = self.main_table_display_widgets['label']['magni_header_label']['widget']
-            adjust_font(magni_header_label, self.magni_header, "Arial", 45, 'bold')
+            self.adjust_magnifier_font(magni_header_label, self.magni_header, "Arial", 45, 'bold')
 
             # Adjust font for magni_content_label
             magni_content_label = self.main_table_display_widgets['label']['magni_content_label']['widget']
-            adjust_font(magni_content_label, self.magni_content, "Helvetica", 38, 'italic')
+            self.adjust_magnifier_font(magni_content_label, self.magni_content, "Helvetica", 38, 'italic')
+            self.color_magnifier_content(header, event.widget.get())
+
+    def color_magnifier_content(self, header, value):
+        # Same classes as the preview rows so a bad reading shows while it is being typed
+        txt_color, bg_color, fontchange = self.data_manager.color_code_dict[self.data_manager.classify_cell(header, value)]
+        magni_content_label = self.main_table_display_widgets['label']['magni_content_label']['widget']
+        magni_content_label.config(fg=txt_color, bg=bg_color)
 
     def on_focus_out(self, event):
         event.widget.config(highlightthickness=1, highlightbackground='black', highlightcolor='black')  # Revert border on focus loss
 
 
     def on_key_release(self, event):
-        col_header_display_frame = self.main_table_display_widgets['display_frame']['col_header_display_frame']['widget']
-        if event.widget.winfo_parent() == str(col_header_display_frame):
+        column = self.entry_columns.get(event.widget)
+        if column is not None:
             self.magni_content.set(event.widget.get())
+            active_tab = self.data_manager.json_data_dict['active_tab']
+            self.color_magnifier_content(self.data_manager.json_data_dict['report_data'][active_tab]['users_column_select'][column], event.widget.get())
 
     def update_magnifier(self, root):
-        def adjust_font(label, text_variable, base_font_family, base_font_size, base_font_weight):
-            text = text_variable.get()
-            label_height = int(label.winfo_height())
-            label_width = int(label.winfo_width())
-            wrap_length = int(label_width * 0.98)
-
-            # Create a test label with similar configuration
-            test_label = tk.Label(label.master, text=text, bd=1, relief="solid", font=(base_font_family, base_font_size, base_font_weight))
-            test_label.config(wraplength=wrap_length)
-            test_label.update_idletasks()
-
-            # Adjust font size to fit text within the label
-            while (test_label.winfo_reqwidth() > wrap_length or test_label.winfo_reqheight() > label_height) and base_font_size > 5:
-                base_font_size -= 1
-                test_label.config(font=(base_font_family, base_font_size, base_font_weight))
-                test_label.update_idletasks()
-
-            # Destroy the test label after adjustments
-            test_label.destroy()
-
-            # Apply the adjusted font size to the actual label
-            label.config(font=(base_font_family, base_font_size, base_font_weight))
-
-            # Update the widmg.font_widgets dictionary
-            widget_dict_id = id(self.main_table_display_widgets['label'])
-            label_key = label._name
-            if widget_dict_id not in self.font_widgets:
-                self.font_widgets[widget_dict_id] = {}
-            self.font_widgets[widget_dict_id][label_key] = {
-                'widget': label,
-                'params': {},
-                'visible': True,
-                'initial_font': (base_font_family, base_font_size, base_font_weight)
-            }
-
         # Existing logic to update magnifier content
         focus_widget = root.focus_get()
         if isinstance(focus_widget, tk.Entry):
             try:
-                col_header_display_frame = self.main_table_display_widgets['display_frame']['col_header_display_frame']['widget']
-                if focus_widget.winfo_parent() == str(col_header_display_frame):
-                    column = focus_widget.grid_info()['column']
+                column = self.entry_columns.get(focus_widget)
+                if column is not None:
                     active_tab = self.data_manager.json_data_dict['active_tab']
                     headers_list = self.data_manager.json_data_dict['report_data'][active_tab]['users_column_select']
                     header = headers_list[column]
@@ -372,125 +636,489 @@ class WidgetManager:
 
                     # Adjust font for magni_header_label
                     magni_header_label = self.main_table_display_widgets['label']['magni_header_label']['widget']
-                    adjust_font(magni_header_label, self.magni_header, "Arial", 45, 'bold')
+                    self.adjust_magnifier_font(magni_header_label, self.magni_header, "Arial", 45, 'bold')
 
                     # Adjust font for magni_content_label
                     magni_content_label = self.main_table_display_widgets['label']['magni_content_label']['widget']
-                    adjust_font(magni_content_label, self.magni_content, "Helvetica", 38, 'italic')
+                    self.adjust_magnifier_font(magni_content_label, self.magni_content, "Helvetica", 38, 'italic')
+                    self.color_magnifier_content(header, focus_widget.get())
             except KeyError:
                 print("Error: The focused widget is not configured properly.")
 
 
 
     def schedule_resize_fonts(self, event=None):
+        # The root binding also sees <Configure> from every child widget; only the window itself counts
+        if event is not None and event.widget is not self.root:
+            return
         current_width = event.width if event else self.root.winfo_width()
         current_height = event.height if event else self.root.winfo_height()
-
-        if not self.resize_scheduled and (current_width != self.last_width or current_height != self.last_height):
+        if current_width == self.last_width and current_height == self.last_height:
+            return
+        self.last_width = current_width
+        self.last_height = current_height
+        self.last_configure_time = time.perf_counter()
+        if not self.resize_scheduled:
             self.resize_scheduled = True
-            self.last_width = current_width
-            self.last_height = current_height
             self.root.after(100, self.resize_fonts)
-            self.root.after(100, self.adjust_wraplength)
 
-    def adjust_wraplength(self, event=None):
-        current_width = event.width if event else self.root.winfo_width()
-        width_ratio = current_width / root_width
-
-        for widget_dict_id, widgets in self.font_widgets.items():
-            for key, widget_info in widgets.items():
-                if widget_info['visible']:
-                    widget = widget_info['widget']
-                    initial_wraplength = widget_info.get('initial_wraplength')
-                    
-                    if initial_wraplength is not None:
-                        new_wraplength = int(initial_wraplength * width_ratio)
-                        widget.config(wraplength=new_wraplength)
+    def visible_font_widgets(self):
+        for widget_dict_id in list(self.visible_font_groups):
+            for key, widget_info in self.font_widgets.get(widget_dict_id, {}).items():
+                try:
+                    mapped = widget_info['visible'] and widget_info['widget'].winfo_ismapped()
+                except tk.TclError:
+                    continue
+                if mapped:
+                    yield widget_dict_id, key, widget_info
 
+    def set_font_group_visible(self, widget_grouping, visible):
+        widget_dict_id = id(widget_grouping)
+        if visible:
+            self.visible_font_groups.add(widget_dict_id)
+        else:
+            self.visible_font_groups.discard(widget_dict_id)
+        for key in widget_grouping:
+            if key in self.font_widgets.get(widget_dict_id, {}):
+                self.font_widgets[widget_dict_id][key]['visible'] = visible
 
     def resize_fonts(self, event=None):
         self.resize_scheduled = False
-        current_width = event.width if event else self.root.winfo_width()
-        current_height = event.height if event else self.root.winfo_height()
+        self.row_applied_states = {}
+        if self.resize_settle_after_id is not None:
+            self.root.after_cancel(self.resize_settle_after_id)
+            self.resize_settle_after_id = None
+        start_time = time.perf_counter()
+        current_width, current_height = self.last_width, self.last_height
+
+        # While the window is still being dragged and a full pass has been too slow, just scale the
+        # fonts and leave the exact fit for when the drag settles
+        dragging = (start_time - self.last_configure_time) * 1000 < self.resize_settle_ms
+        if dragging and self.resize_cost_ms is not None and self.resize_cost_ms > self.resize_budget_ms:
+            self.apply_coarse_fonts(current_width, current_height)
+            self.resize_settle_after_id = self.root.after(self.resize_settle_ms, self.settle_resize)
+            return
+
+        scale_key = (current_width, current_height)
+        fitted_fonts = self.resize_fit_cache.pop(scale_key, {})
+        self.resize_fit_cache[scale_key] = fitted_fonts
+        while len(self.resize_fit_cache) > self.resize_cache_scales:
+            self.resize_fit_cache.popitem(last=False)
+
         width_ratio = current_width / root_width
-        height_ratio = current_height / root_height
-        scaling_factor = min(width_ratio, height_ratio)
-
-        def adjust_font_to_fit_widget(widget, initial_font):
-            base_font_family, base_font_size, base_font_weight = initial_font
-            label_height = int(widget.winfo_height())
-            label_width = int(widget.winfo_width())
-            wrap_length = int(label_width * 0.98)
-
-            # Create a test label with similar configuration
-            test_label = tk.Label(widget.master, text=widget.cget("text"), bd=1, relief="solid", font=(base_font_family, base_font_size, base_font_weight))
-            test_label.config(wraplength=wrap_length)
-            test_label.update_idletasks()
-
-            # Adjust font size to fit text within the label
-            while (test_label.winfo_reqwidth() > wrap_length or test_label.winfo_reqheight() > label_height) and base_font_size > 5:
-                base_font_size -= 1
-                test_label.config(font=(base_font_family, base_font_size, base_font_weight))
-                test_label.update_idletasks()
-
-            # Destroy the test label after adjustments
-            test_label.destroy()
-
-            # Apply the adjusted font size to the actual widget
-            widget.config(font=(base_font_family, base_font_size, base_font_weight))
-
-        for widget_dict_id, widgets in self.font_widgets.items():
-            for key, widget_info in widgets.items():
-                if widget_info['visible']:
-                    widget = widget_info['widget']
-                    initial_font = widget_info['initial_font']
-                    
-                    if isinstance(initial_font, tuple):
-                        family = initial_font[0]
-                        size = initial_font[1]
-                        styles = initial_font[2:]  # Capture additional styles
-                        
-                        # Initialize default styles
-                        weight = 'normal'
-                        slant = 'roman'
-                        underline = 0
-                        overstrike = 0
-                        
-                        # Parse styles
-                        for style in styles:
-                            if style == 'bold':
-                                weight = 'bold'
-                            elif style == 'italic':
-                                slant = 'italic'
-                            elif style == 'underline':
-                                underline = 1
-                            elif style == 'overstrike':
-                                overstrike = 1
-                        
-                        adjust_font_to_fit_widget(widget, (family, size, weight))
-
-                    elif isinstance(initial_font, str):
-                        parts = initial_font.split()
-                        family = parts[0]
-                        size = int(parts[1]) if parts[1].isdigit() else 10
-                        style_parts = parts[2:] if len(parts) > 2 else []
-                        
-                        weight = 'normal'
-                        slant = 'roman'
-                        underline = 0
-                        overstrike = 0
-                        
-                        for style in style_parts:
-                            if style == 'bold':
-                                weight = 'bold'
-                            elif style == 'italic':
-                                slant = 'italic'
-                            elif style == 'underline':
-                                underline = 1
-                            elif style == 'overstrike':
-                                overstrike = 1
-                        
-                    adjust_font_to_fit_widget(widget, (family, size, weight))
+        geometry_ready = False
+        for widget_dict_id, key, widget_info in list(self.visible_font_widgets()):
+            widget = widget_info['widget']
+            initial_wraplength = widget_info.get('initial_wraplength')
+            if initial_wraplength is not None:
+                widget.config(wraplength=int(initial_wraplength * width_ratio))
+
+            font_key = self.parse_font_spec(widget_info['initial_font'])
+            text = widget.cget("text")
+            cached = fitted_fonts.get((widget_dict_id, key))
+            if cached is not None and cached[:2] == (text, font_key):
+                fitted_font = cached[2]
+            else:
+                if not geometry_ready:
+                    # One geometry pass for the whole page instead of one per widget
+                    self.root.update_idletasks()
+                    geometry_ready = True
+                fitted_font = self.text_fit.fit_font(text, font_key, int(widget.winfo_width() * 0.98), int(widget.winfo_height()))
+                fitted_fonts[(widget_dict_id, key)] = (text, font_key, fitted_font)
+            widget.config(font=fitted_font)
+
+        if geometry_ready:
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            self.resize_cost_ms = elapsed_ms if self.resize_cost_ms is None else 0.7 * self.resize_cost_ms + 0.3 * elapsed_ms
+
+    def apply_coarse_fonts(self, current_width, current_height):
+        scaling_factor = min(current_width / root_width, current_height / root_height)
+        for widget_dict_id, key, widget_info in list(self.visible_font_widgets()):
+            widget = widget_info['widget']
+            initial_wraplength = widget_info.get('initial_wraplength')
+            if initial_wraplength is not None:
+                widget.config(wraplength=int(initial_wraplength * current_width / root_width))
+            family, size, weight = self.parse_font_spec(widget_info['initial_font'])
+            widget.config(font=(family, max(5, int(size * scaling_factor)), weight))
+
+    def settle_resize(self):
+        self.resize_settle_after_id = None
+        if (time.perf_counter() - self.last_configure_time) * 1000 < self.resize_settle_ms:
+            self.resize_settle_after_id = self.root.after(self.resize_settle_ms, self.settle_resize)
+            return
+        if not self.resize_scheduled:
+            self.resize_fonts()
+
+    @staticmethod
+    def parse_font_spec(initial_font):
+        # Registered fonts are either tuples or Tk font strings such as "Arial 12 bold"; fitting only keeps the weight
+        if isinstance(initial_font, tuple):
+            parts = list(initial_font)
+        else:
+            parts = str(initial_font).split()
+        size = int(parts[1]) if len(parts) > 1 and str(parts[1]).lstrip('-').isdigit() else 10
+        weight = 'bold' if 'bold' in [str(part) for part in parts[2:]] else 'normal'
+        return (parts[0] if parts else 'TkDefaultFont', abs(size), weight)
+
+
+class TextFitEngine:
+    # Finds the largest font size whose wrapped text fits a box. Text is measured with tkinter.font
+    # the way a bd=1 Label would wrap it, so no throwaway widgets or idle flushes are needed
+    table_chars = ''.join(chr(code) for code in range(32, 127))
+
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+        self.cache = OrderedDict()
+        self.fonts = {}
+        self.width_tables = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, family, size, style):
+        key = (family, size, style)
+        measure_font = self.fonts.get(key)
+        if measure_font is None:
+            styles = str(style).split()
+            measure_font = tkFont.Font(family=family, size=size,
+                                       weight='bold' if 'bold' in styles else 'normal',
+                                       slant='italic' if 'italic' in styles else 'roman')
+            self.fonts[key] = measure_font
+        return measure_font
+
+    def get_width_table(self, family, size, style):
+        # Per-character advances of one font, so fitting can also run away from the Tk thread
+        key = (family, size, style)
+        table = self.width_tables.get(key)
+        if table is None:
+            measure_font = self.get_font(family, size, style)
+            widths = {char: measure_font.measure(char) for char in self.table_chars}
+            table = (widths, measure_font.measure('W'), measure_font.metrics('linespace'))
+            self.width_tables[key] = table
+        return table
+
+    def build_width_tables(self, fonts, min_size=5):
+        tables = {}
+        for font_spec in fonts:
+            family, base_size, style = self.split_font(font_spec)
+            for size in range(min(min_size, base_size), base_size + 1):
+                tables[(family, size, style)] = self.get_width_table(family, size, style)
+        return tables
+
+    @staticmethod
+    def split_font(font_spec):
+        style = ' '.join(str(part) for part in font_spec[2:]) if len(font_spec) > 2 else 'normal'
+        return font_spec[0], int(font_spec[1]), style
+
+    @staticmethod
+    def text_fits(text, measure, linespace, wrap_length, box_height, padding=4):
+        # Greedy word wrap as Tk does it; a word wider than the wrap length is split across lines
+        wrap_length = max(wrap_length, 1)
+        space_width = measure(' ')
+        widest = 0
+        lines = 0
+        for paragraph in text.split('\n'):
+            lines += 1
+            line_width = 0
+            for word in paragraph.split(' '):
+                word_width = measure(word)
+                if line_width and line_width + space_width + word_width > wrap_length:
+                    widest = max(widest, line_width)
+                    lines += 1
+                    line_width = 0
+                if word_width > wrap_length:
+                    lines += int(word_width // wrap_length)
+                    widest = wrap_length
+                    line_width = word_width % wrap_length
+                else:
+                    line_width = word_width if not line_width else line_width + space_width + word_width
+            widest = max(widest, line_width)
+        return widest + padding <= wrap_length and lines * linespace + padding <= box_height
+
+    @staticmethod
+    def search_size(fits, base_size, min_size):
+        # Size is monotonic in fit, so binary search the largest size that fits, else the minimum
+        low, high = min_size, base_size
+        size = min(min_size, base_size)
+        while low <= high:
+            mid = (low + high) // 2
+            if fits(mid):
+                size = mid
+                low = mid + 1
+            else:
+                high = mid - 1
+        return size
+
+    def fit_size(self, text, family, base_size, style, wrap_length, box_height, min_size=5):
+        text = str(text)
+        key = (text, family, style, base_size, min_size, wrap_length, box_height)
+        size = self.cache.get(key)
+        if size is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return size
+        self.misses += 1
+
+        def fits(size):
+            measure_font = self.get_font(family, size, style)
+            return self.text_fits(text, measure_font.measure, measure_font.metrics('linespace'), wrap_length, box_height)
+        size = self.search_size(fits, base_size, min_size)
+
+        self.cache[key] = size
+        if len(self.cache) > self.capacity:
+            self.cache.popitem(last=False)
+        return size
+
+    def fit_font(self, text, font_spec, wrap_length, box_height, min_size=5):
+        family, base_size, style = self.split_font(font_spec)
+        return (family, self.fit_size(text, family, base_size, style, wrap_length, box_height, min_size), style)
+
+    @staticmethod
+    def fit_font_from_tables(text, font_spec, wrap_length, box_height, tables, min_size=5):
+        # Pure data: only reads prebuilt width tables, never Tk or the shared cache
+        family, base_size, style = TextFitEngine.split_font(font_spec)
+        text = str(text)
+
+        def fits(size):
+            table = tables.get((family, size, style))
+            if table is None:
+                return True
+            widths, fallback_width, linespace = table
+            return TextFitEngine.text_fits(text, lambda part: sum(widths.get(char, fallback_width) for char in part),
+                                           linespace, wrap_length, box_height)
+        return (family, TextFitEngine.search_size(fits, base_size, min_size), style)
+
+
+class LatencyTracker:
+    # Rolling per-stage timings (ms) for joint navigation. The render and save threads record into it too
+    def __init__(self, window=500):
+        self.window = window
+        self.samples = {}
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name):
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start_time) * 1000)
+
+    def record(self, name, elapsed_ms):
+        with self.lock:
+            if name not in self.samples:
+                self.samples[name] = deque(maxlen=self.window)
+            self.samples[name].append(elapsed_ms)
+
+    def reset(self):
+        with self.lock:
+            self.samples = {}
+
+    def summary(self):
+        with self.lock:
+            samples = {name: sorted(values) for name, values in self.samples.items() if values}
+        return {name: {"count": len(values),
+                       "p50_ms": values[int(0.50 * (len(values) - 1))],
+                       "p95_ms": values[int(0.95 * (len(values) - 1))],
+                       "max_ms": values[-1]}
+                for name, values in samples.items()}
+
+    def format_summary(self):
+        lines = [f"{'Stage':<38}{'count':>7}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}"]
+        for name, result in self.summary().items():
+            lines.append(f"{name:<38}{result['count']:>7}{result['p50_ms']:>9.2f}{result['p95_ms']:>9.2f}{result['max_ms']:>9.2f}")
+        return "\n".join(lines)
+
+    def dump(self, directory, text=None):
+        # Appended next to the error_log_*.txt files so both can be collected from a laptop together
+        path = os.path.join(directory, f"latency_log_{datetime.now().strftime('%m.%d.%Y')}.txt")
+        with open(path, 'a') as file:
+            file.write(f"{datetime.now().strftime('%m.%d.%Y %H:%M:%S')}\n{text or self.format_summary()}\n\n")
+        return path
+
+
+class ReportValidator:
+    # UT and reface checks compiled from one report's metadata. classify() returns a color_code_dict key
+    reface_keywords = frozenset(["R1", "R2", "R3", "R4", "R"])
+    fraction_pattern = re.compile(r'(\d+)\s(\d+/\d+)')
+
+    def __init__(self, datmg, version=0):
+        metadata = datmg.json_data_dict['report_user_metadata']
+        self.version = version
+        self.report_type = datmg.json_data_dict['report_type']
+        connection_size = metadata.get('connection_size_choice')
+        conn_type = metadata.get('connection_type_choice')
+        self.signature = (self.report_type, connection_size, conn_type)
+
+        self.nominal_wall = None
+        try:
+            if self.report_type == 'Drill Pipe Inspection Report':
+                self.nominal_wall = 1000 * float(datmg.dp_conn_size_nom_rel_dict[connection_size])
+            elif self.report_type == 'Tubing/Casing Report':
+                self.nominal_wall = 1000 * float(datmg.tube_conn_size_nom_rel_dict[connection_size][conn_type])
+        except (KeyError, TypeError):
+            self.nominal_wall = None
+        # UT readings are three digits, so every valid reading is classified up front
+        self.ut_classes = {}
+        if self.nominal_wall:
+            self.ut_classes = {f"{reading:03d}": self.classify_ut_reading(float(reading)) for reading in range(1000)}
+
+        # Refacing critical-length bounds per column: (min integer prefix, max integer prefix, min, max)
+        self.reface_enabled = self.report_type == 'Drill Pipe Inspection Report' and conn_type != "NC-50"
+        self.reface_bounds = {}
+        conn_type_vals = datmg.dp_conn_type_vals_dict.get(conn_type) if conn_type else None
+        if conn_type_vals:
+            for header, min_idx in (('BOX', 4), ('PIN', 6)):
+                reface_min, reface_max = conn_type_vals[min_idx:min_idx + 2]
+                if reface_min is not None and reface_max is not None:
+                    self.reface_bounds[header] = (str(reface_min).split(".")[0] + ".", str(reface_max).split(".")[0] + ".",
+                                                  float(reface_min), float(reface_max))
+
+    def classify(self, column, value):
+        if column == 'UT':
+            return self.classify_ut(value)
+        if column in ('PIN', 'BOX') and self.report_type == 'Drill Pipe Inspection Report':
+            return self.classify_reface(column, value)
+        return "Default"
+
+    def classify_ut(self, value):
+        ut_class = self.ut_classes.get(value)
+        if ut_class is not None:
+            return ut_class
+        if value == '':
+            return "Default"
+        if len(value) != 3 or not value.isdigit():
+            return "Invalid Syntax"
+        if not self.nominal_wall:
+            return "Default"
+        return self.classify_ut_reading(float(value))
+
+    def classify_ut_reading(self, reading):
+        perc_nom_wall = reading / self.nominal_wall
+        if perc_nom_wall >= 1.15:
+            return "Invalid Syntax"
+        elif perc_nom_wall < 1.10 and perc_nom_wall > 0.80:
+            return "Good Nominal Wall"
+        elif perc_nom_wall <= 0.80 and perc_nom_wall > 0.75:
+            return "Class 2"
+        elif perc_nom_wall <= 0.75 and perc_nom_wall > 0.70:
+            return "Class 3"
+        elif perc_nom_wall <= 0.70:
+            return "Invalid Validation"
+        return "Default"
+
+    def classify_reface(self, column, value):
+        if not self.reface_enabled:
+            return "Default"
+        if '/' in value:
+            value = self.fraction_pattern.sub(r'\1_\2', value)
+        data_chunks = value.split()
+        bounds = self.reface_bounds.get(column)
+        checked = set()
+        for index, chunk in enumerate(data_chunks[:-1]):
+            # Only the first occurrence of a keyword is checked
+            if chunk not in self.reface_keywords or chunk in checked:
+                continue
+            checked.add(chunk)
+            nxt_idx = data_chunks[index + 1]
+            if not nxt_idx.isdigit():
+                continue
+            if len(nxt_idx) != 6:
+                return "Invalid Syntax"
+            if bounds is not None:
+                min_prefix, max_prefix, reface_min, reface_max = bounds
+                rbcl = float(min_prefix + nxt_idx[:3])
+                racl = float(max_prefix + nxt_idx[3:])
+                if not (reface_min <= rbcl <= reface_max and reface_min <= racl <= reface_max):
+                    return "Invalid Validation"
+        return "Default"
+
+    def classify_tab(self, joint_data, columns, classify=None):
+        # Whole-tab pass: {joint number: [class per column]}, None where the cell is empty
+        ut_classes = self.ut_classes
+        classify = classify or self.classify
+        results = {}
+        for joint_key, joint_entry in joint_data.items():
+            classes = []
+            for column in columns:
+                value = joint_entry.get(column)
+                if not value:
+                    classes.append(None)
+                elif column == 'UT':
+                    classes.append(ut_classes.get(value) or self.classify_ut(value))
+                else:
+                    classes.append(classify(column, value))
+            results[int(joint_key.split('_')[1])] = classes
+        return results
+
+
+class JointEditHistory:
+    # Bounded undo/redo of joint edits. Each step is a list of (tab, joint_key, {column: (old, new)})
+    # diffs, None meaning the column was absent, kept in a fixed size ring so pushes are O(1).
+    # Memory is bounded by the number of changed cells held across undo and redo together, a row
+    # trim can hold thousands in one step; redo only ever holds steps popped from the ring and is
+    # cleared by a new edit, so it never holds more than capacity steps either
+    def __init__(self, capacity=500, cell_limit=50000):
+        self.capacity = max(1, int(capacity))
+        self.cell_limit = max(1, int(cell_limit))
+        self.ring = [None] * self.capacity
+        self.head = 0
+        self.count = 0
+        self.redo_stack = []
+        self.cell_count = 0
+
+    @staticmethod
+    def step_cells(step):
+        return sum(len(changes) for tab, joint_key, changes in step)
+
+    def push(self, step, clear_redo=True):
+        if not step:
+            return
+        if clear_redo:
+            self.cell_count -= sum(self.step_cells(redo_step) for redo_step in self.redo_stack)
+            self.redo_stack = []
+        # The oldest step is overwritten once the ring is full
+        if self.count == self.capacity:
+            self.cell_count -= self.step_cells(self.ring[self.head])
+        else:
+            self.count += 1
+        self.ring[self.head] = step
+        self.head = (self.head + 1) % self.capacity
+        self.cell_count += self.step_cells(step)
+        # Then the oldest steps go until the cells fit, the newest step is always kept
+        while self.cell_count > self.cell_limit and self.count > 1:
+            oldest = (self.head - self.count) % self.capacity
+            self.cell_count -= self.step_cells(self.ring[oldest])
+            self.ring[oldest] = None
+            self.count -= 1
+
+    def pop_undo(self):
+        if self.count == 0:
+            return None
+        self.head = (self.head - 1) % self.capacity
+        step = self.ring[self.head]
+        self.ring[self.head] = None
+        self.count -= 1
+        self.redo_stack.append(step)
+        return step
+
+    def pop_redo(self):
+        if not self.redo_stack:
+            return None
+        step = self.redo_stack.pop()
+        self.cell_count -= self.step_cells(step)
+        self.push(step, clear_redo=False)
+        return step
+
+    @staticmethod
+    def diff_joint_entry(old_entry, new_entry):
+        old_entry = old_entry or {}
+        new_entry = new_entry or {}
+        changes = {}
+        for column in set(old_entry) | set(new_entry):
+            # A blank cell and a missing one look the same to the inspector
+            if old_entry.get(column, '') != new_entry.get(column, ''):
+                changes[column] = (old_entry.get(column), new_entry.get(column))
+        return changes
 
 
 class DataManager:
@@ -502,14 +1130,48 @@ class DataManager:
             "report_user_metadata": {}, 
             "report_data": {}
         }
-        self.is_saving = False
         self.lock = threading.Lock()
+        self.save_condition = threading.Condition()
+        self.save_pending = False
+        self.save_in_flight = False
+        self.pending_snapshot = None
+        self.written_shards = {}
+        self.written_manifest = None
+        self.written_shards_filename = None
+        self.unsynced_files = set()
+        self.unsynced_journal = None
+        self.fsync_timer = None
+        self.app_settings = load_app_settings()
+        self.durability_mode = self.app_settings['durability_mode']
+        self.fsync_interval_seconds = float(self.app_settings['fsync_interval_seconds'])
+        self.last_snapshot_fsync = 0.0
+        self.last_journal_fsync = 0.0
+        self.catalog_lock = threading.Lock()
+        self.save_sequence = 0
+        self.shard_seqs = {}
+        self.edit_history = JointEditHistory(self.app_settings['undo_history_limit'], self.app_settings['undo_history_cell_limit'])
+        self.unloaded_tabs = set()
         self.save_thread = None
+        self.save_stats = {"requests": 0, "coalesced": 0, "writes": 0, "bytes_written": 0,
+                           "last_write_ms": 0.0, "max_write_ms": 0.0, "total_write_ms": 0.0}
+        self.latency = LatencyTracker()
         self.xel_file_path = None
         self.new_excel_fp = None
         self.excel_files_tct = None
         self.json_tct_filepath = None
+        self.export_plan = None
+        self.validator = None
+        self.metadata_version = 0
+        self.validation_cache = {}
+        self.validation_cache_limit = 20000
+        self.validation_stats = {"hits": 0, "misses": 0}
+        self.validation_lock = threading.Lock()
         self.filename = None
+        self.journal_enabled = True
+        self.journal_record_count = 0
+        self.journal_compact_every = 100
+        self.journal_lock = threading.Lock()
+        self.journal_generation = 0
         self.notes_prefill = {"Tubing/Casing Report": "Missing Caps: () BOX ; () PIN", "Drill Pipe Inspection Report": "Test Notes Prefill DP"}
         self.keyword_tally_dict = {"Keyword Tallies": {}, "Joint Tallies": {}}
         self.nd_column_types = load_json_dict(resource_path('external_files/nd_column_types.json'))
@@ -534,6 +1196,52 @@ class DataManager:
     def set_widget_manager(self, widget_manager):
         self.widget_manager = widget_manager
 
+    def get_validator(self):
+        # Recompiled only when the report type or connection size/type changes
+        metadata = self.json_data_dict['report_user_metadata']
+        signature = (self.json_data_dict['report_type'], metadata.get('connection_size_choice'), metadata.get('connection_type_choice'))
+        if self.validator is not None and self.validator.signature != signature:
+            self.bump_metadata_version()
+        if self.validator is None:
+            self.validator = ReportValidator(self, self.metadata_version)
+        return self.validator
+
+    def bump_metadata_version(self):
+        self.metadata_version += 1
+        self.validator = None
+        with self.validation_lock:
+            self.validation_cache = {}
+
+    def classify_cell(self, column, value, validator=None):
+        # Memoized on (column, value, metadata version); the render worker passes the validator it was handed.
+        # The cache is shared with the render worker, so it is only touched under validation_lock
+        validator = validator or self.get_validator()
+        key = (column, value, validator.version)
+        with self.validation_lock:
+            value_class = self.validation_cache.get(key)
+            if value_class is not None:
+                self.validation_stats["hits"] += 1
+                return value_class
+            self.validation_stats["misses"] += 1
+        value_class = validator.classify(column, value)
+        with self.validation_lock:
+            if len(self.validation_cache) >= self.validation_cache_limit:
+                self.validation_cache = {}
+            self.validation_cache[key] = value_class
+        return value_class
+
+    def reset_validation_stats(self):
+        with self.validation_lock:
+            self.validation_stats = {"hits": 0, "misses": 0}
+
+    def format_validation_stats(self):
+        with self.validation_lock:
+            hits, misses = self.validation_stats["hits"], self.validation_stats["misses"]
+            entries = len(self.validation_cache)
+        hit_rate = 100 * hits / (hits + misses) if hits + misses else 0.0
+        return (f"Validation cache: {hits} hits, {misses} misses ({hit_rate:.1f}% hit rate), "
+                f"{entries} entries, metadata version {self.metadata_version}")
+
 
 # Data Storage File METHODS
     def save_dict_to_file_start(self):
@@ -544,58 +1252,600 @@ class DataManager:
         
         self.filename = os.path.join(directory, os.path.basename(self.filename))
 
-        with open(self.filename, 'w') as f:
-            json.dump(self.json_data_dict, f)
-
-    def save_dict_to_file(self):
-        # Skip saving if another save is in progress
-        if self.is_saving:
-            print("A save operation is already in progress. Skipping this save request.")
-            return
+        # The writer thread bumps the same numbering, so it waits for any write in flight
+        self.wait_for_saves()
+        with self.lock:
+            self.save_sequence += 1
+            self.shard_seqs = {}
+            with open(self.filename, 'wb') as f:
+                f.write(frame_report_payload(json.dumps(self.json_data_dict).encode('utf-8'), self.save_sequence))
 
-        # Set the flag and begin the background save
-        self.is_saving = True
-        self.save_thread = threading.Thread(target=self._save_operation)
-        self.save_thread.start()
+    def save_dict_to_file(self, force_fsync=False):
+        with self.latency.span('save_dict_to_file'):
+            self._queue_snapshot_save(force_fsync)
 
-    def _save_operation(self):
+    def _queue_snapshot_save(self, force_fsync):
+        # Snapshot on the calling (Tk) thread so the writer never serializes a dict that is being edited
         directory = os.path.join(os.getcwd(), 'data_entry_files')
         if not os.path.exists(directory):
             os.makedirs(directory)
         self.filename = os.path.join(directory, os.path.basename(self.filename))
+        journal_generation = self.rotate_journal()
+        snapshot = self.snapshot_report()
+
+        # Latest-wins: a request made while a write is queued or running folds into one follow-up write
+        with self.save_condition:
+            self.save_stats["requests"] += 1
+            if self.save_pending:
+                self.save_stats["coalesced"] += 1
+                force_fsync = force_fsync or self.pending_snapshot[3]
+            self.pending_snapshot = (snapshot, self.filename, journal_generation, force_fsync)
+            self.save_pending = True
+            self.save_condition.notify()
+        if self.save_thread is None or not self.save_thread.is_alive():
+            self.save_thread = threading.Thread(target=self._save_writer_loop, daemon=True)
+            self.save_thread.start()
+
+    def snapshot_report(self):
+        # Copy-on-write: containers are copied, but joint entries are shared because
+        # save_current_row_data and replay_journal always replace them instead of editing in place
+        def copy_container(value):
+            if isinstance(value, dict):
+                return {key: copy_container(item) for key, item in value.items()}
+            if isinstance(value, list):
+                return [copy_container(item) for item in value]
+            return value
+
+        snapshot = {}
+        for key, value in self.json_data_dict.items():
+            if key != 'report_data':
+                snapshot[key] = copy_container(value)
+        snapshot['report_data'] = {}
+        for tab, tab_data in self.json_data_dict['report_data'].items():
+            tab_snapshot = {key: copy_container(value) for key, value in tab_data.items() if key != 'joint_data'}
+            if 'joint_data' in tab_data and tab not in self.unloaded_tabs:
+                tab_snapshot['joint_data'] = dict(tab_data['joint_data'])
+            snapshot['report_data'][tab] = tab_snapshot
+        return snapshot
+
+    def flush_saves(self, force_fsync=True):
+        # Block until the latest state is on disk (window close, export)
+        self.save_dict_to_file(force_fsync=force_fsync)
+        self.wait_for_saves()
+
+    def wait_for_saves(self):
+        with self.save_condition:
+            self.save_condition.wait_for(lambda: not self.save_pending and not self.save_in_flight)
+
+    def get_save_stats(self):
+        with self.save_condition:
+            stats = dict(self.save_stats)
+        stats["avg_write_ms"] = stats["total_write_ms"] / stats["writes"] if stats["writes"] else 0.0
+        return stats
+
+    def format_save_stats(self):
+        stats = self.get_save_stats()
+        return (f"Saves: {stats['requests']} requested, {stats['coalesced']} coalesced, {stats['writes']} written "
+                f"({stats['bytes_written'] / 1024:.0f} KiB), write ms avg {stats['avg_write_ms']:.1f} "
+                f"last {stats['last_write_ms']:.1f} max {stats['max_write_ms']:.1f}")
+
+    def _save_writer_loop(self):
+        # Single long-lived writer thread fed by save_dict_to_file
+        while True:
+            with self.save_condition:
+                self.save_condition.wait_for(lambda: self.save_pending)
+                snapshot, filename, journal_generation, force_fsync = self.pending_snapshot
+                self.pending_snapshot = None
+                self.save_pending = False
+                self.save_in_flight = True
+            try:
+                self._save_operation(snapshot, filename, journal_generation, force_fsync)
+            finally:
+                with self.save_condition:
+                    self.save_in_flight = False
+                    self.save_condition.notify_all()
 
+    def _save_operation(self, snapshot, filename, journal_generation, force_fsync=False):
         with self.lock:  # Ensure thread-safe execution
             try:
-                tmp_filename = f"{self.filename}.tmp"
-                bak_filename = f"{self.filename}.bak"
+                start_time = time.perf_counter()
+                bytes_written = 0
+                fsync = self.should_fsync(self.last_snapshot_fsync, force_fsync)
+                save_sequence = self.save_sequence + 1
+                if filename != self.written_shards_filename:
+                    self.written_shards = {}
+                    self.written_manifest = None
+                    self.written_shards_filename = filename
+
+                # Step 1: Rewrite only the tab shards whose joints changed since the last write
+                manifest = {key: value for key, value in snapshot.items() if key != 'report_data'}
+                manifest['storage'] = 'sharded'
+                manifest['report_data'] = {}
+                for tab, tab_data in snapshot['report_data'].items():
+                    manifest['report_data'][tab] = {key: value for key, value in tab_data.items() if key != 'joint_data'}
+                    if 'joint_data' not in tab_data:
+                        # Never materialized, so its shard on disk is already current
+                        continue
+                    joint_data = tab_data['joint_data']
+                    shard_filename = self.get_shard_filename(filename, tab)
+                    if self.same_joint_entries(self.written_shards.get(tab), joint_data) and os.path.exists(shard_filename):
+                        continue
+                    payload = frame_report_payload(json.dumps({"tab": tab, "joint_data": joint_data}).encode('utf-8'), save_sequence)
+                    self._write_file_atomic(shard_filename, payload, fsync)
+                    self.written_shards[tab] = joint_data
+                    self.shard_seqs[tab] = save_sequence
+                    bytes_written += len(payload)
+
+                # Step 2: The manifest goes last so it never names tabs whose shards are missing,
+                # it lists each shard's save number so recovery only restores matching versions
+                manifest['shard_seqs'] = {tab: self.shard_seqs[tab] for tab in manifest['report_data'] if tab in self.shard_seqs}
+                manifest_body = json.dumps(manifest).encode('utf-8')
+                if manifest_body != self.written_manifest or not os.path.exists(filename):
+                    payload = frame_report_payload(manifest_body, save_sequence)
+                    self._write_file_atomic(filename, payload, fsync)
+                    self.written_manifest = manifest_body
+                    bytes_written += len(payload)
+                    self.update_catalog_entry(filename, manifest)
+                self.save_sequence = save_sequence
+
+                # Step 3: Earlier unsynced writes become durable along with this one
+                if fsync:
+                    for unsynced_filename in list(self.unsynced_files):
+                        if os.path.exists(unsynced_filename):
+                            with open(unsynced_filename, 'rb') as unsynced_file:
+                                os.fsync(unsynced_file.fileno())
+                    self.unsynced_files.clear()
+                    self.last_snapshot_fsync = time.monotonic()
+                elif self.unsynced_files:
+                    self.schedule_interval_fsync()
+
+                # Step 4: Once durable, the shards hold everything from the rotated journal,
+                # unless a newer rotation has since merged more records into it
+                with self.journal_lock:
+                    old_journal = f"{filename}.journal.old"
+                    if fsync and journal_generation == self.journal_generation and os.path.exists(old_journal):
+                        os.remove(old_journal)
+
+                write_ms = (time.perf_counter() - start_time) * 1000
+                with self.save_condition:
+                    self.save_stats["writes"] += 1
+                    self.save_stats["bytes_written"] += bytes_written
+                    self.save_stats["last_write_ms"] = write_ms
+                    self.save_stats["max_write_ms"] = max(self.save_stats["max_write_ms"], write_ms)
+                    self.save_stats["total_write_ms"] += write_ms
+                self.latency.record('save_dict_to_file.write', write_ms)
 
-                # Step 1: Write to a temporary file
-                with open(tmp_filename, 'w') as tmp_file:
-                    json.dump(self.json_data_dict, tmp_file)
-                    tmp_file.flush()  # Flush the data
-                    os.fsync(tmp_file.fileno())  # Ensure it's written to disk
+            except Exception as e:
+                print(f"Error during the save operation: {e}")
 
-                # Step 2: Make a backup of the existing file
-                if os.path.exists(self.filename):
-                    os.replace(self.filename, bak_filename)
+    def _write_file_atomic(self, filename, payload, fsync=True):
+        tmp_filename = f"{filename}.tmp"
+        bak_filename = f"{filename}.bak"
 
-                # Step 3: Safely replace the original file with the temporary file
-                os.replace(tmp_filename, self.filename)
+        # Write to a temporary file
+        with open(tmp_filename, 'wb') as tmp_file:
+            tmp_file.write(payload)
+            tmp_file.flush()  # Flush the data
+            if fsync:
+                os.fsync(tmp_file.fileno())  # Ensure it's written to disk
+            else:
+                self.unsynced_files.add(filename)
+
+        # Make a backup of the existing file
+        if os.path.exists(filename):
+            os.replace(filename, bak_filename)
+
+        # Safely replace the original file with the temporary file
+        os.replace(tmp_filename, filename)
+
+    def should_fsync(self, last_fsync_time, force_fsync=False):
+        # The durability mode bounds how many edits a power loss can take with it
+        if force_fsync or self.durability_mode == "every_save":
+            return True
+        if self.durability_mode == "interval":
+            return time.monotonic() - last_fsync_time >= self.fsync_interval_seconds
+        return False
+
+    def schedule_interval_fsync(self):
+        # Interval mode syncs whatever was skipped within the interval, even when no later edit or save comes along
+        if self.durability_mode != "interval" or self.fsync_timer is not None:
+            return
+        self.fsync_timer = threading.Timer(self.fsync_interval_seconds, self.run_interval_fsync)
+        self.fsync_timer.daemon = True
+        self.fsync_timer.start()
 
-            except Exception as e:
-                print(f"Error during the save operation: {e}")
+    def run_interval_fsync(self):
+        self.fsync_timer = None
+        try:
+            with self.journal_lock:
+                if self.unsynced_journal is not None:
+                    # A rotation may have moved the records into the .old journal meanwhile
+                    for journal_filename in (self.unsynced_journal, f"{self.unsynced_journal}.old"):
+                        if os.path.exists(journal_filename):
+                            with open(journal_filename, 'rb') as journal_file:
+                                os.fsync(journal_file.fileno())
+                    self.unsynced_journal = None
+                    self.last_journal_fsync = time.monotonic()
+            with self.lock:
+                if self.unsynced_files:
+                    for unsynced_filename in list(self.unsynced_files):
+                        if os.path.exists(unsynced_filename):
+                            with open(unsynced_filename, 'rb') as unsynced_file:
+                                os.fsync(unsynced_file.fileno())
+                    self.unsynced_files.clear()
+                    self.last_snapshot_fsync = time.monotonic()
+        except Exception as e:
+            logging.error(f"Error during the interval fsync: {e}", exc_info=True)
+
+    def set_durability_mode(self, durability_mode, fsync_interval_seconds):
+        if durability_mode not in durability_mode_labels:
+            raise ValueError(f"Unknown durability mode: {durability_mode}")
+        self.durability_mode = durability_mode
+        self.fsync_interval_seconds = float(fsync_interval_seconds)
+        self.app_settings['durability_mode'] = durability_mode
+        self.app_settings['fsync_interval_seconds'] = self.fsync_interval_seconds
+        save_app_settings(self.app_settings)
+
+# Report Catalog METHODS
+    def get_catalog_filename(self, directory):
+        return os.path.join(directory, 'report_catalog.index')
+
+    def summarize_report(self, report):
+        # Only what the continue existing report screen displays
+        return {
+            "report_type": report.get('report_type', ''),
+            "report_user_metadata": report.get('report_user_metadata', {}),
+            "report_data": {
+                tab: {"is_complete": tab_data.get('is_complete', False), "inspection_type_data": tab_data.get('inspection_type_data', {})}
+                for tab, tab_data in report.get('report_data', {}).items()
+            }
+        }
+
+    def load_report_catalog(self, directory):
+        catalog_filename = self.get_catalog_filename(directory)
+        if not os.path.exists(catalog_filename):
+            return {}
+        try:
+            with open(catalog_filename, 'r') as catalog_file:
+                return json.load(catalog_file)
+        except Exception as e:
+            logging.error(f"Error reading report catalog {catalog_filename}: {e}", exc_info=True)
+            return {}
+
+    def save_report_catalog(self, directory, catalog):
+        # The catalog is rebuilt from the reports if lost, so no backup or fsync is needed
+        catalog_filename = self.get_catalog_filename(directory)
+        try:
+            with open(f"{catalog_filename}.tmp", 'w') as catalog_file:
+                json.dump(catalog, catalog_file)
+            os.replace(f"{catalog_filename}.tmp", catalog_filename)
+        except Exception as e:
+            logging.error(f"Error saving report catalog {catalog_filename}: {e}", exc_info=True)
+
+    def update_catalog_entry(self, filename, report):
+        directory = os.path.dirname(filename)
+        with self.catalog_lock:
+            catalog = self.load_report_catalog(directory)
+            file_stat = os.stat(filename)
+            catalog[os.path.basename(filename)] = {"mtime": file_stat.st_mtime, "size": file_stat.st_size, "summary": self.summarize_report(report)}
+            self.save_report_catalog(directory, catalog)
+
+    def get_report_summaries(self, directory):
+        # Entries are trusted while the file's mtime and size match, otherwise the report is re-read once
+        summaries = {}
+        with self.catalog_lock:
+            catalog = self.load_report_catalog(directory)
+            changed = False
+            for filename in os.listdir(directory):
+                if not filename.endswith('.json'):
+                    continue
+                file_stat = os.stat(os.path.join(directory, filename))
+                entry = catalog.get(filename)
+                if entry is None or entry['mtime'] != file_stat.st_mtime or entry['size'] != file_stat.st_size:
+                    try:
+                        report = read_report_json(os.path.join(directory, filename))
+                    except Exception as e:
+                        logging.error(f"Error reading file {filename}: {e}", exc_info=True)
+                        continue
+                    entry = {"mtime": file_stat.st_mtime, "size": file_stat.st_size, "summary": self.summarize_report(report)}
+                    catalog[filename] = entry
+                    changed = True
+                summaries[filename] = entry['summary']
+
+            for filename in [name for name in catalog if name not in summaries]:
+                del catalog[filename]
+                changed = True
+            if changed:
+                self.save_report_catalog(directory, catalog)
+        return summaries
+
+# Tab Shard METHODS
+    def get_shard_filename(self, filename, tab):
+        return f"{filename}.{tab.replace(' ', '_')}.shard"
+
+    def same_joint_entries(self, written_joints, joint_data):
+        # Joint entries are replaced rather than edited, so an identity check finds every change
+        if written_joints is None or len(written_joints) != len(joint_data):
+            return False
+        return all(written_joints.get(joint_key) is entry for joint_key, entry in joint_data.items())
+
+    def materialize_tab(self, tab):
+        # Called whenever a tab becomes active_tab
+        if tab not in self.unloaded_tabs:
+            return
+        filename = self.filename
+        if not os.path.isabs(filename):
+            filename = os.path.join(os.getcwd(), 'data_entry_files', filename)
+        # The tab stays unloaded, with no joint_data to save, unless the shard was read in full
+        joint_data = self.load_tab_shard(filename, tab)
+        self.json_data_dict['report_data'][tab]['joint_data'] = joint_data
+        self.unloaded_tabs.discard(tab)
+
+    def load_tab_shard(self, filename, tab):
+        shard_filename = self.get_shard_filename(filename, tab)
+        try:
+            return read_report_json(shard_filename)['joint_data']
+        except Exception as e:
+            # Never fall back to an empty tab, the next save would overwrite the shard with it
+            logging.error(f"Error reading shard {shard_filename}: {e}", exc_info=True)
+            raise
 
-            finally:
-                # Reset the flag to allow future saves
-                self.is_saving = False
-                
     def load_file_to_dict(self, filename):
+        # Returns False and keeps the previously loaded report when any part of the file is unreadable
         try:
-            with open(filename, 'r') as file:
-                self.json_data_dict = json.load(file)
-                self.filename = filename
+            with open(filename, 'rb') as file:
+                header, body = split_report_payload(file.read())
+            report = json.loads(body)
         except Exception as e:
             print(f"Error reading file {filename}: {e}")
+            return False
+
+        # Writes still queued for the previous report finish first, the writer owns the numbering
+        # while it runs and the lock keeps it from seeing the switch half done
+        self.wait_for_saves()
+        with self.lock:
+            previous_state = (self.json_data_dict, self.filename, self.unloaded_tabs, self.save_sequence, self.shard_seqs,
+                              self.written_shards, self.written_manifest, self.written_shards_filename)
+            # Keep numbering on past every file of the report so the recovery scan can tell versions apart,
+            # a crash between shard and manifest writes leaves shards numbered above the manifest
+            self.save_sequence = int(header['seq']) if header is not None else 0
+            self.shard_seqs = {}
+
+            # Sharded reports keep each tab's joint_data in its own file next to the manifest,
+            # only the active tab is read now and the rest wait for materialize_tab
+            self.unloaded_tabs = set()
+            report.pop('shard_seqs', None)
+            if report.pop('storage', None) == 'sharded':
+                self.unloaded_tabs = set(report['report_data'])
+                for tab in report['report_data']:
+                    shard_seq = read_report_sequence(self.get_shard_filename(filename, tab))
+                    if shard_seq is not None:
+                        self.shard_seqs[tab] = shard_seq
+                        self.save_sequence = max(self.save_sequence, shard_seq)
+            self.json_data_dict = report
+            self.filename = filename
+            self.written_shards = {}
+            self.written_manifest = None
+            self.written_shards_filename = None
+        try:
+            self.materialize_tab(report.get('active_tab'))
+
+            # Apply any joint edits made since the last full snapshot
+            replayed = self.replay_journal()
+        except Exception as e:
+            logging.error(f"Error loading report {filename}: {e}", exc_info=True)
+            with self.lock:
+                (self.json_data_dict, self.filename, self.unloaded_tabs, self.save_sequence, self.shard_seqs,
+                 self.written_shards, self.written_manifest, self.written_shards_filename) = previous_state
+            return False
+        if replayed:
+            self.save_dict_to_file()
+        return True
+
+# Joint Journal METHODS
+    def get_journal_filename(self):
+        directory = os.path.join(os.getcwd(), 'data_entry_files')
+        return os.path.join(directory, f"{os.path.basename(self.filename)}.journal")
+
+    def append_joint_to_journal(self, tab, joint_key, entry_data):
+        # One JSON line per joint edit, much cheaper than rewriting the whole report
+        if not self.journal_enabled or not self.filename:
+            return
+        journal_filename = self.get_journal_filename()
+        record = json.dumps({"tab": tab, "joint": joint_key, "data": entry_data})
+        try:
+            os.makedirs(os.path.dirname(journal_filename), exist_ok=True)
+            self.write_journal_record(journal_filename, record)
+        except Exception as e:
+            logging.error(f"Error appending to journal {journal_filename}: {e}", exc_info=True)
+
+    def write_journal_record(self, journal_filename, record):
+        with self.journal_lock:
+            with open(journal_filename, 'a') as journal_file:
+                journal_file.write(record + "\n")
+                journal_file.flush()
+                if self.should_fsync(self.last_journal_fsync):
+                    os.fsync(journal_file.fileno())
+                    self.last_journal_fsync = time.monotonic()
+                    self.unsynced_journal = None
+                else:
+                    self.unsynced_journal = journal_filename
+                    self.schedule_interval_fsync()
+            self.journal_record_count += 1
+
+    def autosave_joint(self):
+        # Journaled mode only rewrites the full snapshot once enough edits pile up
+        if not self.journal_enabled:
+            self.save_dict_to_file()
+        elif self.journal_record_count >= self.journal_compact_every:
+            self.save_dict_to_file()
+
+    def rotate_journal(self):
+        # Move the live journal aside so edits made during the snapshot write land in a fresh one
+        if not self.journal_enabled or not self.filename:
+            return self.journal_generation
+        journal_filename = self.get_journal_filename()
+        old_journal = f"{journal_filename}.old"
+        try:
+            with self.journal_lock:
+                if os.path.exists(journal_filename):
+                    if os.path.exists(old_journal):
+                        # A previous compaction failed, keep its records ahead of the newer ones
+                        with open(journal_filename, 'r') as src, open(old_journal, 'a') as dst:
+                            dst.write(src.read())
+                        os.remove(journal_filename)
+                    else:
+                        os.replace(journal_filename, old_journal)
+                    self.journal_generation += 1
+                self.journal_record_count = 0
+        except Exception as e:
+            logging.error(f"Error rotating journal {journal_filename}: {e}", exc_info=True)
+        return self.journal_generation
+
+    def replay_journal(self):
+        journal_filename = self.get_journal_filename()
+        replayed = 0
+        for path in (f"{journal_filename}.old", journal_filename):
+            if not os.path.exists(path):
+                continue
+            with open(path, 'r') as journal_file:
+                for line in journal_file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A torn final line from a crash mid-append, nothing after it is usable
+                        break
+                    tab_data = self.json_data_dict['report_data'].get(record['tab'])
+                    if tab_data is None:
+                        continue
+                    self.materialize_tab(record['tab'])
+                    if record['data'] is None:
+                        tab_data['joint_data'].pop(record['joint'], None)
+                    else:
+                        tab_data['joint_data'][record['joint']] = record['data']
+                    replayed += 1
+        return replayed
+
+# Undo History METHODS
+    def record_joint_edit(self, tab, joint_key, old_entry, new_entry):
+        changes = JointEditHistory.diff_joint_entry(old_entry, new_entry)
+        if changes:
+            self.edit_history.push([(tab, joint_key, changes)])
+
+    def apply_edit_step(self, step, undo=True):
+        # Joint entries are replaced, never edited in place, so snapshots and shards stay consistent
+        for tab, joint_key, changes in reversed(step) if undo else step:
+            if joint_key is None:
+                # Tab level change such as the trimmed row count, saved with the next snapshot
+                for key, (old_value, new_value) in changes.items():
+                    self.json_data_dict['report_data'][tab][key] = old_value if undo else new_value
+                continue
+            self.materialize_tab(tab)
+            joint_data = self.json_data_dict['report_data'][tab]['joint_data']
+            entry = dict(joint_data.get(joint_key, {}))
+            for column, (old_value, new_value) in changes.items():
+                value = old_value if undo else new_value
+                if value is None:
+                    entry.pop(column, None)
+                else:
+                    entry[column] = value
+            if entry:
+                joint_data[joint_key] = entry
+            else:
+                joint_data.pop(joint_key, None)
+                entry = None
+            self.append_joint_to_journal(tab, joint_key, entry)
+        if any(joint_key is None for tab, joint_key, changes in step):
+            self.save_dict_to_file()
+        return step[0][0], step[0][1]
+
+# Export Staging METHODS
+    def save_tab_status_table_to_json(self, filepath):
+        try:
+            with open(filepath, 'w') as file:
+                json.dump(self.excel_files_tct, file, indent=4)
+        except Exception as e:
+            logging.error(f"Error saving tab status table to {filepath}: {e}", exc_info=True)
+            raise
+
+    def copy_tab_status_table(self, tab_status=None):
+        tab_status = self.excel_files_tct if tab_status is None else tab_status
+        if tab_status is None:
+            return None
+        return {key: dict(value) if isinstance(value, dict) else value for key, value in tab_status.items()}
+
+    def begin_export_staging(self, folder, fingerprint):
+        # A retry of the same export keeps the plan, so already built artifacts are reused
+        staging_dir = os.path.join(folder, '.staging')
+        plan = self.export_plan
+        if plan is not None and plan['fingerprint'] == fingerprint and plan['staging_dir'] == staging_dir:
+            self.excel_files_tct = self.copy_tab_status_table(plan['tab_status_built'])
+            return plan
+        self.discard_export_staging()
+        os.makedirs(staging_dir, exist_ok=True)
+        self.export_plan = {
+            "fingerprint": fingerprint,
+            "staging_dir": staging_dir,
+            "staged": {},
+            "tab_status_before": self.copy_tab_status_table(),
+            "tab_status_built": None,
+            "result": None
+        }
+        return self.export_plan
+
+    def get_staged_artifact(self, role, filename):
+        plan = self.export_plan
+        staged_path = os.path.join(plan['staging_dir'], os.path.basename(filename))
+        if plan['staged'].get(role) != staged_path:
+            plan['staged'][role] = staged_path
+            if os.path.exists(staged_path):
+                os.remove(staged_path)
+        return staged_path, os.path.exists(staged_path)
+
+    def commit_export_staging(self, destinations, retired_files=()):
+        # Every artifact is built before this point; the commit is only renames and cleanup
+        plan = self.export_plan
+        moves = [(plan['staged'][role], final_path) for role, final_path in destinations.items()]
+        for staged_path, final_path in moves:
+            if not os.path.exists(staged_path):
+                raise FileNotFoundError(f"Staged export file is missing: {staged_path}")
+        for staged_path, final_path in moves:
+            try:
+                os.replace(staged_path, final_path)
+            except OSError:
+                # Destination folder on another drive
+                with open(staged_path, 'rb') as src, open(final_path, 'wb') as dest:
+                    dest.write(src.read())
+                os.remove(staged_path)
+        final_paths = {os.path.abspath(final_path) for staged_path, final_path in moves}
+        for old_path in retired_files:
+            if old_path and os.path.abspath(old_path) not in final_paths and os.path.exists(old_path):
+                try:
+                    os.remove(old_path)
+                except Exception as e:
+                    logging.error(f"Error removing replaced export file {old_path}: {e}", exc_info=True)
+        self.discard_export_staging()
+
+    def cancel_export_staging(self):
+        # Leave the staged artifacts for a retry, but undo the tab status changes of this attempt
+        if self.export_plan is not None:
+            self.excel_files_tct = self.copy_tab_status_table(self.export_plan['tab_status_before'])
+
+    def discard_export_staging(self):
+        plan = self.export_plan
+        self.export_plan = None
+        if plan is None:
+            return
+        for staged_path in plan['staged'].values():
+            try:
+                if os.path.exists(staged_path):
+                    os.remove(staged_path)
+            except Exception as e:
+                logging.error(f"Error removing staged export file {staged_path}: {e}", exc_info=True)
+        try:
+            os.rmdir(plan['staging_dir'])
+        except OSError:
+            pass
 
     def initialize_json(self):
         """
@@ -654,6 +1904,7 @@ def initialize_main_window():
     style = ttkthemes.ThemedStyle(root)
     style.set_theme("arc") #arc
     style.configure('Large.TButton', font=('Arial', 18))
+    style.configure('Small.TButton', font=('Arial', 10))
     style.configure('Combobox', font=('Arial', 16))
     root.title("TS-Hill Data Entry Device")
     root.geometry(f"{root_width}x{root_height}")
@@ -677,6 +1928,200 @@ def start_inspection_screen(widmg, datmg, root, prev_page=None):
     use_existing_ss_button = ttk.Button(root, text="Continue Existing Report", command=lambda: display_incomplete_reports(widmg, datmg, root, page), style='Large.TButton')
     widmg.store_and_place(page['button'], "use_existing_ss_button", use_existing_ss_button, relx=0.5, rely=0.52, relwidth=0.75, relheight=0.20, anchor='n')
 
+    settings_button = ttk.Button(root, text="Settings", command=lambda: create_settings_window(widmg, datmg, root))
+    widmg.store_and_place(page['button'], "settings_button", settings_button, relx=0.5, rely=0.85, relwidth=0.2, relheight=0.07, anchor='n')
+
+
+def create_settings_window(widmg, datmg, root):
+    if hasattr(widmg, 'settings_window') and widmg.settings_window.winfo_exists():
+        # If the window already exists, bring it to the front
+        widmg.settings_window.lift()
+        return
+
+    widmg.settings_window = tk.Toplevel(root)
+    widmg.settings_window.title("Settings")
+    widmg.settings_window.geometry("560x360")
+
+    title_label = ttk.Label(widmg.settings_window, text="Autosave Durability", font=('Arial', 14, 'bold'))
+    title_label.place(relx=0.5, rely=0.08, anchor='center')
+
+    mode_combobox = ttk.Combobox(widmg.settings_window, values=list(durability_mode_labels.values()), state='readonly', font=('Arial', 12))
+    mode_combobox.set(durability_mode_labels[datmg.durability_mode])
+    mode_combobox.place(relx=0.5, rely=0.22, relwidth=0.8, relheight=0.09, anchor='center')
+
+    interval_label = ttk.Label(widmg.settings_window, text="N Seconds:", font=('Arial', 12))
+    interval_label.place(relx=0.35, rely=0.36, anchor='center')
+    interval_entry = ttk.Entry(widmg.settings_window, font=('Arial', 12))
+    interval_entry.insert(0, str(datmg.fsync_interval_seconds))
+    interval_entry.place(relx=0.55, rely=0.36, relwidth=0.2, relheight=0.09, anchor='center')
+
+    benchmark_text = tk.StringVar()
+    benchmark_label = ttk.Label(widmg.settings_window, textvariable=benchmark_text, font=('Courier', 10), justify='left')
+    benchmark_label.place(relx=0.5, rely=0.62, anchor='center')
+
+    def save_settings():
+        mode = next(key for key, label in durability_mode_labels.items() if label == mode_combobox.get())
+        try:
+            interval = float(interval_entry.get())
+        except ValueError:
+            messagebox.showerror("Invalid Entry", "N Seconds must be a number.")
+            return
+        datmg.set_durability_mode(mode, interval)
+        widmg.settings_window.destroy()
+
+    def run_benchmark():
+        # The fsyncs take seconds, so the benchmark runs off the Tk thread and the window keeps responding
+        benchmark_text.set("Running...")
+        benchmark_button.config(state='disabled')
+        snapshot = datmg.snapshot_report() if datmg.json_data_dict['report_data'] else None
+        benchmark_result = {}
+
+        def benchmark():
+            try:
+                benchmark_result['results'] = benchmark_durability_modes(datmg, snapshot=snapshot)
+            except Exception as e:
+                logging.error(f"Error running the durability benchmark: {e}", exc_info=True)
+                benchmark_result['error'] = e
+
+        def show_results():
+            if not benchmark_result:
+                root.after(100, show_results)
+                return
+            if not widmg.settings_window.winfo_exists():
+                return
+            benchmark_button.config(state='normal')
+            if 'error' in benchmark_result:
+                benchmark_text.set(f"Benchmark failed: {benchmark_result['error']}")
+                return
+            lines = [f"{'Mode':<12}{'edit avg':>10}{'edit p95':>10}{'edit max':>10}{'compact':>10}"]
+            for mode, result in benchmark_result['results'].items():
+                lines.append(f"{mode:<12}{result['avg_ms']:>10.2f}{result['p95_ms']:>10.2f}{result['max_ms']:>10.2f}{result['compaction_ms']:>10.2f}")
+            benchmark_text.set("\n".join(lines))
+            try:
+                datmg.latency.dump(exe_dir, "Durability benchmark (ms)\n" + "\n".join(lines))
+            except Exception as e:
+                logging.error(f"Error writing durability benchmark to the latency log: {e}", exc_info=True)
+
+        threading.Thread(target=benchmark, daemon=True).start()
+        root.after(100, show_results)
+
+    save_button = ttk.Button(widmg.settings_window, text="Save", command=save_settings)
+    save_button.place(relx=0.2, rely=0.9, relwidth=0.25, relheight=0.1, anchor='center')
+    benchmark_button = ttk.Button(widmg.settings_window, text="Benchmark", command=run_benchmark)
+    benchmark_button.place(relx=0.5, rely=0.9, relwidth=0.25, relheight=0.1, anchor='center')
+    cancel_button = ttk.Button(widmg.settings_window, text="Cancel", command=widmg.settings_window.destroy)
+    cancel_button.place(relx=0.8, rely=0.9, relwidth=0.25, relheight=0.1, anchor='center')
+
+
+def format_diagnostics(datmg):
+    return f"{datmg.latency.format_summary()}\n\n{datmg.format_validation_stats()}\n{datmg.format_save_stats()}"
+
+def create_latency_diagnostics_window(widmg, datmg, root):
+    # Hidden panel (Ctrl+Shift+D) showing the joint navigation timings
+    if hasattr(widmg, 'latency_window') and widmg.latency_window.winfo_exists():
+        widmg.latency_window.lift()
+        return
+
+    widmg.latency_window = tk.Toplevel(root)
+    widmg.latency_window.title("Navigation Latency")
+    widmg.latency_window.geometry("640x400")
+
+    summary_text = tk.StringVar()
+    summary_label = ttk.Label(widmg.latency_window, textvariable=summary_text, font=('Courier', 10), justify='left', anchor='nw')
+    summary_label.place(relx=0.03, rely=0.03, relwidth=0.94, relheight=0.78)
+    status_text = tk.StringVar()
+    status_label = ttk.Label(widmg.latency_window, textvariable=status_text, font=('Arial', 9))
+    status_label.place(relx=0.5, rely=0.84, anchor='center')
+
+    def refresh():
+        if not widmg.latency_window.winfo_exists():
+            return
+        summary_text.set(format_diagnostics(datmg))
+        widmg.latency_window.after(1000, refresh)
+
+    def dump_log():
+        try:
+            status_text.set(f"Written to {datmg.latency.dump(exe_dir, format_diagnostics(datmg))}")
+        except Exception as e:
+            logging.error(f"Error writing latency log: {e}", exc_info=True)
+            status_text.set(f"Could not write latency log: {e}")
+
+    def reset():
+        datmg.latency.reset()
+        datmg.reset_validation_stats()
+        summary_text.set(format_diagnostics(datmg))
+
+    dump_button = ttk.Button(widmg.latency_window, text="Dump To Log", command=dump_log)
+    dump_button.place(relx=0.2, rely=0.93, relwidth=0.25, relheight=0.1, anchor='center')
+    reset_button = ttk.Button(widmg.latency_window, text="Reset", command=reset)
+    reset_button.place(relx=0.5, rely=0.93, relwidth=0.25, relheight=0.1, anchor='center')
+    close_button = ttk.Button(widmg.latency_window, text="Close", command=widmg.latency_window.destroy)
+    close_button.place(relx=0.8, rely=0.93, relwidth=0.25, relheight=0.1, anchor='center')
+    refresh()
+
+
+def benchmark_durability_modes(datmg, iterations=250, snapshot=None):
+    # Time joint-move autosaves the way the app pays for them, against a throwaway copy: every edit
+    # appends to the journal on the Tk thread, every journal_compact_every edits the snapshot is taken
+    # there too and written by the save thread, reported separately as the compaction write.
+    # Off the Tk thread pass a snapshot taken on it, the live report is not read here then
+    if snapshot is None and datmg.json_data_dict['report_data']:
+        snapshot = datmg.snapshot_report()
+    elif snapshot is None:
+        snapshot = {
+            "branch": "ND", "report_type": "Drill Pipe Inspection Report", "active_tab": "Prop Drill Pipe Inp Report",
+            "report_user_metadata": {},
+            "report_data": {"Prop Drill Pipe Inp Report": {
+                "joint_data": {f"Joint_{n}": {"UT": "362", "BOX": "R1 499400", "PIN": "", "TUBE": "", "SERIAL": str(n)} for n in range(1, 1001)}
+            }}
+        }
+    tab = snapshot['active_tab'] if snapshot['active_tab'] in snapshot['report_data'] else next(iter(snapshot['report_data']))
+
+    results = {}
+    with tempfile.TemporaryDirectory() as bench_dir:
+        for mode in durability_mode_labels:
+            bench = DataManager()
+            bench.durability_mode = mode
+            bench.fsync_interval_seconds = datmg.fsync_interval_seconds
+            report_data = {name: dict(tab_data) for name, tab_data in snapshot['report_data'].items()}
+            report_data[tab]['joint_data'] = dict(report_data[tab].get('joint_data', {}))
+            bench.json_data_dict = dict(snapshot, report_data=report_data)
+            filename = os.path.join(bench_dir, f"benchmark_{mode}.json")
+            journal_filename = f"{filename}.journal"
+            bench._save_operation(bench.snapshot_report(), filename, bench.journal_generation, force_fsync=True)
+
+            latencies = []
+            compaction_latencies = []
+            for n in range(iterations):
+                joint_key = f"Joint_{n + 1}"
+                entry = {"UT": str(300 + n % 100)}
+                start_time = time.perf_counter()
+                report_data[tab]['joint_data'][joint_key] = entry
+                bench.write_journal_record(journal_filename, json.dumps({"tab": tab, "joint": joint_key, "data": entry}))
+                compaction = None
+                if bench.journal_record_count >= bench.journal_compact_every:
+                    # rotate_journal and the save request, kept inside the throwaway directory
+                    os.replace(journal_filename, f"{journal_filename}.old")
+                    bench.journal_generation += 1
+                    bench.journal_record_count = 0
+                    compaction = bench.snapshot_report()
+                latencies.append((time.perf_counter() - start_time) * 1000)
+                if compaction is not None:
+                    start_time = time.perf_counter()
+                    bench._save_operation(compaction, filename, bench.journal_generation)
+                    compaction_latencies.append((time.perf_counter() - start_time) * 1000)
+            if bench.fsync_timer is not None:
+                bench.fsync_timer.cancel()
+
+            latencies.sort()
+            results[mode] = {
+                "avg_ms": sum(latencies) / len(latencies),
+                "p95_ms": latencies[int(0.95 * (len(latencies) - 1))],
+                "max_ms": latencies[-1],
+                "compaction_ms": sum(compaction_latencies) / len(compaction_latencies) if compaction_latencies else 0.0
+            }
+    return results
+
 
 
 def branch_select_screen(widmg, datmg, root, prev_page):
@@ -722,10 +2167,12 @@ def display_incomplete_reports(widmg, datmg, root, prev_page):
     widmg.store_and_place(page['scrollbar'], "file_scrollbar", file_scrollbar, relx=0.98, rely=0, relheight=1.0)
     file_listbox.config(yscrollcommand=file_scrollbar.set)
     
-    # Populate listbox with .json filenames from the specified folder
-    for filename in os.listdir(folder_path):
-        if filename.endswith('.json'):
-            file_listbox.insert(tk.END, filename)
+    # Populate listbox from the report catalog, reports are only fully loaded on START/EDIT
+    if not os.path.exists(folder_path):
+        os.makedirs(folder_path)
+    report_summaries = datmg.get_report_summaries(folder_path)
+    for filename in report_summaries:
+        file_listbox.insert(tk.END, filename)
     
     # Bind the selection event to load data and determine frames dynamically
     file_listbox.bind("<<ListboxSelect>>", lambda event: handle_file_selection(root, datmg, widmg, event))
@@ -742,23 +2189,28 @@ def display_incomplete_reports(widmg, datmg, root, prev_page):
         selected_file = file_listbox.get(selected_index[0])
         
         sel_file_full_path = os.path.join(folder_path, selected_file)
-        
-        # Load data from the file
-        datmg.load_file_to_dict(sel_file_full_path)
-        datmg.filename = sel_file_full_path
+        summary = report_summaries[selected_file]
         
         # Retrieve tabs information
-        included_tabs = get_report_tabs_info(datmg)
-        create_tab_display_frames(root, datmg, widmg, included_tabs)
+        included_tabs = get_report_tabs_info(summary)
+        create_tab_display_frames(root, datmg, widmg, included_tabs, summary, sel_file_full_path)
 
-    def get_report_tabs_info(datmg):
+    def get_report_tabs_info(summary):
         included_tabs = []
-        for tab in datmg.json_data_dict['report_data']:
+        for tab in summary['report_data']:
             included_tabs.append(tab)
         return included_tabs
 
+    def open_selected_tab(tab_key, sel_file_full_path):
+        # Load data from the file
+        if not datmg.load_file_to_dict(sel_file_full_path):
+            offer_report_recovery(widmg, datmg, root, sel_file_full_path)
+            return
+        datmg.filename = sel_file_full_path
+        after_display_incomplete_reports(widmg, datmg, root, tab_key, page)
+
 
-    def create_tab_display_frames(root, datmg, widmg, included_tabs):
+    def create_tab_display_frames(root, datmg, widmg, included_tabs, summary, sel_file_full_path):
         # Determine frame configurations based on included_tabs length
         frame_count = min(len(included_tabs), 3)  # Limit to a maximum of 3 frames
         
@@ -775,12 +2227,12 @@ def display_incomplete_reports(widmg, datmg, root, prev_page):
         
         # Display the report type in a separate frame
         report_type_display_frame = ttk.Frame(root)
-        report_type_label = ttk.Label(report_type_display_frame, text=datmg.json_data_dict['report_type'], font=('Arial', 20))
+        report_type_label = ttk.Label(report_type_display_frame, text=summary['report_type'], font=('Arial', 20))
         report_type_label.pack(anchor='center')
         widmg.store_and_place(page['display_frame'], "report_type_display_frame", report_type_display_frame, relx=0.5, rely=0.35, relwidth=0.8, relheight=0.05, anchor='center')
         
         # Get user metadata to display in each tab frame
-        user_metadata = datmg.json_data_dict['report_user_metadata']
+        user_metadata = summary['report_user_metadata']
         metadata_list = [
             user_metadata['operator_choice'], user_metadata['contractor_choice'], user_metadata['location_choice'], 
             user_metadata['date_choice'], user_metadata['invoice_choice'], user_metadata['connection_size_choice'], 
@@ -806,7 +2258,7 @@ def display_incomplete_reports(widmg, datmg, root, prev_page):
             widmg.store_and_place(page['label'], tab_label_name, tab_label, relx=0.5, rely=0.04, relwidth=0.95, relheight=0.10, anchor='center')
             
             # Check if tab is complete and set completion status
-            tab_data = datmg.json_data_dict['report_data'][tab_key]
+            tab_data = summary['report_data'][tab_key]
             is_complete = tab_data['is_complete']
             completion_text = "Complete" if is_complete else "Incomplete"
             completion_color = "green" if is_complete else "red"
@@ -836,7 +2288,7 @@ def display_incomplete_reports(widmg, datmg, root, prev_page):
             
             # Add button based on completion status
             button_text = "EDIT" if is_complete else "START"
-            action_button = ttk.Button(frame, text=button_text, command=lambda tab=tab_key: after_display_incomplete_reports(widmg, datmg, root, tab, page))
+            action_button = ttk.Button(frame, text=button_text, command=lambda tab=tab_key: open_selected_tab(tab, sel_file_full_path))
             widmg.store_and_place(page['button'], tdf_button_name, action_button, relx=0.5, rely=0.91, relwidth=0.87, relheight=0.09, anchor='center')
 
 
@@ -852,11 +2304,16 @@ def after_display_incomplete_reports(widmg, datmg, root, tab_key, prev_page):
     elif tab_key == "Tubing Insp Report":
         widmg.tab_data_header.set(datmg.json_data_dict['report_user_metadata']['connection_type_choice'])
 
+    try:
+        datmg.materialize_tab(tab_key)
+    except Exception:
+        offer_report_recovery(widmg, datmg, root, datmg.filename)
+        return
     datmg.json_data_dict['active_tab'] = tab_key
     active_tab = datmg.json_data_dict['active_tab']
 
     datmg.json_data_dict['report_data'][tab_key]['is_complete'] = False
-    datmg.save_dict_to_file()
+    datmg.save_dict_to_file(force_fsync=True)
 
     if datmg.json_data_dict['report_data'][active_tab]['users_column_select'] == []:
         create_select_columns_screen(widmg, datmg, root, prev_page)
@@ -1465,6 +2922,8 @@ def save_a_meta_widget_to_json(widmg, datmg, page, base_keys, in_sequence=True):
 
         if not key_found:
             print(f"Warning: Widget for base_key '{base_key}' not found in page dictionary.")
+    # Cached validation results were computed against the old metadata
+    datmg.bump_metadata_version()
 
     if not in_sequence:
         new_filename = datmg.get_json_filename_from_dict()
@@ -1474,12 +2933,20 @@ def save_a_meta_widget_to_json(widmg, datmg, page, base_keys, in_sequence=True):
             old_filepath = os.path.join(directory, current_filename)
             new_filepath = os.path.join(directory, new_filename)
 
+            # Let the autosave writer finish with the old name before moving its files
+            datmg.flush_saves()
+
             # Rename the file if it exists and the name has changed
             if os.path.exists(old_filepath):
                 os.rename(old_filepath, new_filepath)
                 print(f"Renamed file: {current_filename} -> {new_filename}")
-            if os.path.exists(f"{old_filepath}.bak"):
-                os.rename(f"{old_filepath}.bak", f"{new_filepath}.bak")
+
+            # Carry over the .bak, journal and tab shard files that share the report's name
+            old_prefix = f"{os.path.basename(old_filepath)}."
+            for sidecar in os.listdir(directory):
+                if sidecar.startswith(old_prefix):
+                    sidecar_suffix = sidecar[len(old_prefix) - 1:]
+                    os.rename(os.path.join(directory, sidecar), f"{new_filepath}{sidecar_suffix}")
 
 
             # Update the datmg.filename to the new filename
@@ -1735,11 +3202,14 @@ def add_column_selections_to_meta(widmg, datmg, root):
 def back_bridge_step(widmg, datmg, root, prev_page):
     widmg.hide_all_page_widgets(prev_page)
 
+    # The report being left is written out before its managers are dropped, the fresh ones
+    # take over the window bindings so closing the app flushes the report open at that time
+    retire_data_manager(datmg)
     datmg = DataManager()
     widmg = WidgetManager(root)
     datmg.set_widget_manager(widmg)
     widmg.set_data_manager(datmg)
-    root.bind("<Configure>", widmg.schedule_resize_fonts)
+    bind_main_window_handlers(widmg, datmg, root)
     
     start_inspection_screen(widmg, datmg, root)
 
@@ -1836,6 +3306,24 @@ def create_row_count_box(widmg, datmg, root):
     current_joint_number_label.bind("<Up>", lambda event: decrement_joint_number(widmg, datmg, root))
     current_joint_number_label.bind("<Down>", lambda event: increment_joint_number(widmg, datmg, root))
 
+    jump_box_frame = tk.Frame(root, bd=5, relief=tk.GROOVE)
+    widmg.store_and_place(page['display_frame'], "jump_box_frame", jump_box_frame, relx=0.02, rely=0.39, relwidth=0.08, relheight=0.10)
+
+    jump_box_label = tk.Label(jump_box_frame, text="GO TO #", font=('Arial', 10, 'bold italic'), padx=1, pady=1)
+    widmg.store_and_place(page['label'], "jump_box_label", jump_box_label, font_changer=True, relx=0.01, rely=0.01, relwidth=0.99, relheight=0.40)
+
+    jump_box_entry = tk.Entry(jump_box_frame, textvariable=widmg.jump_to_joint_var, bd=1, relief="solid", font=('Arial', 14, 'bold'), justify='center')
+    widmg.store_and_place(page['entry'], "jump_box_entry", jump_box_entry, relx=0.05, rely=0.45, relwidth=0.90, relheight=0.50)
+    jump_box_entry.bind("<Return>", lambda event: submit_jump_box(widmg, datmg, root))
+
+    check_tab_button = ttk.Button(root, text="CHECK\nTAB", command=lambda: create_validation_heatmap_window(widmg, datmg, root), style='Small.TButton')
+    widmg.store_and_place(page['button'], "check_tab_button", check_tab_button, relx=0.105, rely=0.39, relwidth=0.045, relheight=0.10)
+    bind_range_navigation(jump_box_entry, widmg, datmg, root)
+    for widget in (row_count_box_frame, joint_number_label, current_joint_number_label):
+        bind_range_navigation(widget, widmg, datmg, root)
+        widget.bind("<Home>", lambda event: jump_to_joint(widmg, datmg, root, 1))
+        widget.bind("<End>", lambda event: jump_to_last_joint(widmg, datmg, root))
+
 def create_header_and_first_row(widmg, datmg, root):
     page = widmg.main_table_display_widgets
     active_tab = datmg.json_data_dict['active_tab']
@@ -1868,10 +3356,19 @@ def create_header_and_first_row(widmg, datmg, root):
         lbl.bind("<Up>", lambda event: decrement_joint_number(widmg, datmg, root))
         lbl.bind("<Down>", lambda event: increment_joint_number(widmg, datmg, root))
         col_header_display_frame.columnconfigure(idx, weight=grid_size)
+    # Indexed handles for the joint entries, so the hot path never asks the grid for them
+    widmg.joint_entry_widgets = []
+    widmg.joint_entry_vars = []
+    widmg.entry_columns = {}
     for idx, header in enumerate(headers_list):
-        entry = tk.Entry(col_header_display_frame, bd=1, relief="solid", font=('Arial', 14, 'italic'))
+        entry_var = tk.StringVar()
+        entry = tk.Entry(col_header_display_frame, textvariable=entry_var, bd=1, relief="solid", font=('Arial', 14, 'italic'))
         if joint_1_data and header in joint_1_data:
             entry.insert(0, joint_1_data[header])
+        entry_var.trace_add('write', lambda *args, idx=idx: widmg.mark_entry_dirty(idx))
+        widmg.joint_entry_widgets.append(entry)
+        widmg.joint_entry_vars.append(entry_var)
+        widmg.entry_columns[entry] = idx
         widmg.store_and_grid(page['col_entry_labels'], f"{idx}_{header}", entry, font_changer=True, row=1, column=idx, rowspan=2, sticky='nsew', padx=1, pady=1)
         entry.bind("<FocusIn>", lambda event: widmg.on_focus(event, root))  # Correct: Set focus info when the entry gets focus
         entry.bind("<FocusOut>", widmg.on_focus_out)
@@ -1881,9 +3378,14 @@ def create_header_and_first_row(widmg, datmg, root):
         entry.bind("<Up>", lambda event: decrement_joint_number(widmg, datmg, root))
         entry.bind("<Down>", lambda event: increment_joint_number(widmg, datmg, root))
         entry.bind("<Return>", lambda event: increment_joint_number(widmg, datmg, root))
+        entry.bind("<Control-z>", lambda event: undo_joint_edit(widmg, datmg, root))
+        entry.bind("<Control-y>", lambda event: undo_joint_edit(widmg, datmg, root, redo=True))
+        # Plain Home/End keep moving the cursor inside the entry
+        bind_range_navigation(entry, widmg, datmg, root)
 
         if idx == 0:
             widmg.first_entry_widget = entry
+    widmg.clear_entry_dirty()
     widmg.first_entry_widget.focus_set()
 
 
@@ -2014,27 +3516,12 @@ def create_magnifier_window(widmg, datmg, root):
 
 def adjust_magnifier_fonts(widmg, root):
     def adjust_font(label, text_variable, base_font_family, base_font_size, base_font_weight):
-        text = text_variable.get()
         label_height = int(label.winfo_height())
         label_width = int(label.winfo_width())
-        wrap_length = int(label_width * 0.98)
-
-        # Create a test label with similar configuration
-        test_label = tk.Label(label.master, text=text, bd=1, relief="solid", font=(base_font_family, base_font_size, base_font_weight))
-        test_label.config(wraplength=wrap_length)
-        test_label.update_idletasks()
-
-        # Adjust font size to fit text within the label
-        while (test_label.winfo_reqwidth() > wrap_length or test_label.winfo_reqheight() > label_height) and base_font_size > 5:
-            base_font_size -= 1
-            test_label.config(font=(base_font_family, base_font_size, base_font_weight))
-            test_label.update_idletasks()
-
-        # Destroy the test label after adjustments
-        test_label.destroy()
+        fitted_font = widmg.text_fit.fit_font(text_variable.get(), (base_font_family, base_font_size, base_font_weight), int(label_width * 0.98), label_height)
 
         # Apply the adjusted font size to the actual label
-        label.config(font=(base_font_family, base_font_size, base_font_weight))
+        label.config(font=fitted_font)
 
     # Adjust font for magni_header_label
     magni_header_label = widmg.main_table_display_widgets['label']['magni_header_label']['widget']
@@ -2221,30 +3708,119 @@ def on_mouse_wheel(event, widmg, datmg, root):
 
         
 def increment_joint_number(widmg, datmg, root):
-    current_value = int(widmg.current_joint_number.get())
-    save_current_row_data(widmg, datmg, root)
-    if current_value < 1000:
-        widmg.current_joint_number.set(str(current_value + 1))
-    update_microfier_windows(widmg, datmg, root)
-    load_row_data(widmg, datmg, root)
-    datmg.save_dict_to_file()
-    update_all_row_cells(widmg, datmg, root)
-    adjust_magnifier_fonts(widmg, root)
-    widmg.update_magnifier(root)
+    queue_joint_move(widmg, datmg, root, 1)
 
 
+def queue_joint_move(widmg, datmg, root, step):
+    # Wheel flicks and key repeats only move the target joint; the screen is rendered once per frame
+    if widmg.pending_joint_target is None:
+        widmg.pending_joint_target = int(widmg.current_joint_number.get())
+    widmg.pending_joint_target = min(max(widmg.pending_joint_target + step, 1), widmg.max_joint_number)
+    if widmg.joint_render_after_id is None:
+        widmg.joint_render_after_id = root.after(widmg.frame_interval_ms, lambda: render_joint_move(widmg, datmg, root))
 
-def decrement_joint_number(widmg, datmg, root):
-    current_value = int(widmg.current_joint_number.get())
+
+def jump_to_joint(widmg, datmg, root, joint_number):
+    # Costs the same for any distance: the current row is saved once and only the target neighbourhood is rendered
+    cancel_joint_move(widmg, root)
+    widmg.pending_joint_target = min(max(int(joint_number), 1), widmg.max_joint_number)
+    render_joint_move(widmg, datmg, root)
+    return "break"
+
+
+def page_joint_number(widmg, datmg, root, pages):
+    queue_joint_move(widmg, datmg, root, pages * widmg.joint_page_size)
+    return "break"
+
+
+def jump_to_last_joint(widmg, datmg, root):
+    active_tab = datmg.json_data_dict['active_tab']
+    joint_data = datmg.json_data_dict['report_data'][active_tab]['joint_data']
+    joint_numbers = [int(key.split('_')[1]) for key in joint_data if key.split('_')[-1].isdigit()]
+    return jump_to_joint(widmg, datmg, root, max(joint_numbers) if joint_numbers else 1)
+
+
+def submit_jump_box(widmg, datmg, root):
+    value = widmg.jump_to_joint_var.get().strip()
+    widmg.jump_to_joint_var.set("")
+    if value.isdigit():
+        jump_to_joint(widmg, datmg, root, int(value))
+    if widmg.first_entry_widget is not None:
+        widmg.first_entry_widget.focus_set()
+    return "break"
+
+
+def bind_range_navigation(widget, widmg, datmg, root):
+    widget.bind("<Prior>", lambda event: page_joint_number(widmg, datmg, root, -1))
+    widget.bind("<Next>", lambda event: page_joint_number(widmg, datmg, root, 1))
+    widget.bind("<Control-Home>", lambda event: jump_to_joint(widmg, datmg, root, 1))
+    widget.bind("<Control-End>", lambda event: jump_to_last_joint(widmg, datmg, root))
+
+
+def cancel_joint_move(widmg, root):
+    if widmg.joint_render_after_id is not None:
+        root.after_cancel(widmg.joint_render_after_id)
+    widmg.joint_render_after_id = None
+    widmg.pending_joint_target = None
+
+
+def render_joint_move(widmg, datmg, root):
+    widmg.joint_render_after_id = None
+    target = widmg.pending_joint_target
+    widmg.pending_joint_target = None
+    if target is None or not widmg.joint_entry_widgets:
+        return
+
+    latency = datmg.latency
+    with latency.span('joint_move'):
+        # The displayed joint has not changed yet, so anything typed during the burst is saved to it
+        with latency.span('save_current_row_data'):
+            save_current_row_data(widmg, datmg, root)
+        widmg.current_joint_number.set(str(target))
+        with latency.span('update_microfier_windows'):
+            update_microfier_windows(widmg, datmg, root)
+        with latency.span('load_row_data'):
+            load_row_data(widmg, datmg, root)
+        with latency.span('update_all_row_cells'):
+            update_all_row_cells(widmg, datmg, root)
+        with latency.span('adjust_magnifier_fonts'):
+            adjust_magnifier_fonts(widmg, root)
+        with latency.span('update_magnifier'):
+            widmg.update_magnifier(root)
+
+    # One autosave once the burst has settled
+    if widmg.joint_autosave_after_id is not None:
+        root.after_cancel(widmg.joint_autosave_after_id)
+    widmg.joint_autosave_after_id = root.after(widmg.burst_autosave_delay_ms, lambda: run_burst_autosave(widmg, datmg))
+
+
+def run_burst_autosave(widmg, datmg):
+    widmg.joint_autosave_after_id = None
+    datmg.autosave_joint()
+
+
+
+def undo_joint_edit(widmg, datmg, root, redo=False):
+    # Commit whatever is typed first so it becomes the step being undone
+    cancel_joint_move(widmg, root)
     save_current_row_data(widmg, datmg, root)
-    if current_value > 1:
-        widmg.current_joint_number.set(str(current_value -1))
+    step = datmg.edit_history.pop_redo() if redo else datmg.edit_history.pop_undo()
+    if step is None:
+        return "break"
+    tab, joint_key = datmg.apply_edit_step(step, undo=not redo)
+    if tab == datmg.json_data_dict['active_tab'] and joint_key is not None:
+        widmg.current_joint_number.set(joint_key.split('_')[1])
     load_row_data(widmg, datmg, root)
     update_microfier_windows(widmg, datmg, root)
-    datmg.save_dict_to_file()
+    datmg.autosave_joint()
     update_all_row_cells(widmg, datmg, root)
     adjust_magnifier_fonts(widmg, root)
     widmg.update_magnifier(root)
+    return "break"
+
+
+def decrement_joint_number(widmg, datmg, root):
+    queue_joint_move(widmg, datmg, root, -1)
 
 
 
@@ -2287,261 +3863,349 @@ def update_all_row_cells(widmg, datmg, root, editing=False):
     report_type = datmg.json_data_dict['report_type']
     active_tab = datmg.json_data_dict['active_tab']
     col_selects = datmg.json_data_dict['report_data'][active_tab]['users_column_select']
-    headers_list = datmg.json_data_dict['report_data'][active_tab]['users_column_select']
-    total_headers = len(headers_list)
+    total_headers = len(col_selects)
     current_value = int(widmg.current_joint_number.get())
     joint_data = datmg.json_data_dict['report_data'][active_tab]['joint_data']
+    metadata = datmg.json_data_dict['report_user_metadata']
+    label_width = int((0.83 * root.winfo_width()) // total_headers)
+    wrap_length = int(label_width * 0.98)
+    label_height = int(0.07 * root.winfo_height())
+    default_font = ('TKDefaultFont', 12, 'normal')
+
+    # Rendered cells depend on the layout and the validation inputs; drop the cache when any change
+    render_signature = (active_tab, tuple(col_selects), report_type, wrap_length, label_height,
+                        metadata.get('connection_size_choice'), metadata.get('connection_type_choice'))
+    if widmg.row_render_signature != render_signature:
+        widmg.row_render_signature = render_signature
+        widmg.row_render_cache = {}
+        widmg.row_applied_states = {}
+    if not widmg.row_fit_tables:
+        # Measured once on the Tk thread so the render worker can fit fonts from plain data
+        fonts = {default_font} | {tuple(color_code[2]) for color_code in datmg.color_code_dict.values()}
+        widmg.row_fit_tables = widmg.text_fit.build_width_tables(fonts, min_size=6)
+
+    render_context = {
+        "signature": render_signature,
+        "col_selects": list(col_selects),
+        "report_type": report_type,
+        "wrap_length": wrap_length,
+        "label_height": label_height,
+        "default_font": default_font,
+        "tables": widmg.row_fit_tables,
+        "validator": datmg.get_validator()
+    }
 
-    def adjust_font_to_fit_label(up_lab_widget, fontchange, text):
-        base_font_family, base_font_size, base_font_weight = fontchange
-        label_width = int((0.83 * root.winfo_width()) // total_headers)
-        wrap_length = int(label_width * 0.98)
-        label_height = int(0.07 * root.winfo_height())
+    rows = [
+        (-2, 'prev_sec_row_label_list', current_value <= 2),
+        (-1, 'prev_first_row_label_list', current_value == 1),
+        (1, 'next_first_row_label_list', False),
+        (2, 'next_second_row_label_list', False)
+    ]
+    # Cached joints are shown at once; the rest are computed by the render worker and filled in when posted back
+    widmg.row_render_targets = {}
+    pending_joints = {}
+    blank_states = [("-", 'black', 'systemButtonFace', default_font)] * total_headers
+    for joint_key_offset, row_var_list, set_default in rows:
+        joint_key = f"Joint_{current_value + joint_key_offset}"
+        joint_entry = None if set_default else joint_data.get(joint_key)
+        if joint_entry is None:
+            # Jumps skip the joints in between, so a row with no joint behind it is blanked
+            # rather than left showing the previous neighbours
+            widmg.row_render_targets[row_var_list] = None
+            apply_row_cell_states(widmg, row_var_list, col_selects, blank_states)
+            continue
+        widmg.row_render_targets[row_var_list] = joint_key
+        cached = widmg.row_render_cache.get(joint_key)
+        if cached is not None and cached[0] is joint_entry:
+            apply_row_cell_states(widmg, row_var_list, col_selects, cached[1])
+        else:
+            # Plain text now so a coalesced move never leaves a row on an old joint, the worker adds colors and fitted fonts
+            apply_row_cell_states(widmg, row_var_list, col_selects,
+                                  [(joint_entry[header], 'black', 'systemButtonFace', default_font) if header in joint_entry else None
+                                   for header in col_selects])
+            pending_joints[joint_key] = joint_entry
 
-        # Create a test label with similar configuration
-        test_label = tk.Label(up_lab_widget.master, text=text, bd=1, relief="solid", font=(base_font_family, base_font_size, base_font_weight))
-        test_label.config(wraplength=wrap_length)
-        test_label.update_idletasks()
+    if pending_joints:
+        widmg.submit_preview_render(render_context, list(pending_joints.items()))
+    widmg.row_render_context = render_context
+    schedule_preview_prefetch(widmg, datmg, root)
 
-        # Adjust font size to fit text within the label
-        while (test_label.winfo_reqwidth() > wrap_length or test_label.winfo_reqheight() > label_height) and base_font_size > 6:
-            base_font_size -= 1
-            test_label.config(font=(base_font_family, base_font_size, base_font_weight))
-            test_label.update_idletasks()
 
-        # Destroy the test label after adjustments
-        test_label.destroy()
+def schedule_preview_prefetch(widmg, datmg, root):
+    if widmg.prefetch_after_id is None:
+        widmg.prefetch_after_id = root.after_idle(lambda: prefetch_joint_neighbourhood(widmg, datmg, root))
 
-        # Return the adjusted font without truncating the text
-        return (base_font_family, base_font_size, base_font_weight), text
 
-    def update_cells(joint_key_offset, row_var_list, set_default=False):
-        active_tab = datmg.json_data_dict['active_tab']
-        joint_key = f"Joint_{current_value + joint_key_offset}"
-        cells = getattr(widmg, row_var_list)
-        row_dict = widmg.main_table_display_widgets['display_frame'][row_var_list]
-        frame_key = f"{row_var_list}"
-
-        if set_default:
-            for idx, var in enumerate(cells):
-                cells[idx].set("-")
-            for idx, header in enumerate(col_selects):
-                label_key = f"{header}_{idx}"
-                up_lab_widget = widmg.get_label_widget(widmg, frame_key, label_key)
-                default_font = ('TKDefaultFont', 12, 'normal')
-                up_lab_widget.config(bg='systemButtonFace', fg='black', font=default_font)
-                widget_dict_id = id(row_dict)
-                if widget_dict_id in widmg.font_widgets and label_key in widmg.font_widgets[widget_dict_id]:
-                    widmg.font_widgets[widget_dict_id][label_key]['initial_font'] = default_font
-        else:
-            for idx, header in enumerate(col_selects):
-                label_key = f"{header}_{idx}"
-                if joint_key in joint_data and header in joint_data[joint_key]:
-                    header_value = datmg.json_data_dict['report_data'][active_tab]['joint_data'][joint_key][header]
-                    cells[idx].set(header_value)
-
-
-
-                    if header == 'UT':
-                        txt_color, bg_color, fontchange = validate_ut(header_value, header, datmg)
-                        up_lab_widget = widmg.get_label_widget(widmg, frame_key, label_key)
-                        fontchange, adjusted_text = adjust_font_to_fit_label(up_lab_widget, fontchange, header_value)
-                        cells[idx].set(adjusted_text)
-                        up_lab_widget.config(bg=bg_color, fg=txt_color, font=fontchange)
-                        widget_dict_id = id(row_dict)
-                        if widget_dict_id in widmg.font_widgets and label_key in widmg.font_widgets[widget_dict_id]:
-                            widmg.font_widgets[widget_dict_id][label_key]['initial_font'] = fontchange
-
-                    elif header == 'PIN':
-                        if report_type == "Drill Pipe Inspection Report":
-                            txt_color, bg_color, fontchange = validate_reface(header_value, header, datmg)
-                            up_lab_widget = widmg.get_label_widget(widmg, frame_key, label_key)
-                            fontchange, adjusted_text = adjust_font_to_fit_label(up_lab_widget, fontchange, header_value)
-                            cells[idx].set(adjusted_text)
-                            up_lab_widget.config(bg=bg_color, fg=txt_color, font=fontchange)
-                            widget_dict_id = id(row_dict)
-                            if widget_dict_id in widmg.font_widgets and label_key in widmg.font_widgets[widget_dict_id]:
-                                widmg.font_widgets[widget_dict_id][label_key]['initial_font'] = fontchange
-                        elif report_type == "Tubing/Casing Report":
-                            up_lab_widget = widmg.get_label_widget(widmg, frame_key, label_key)
-                            default_font = ('TKDefaultFont', 12, 'normal')
-                            fontchange, adjusted_text = adjust_font_to_fit_label(up_lab_widget, default_font, header_value)
-                            cells[idx].set(adjusted_text)
-                            up_lab_widget.config(bg='systemButtonFace', fg='black', font=fontchange)
-                            widget_dict_id = id(row_dict)
-                            if widget_dict_id in widmg.font_widgets and label_key in widmg.font_widgets[widget_dict_id]:
-                                widmg.font_widgets[widget_dict_id][label_key]['initial_font'] = fontchange
-
-                    elif header == 'BOX':
-                        if report_type == "Drill Pipe Inspection Report":
-                            txt_color, bg_color, fontchange = validate_reface(header_value, header, datmg)
-                            up_lab_widget = widmg.get_label_widget(widmg, frame_key, label_key)
-                            fontchange, adjusted_text = adjust_font_to_fit_label(up_lab_widget, fontchange, header_value)
-                            cells[idx].set(adjusted_text)
-                            up_lab_widget.config(bg=bg_color, fg=txt_color, font=fontchange)
-                            widget_dict_id = id(row_dict)
-                            if widget_dict_id in widmg.font_widgets and label_key in widmg.font_widgets[widget_dict_id]:
-                                widmg.font_widgets[widget_dict_id][label_key]['initial_font'] = fontchange
-                        elif report_type == "Tubing/Casing Report":
-                            up_lab_widget = widmg.get_label_widget(widmg, frame_key, label_key)
-                            default_font = ('TKDefaultFont', 12, 'normal')
-                            fontchange, adjusted_text = adjust_font_to_fit_label(up_lab_widget, default_font, header_value)
-                            cells[idx].set(adjusted_text)
-                            up_lab_widget.config(bg='systemButtonFace', fg='black', font=fontchange)
-                            widget_dict_id = id(row_dict)
-                            if widget_dict_id in widmg.font_widgets and label_key in widmg.font_widgets[widget_dict_id]:
-                                widmg.font_widgets[widget_dict_id][label_key]['initial_font'] = fontchange
-
-                    elif header == 'TUBE':
-                        up_lab_widget = widmg.get_label_widget(widmg, frame_key, label_key)
-                        default_font = ('TKDefaultFont', 12, 'normal')
-                        fontchange, adjusted_text = adjust_font_to_fit_label(up_lab_widget, default_font, header_value)
-                        cells[idx].set(adjusted_text)
-                        up_lab_widget.config(bg='systemButtonFace', fg='black', font=fontchange)
-                        widget_dict_id = id(row_dict)
-                        if widget_dict_id in widmg.font_widgets and label_key in widmg.font_widgets[widget_dict_id]:
-                            widmg.font_widgets[widget_dict_id][label_key]['initial_font'] = fontchange
-
-                    elif header == 'SERIAL':
-                        up_lab_widget = widmg.get_label_widget(widmg, frame_key, label_key)
-                        default_font = ('TKDefaultFont', 12, 'normal')
-                        fontchange, adjusted_text = adjust_font_to_fit_label(up_lab_widget, default_font, header_value)
-                        cells[idx].set(adjusted_text)
-                        up_lab_widget.config(bg='systemButtonFace', fg='black', font=fontchange)
-                        widget_dict_id = id(row_dict)
-                        if widget_dict_id in widmg.font_widgets and label_key in widmg.font_widgets[widget_dict_id]:
-                            widmg.font_widgets[widget_dict_id][label_key]['initial_font'] = fontchange
-                    else:
-                        up_lab_widget = widmg.get_label_widget(widmg, frame_key, label_key)
-                        default_font = ('TKDefaultFont', 12, 'normal')
-                        fontchange, adjusted_text = adjust_font_to_fit_label(up_lab_widget, default_font, header_value)
-                        cells[idx].set(adjusted_text)
-                        up_lab_widget.config(bg='systemButtonFace', fg='black', font=fontchange)
-                        widget_dict_id = id(row_dict)
-                        if widget_dict_id in widmg.font_widgets and label_key in widmg.font_widgets[widget_dict_id]:
-                            widmg.font_widgets[widget_dict_id][label_key]['initial_font'] = fontchange
+def get_prefetch_depth(widmg):
+    # Slow hardware gets a narrower window so prefetching never competes with typing; three joints
+    # either side still covers the preview rows of the next move
+    if widmg.render_cost_ms is None or widmg.render_cost_ms <= 0:
+        return widmg.prefetch_max_depth
+    return max(widmg.prefetch_min_depth, min(widmg.prefetch_max_depth, int(widmg.prefetch_budget_ms / (2 * widmg.render_cost_ms))))
 
-    if current_value == 1:
-        update_cells(-1, 'prev_first_row_label_list', set_default=True)
-    else:
-        update_cells(-1, 'prev_first_row_label_list')
 
-    if current_value <= 2:
-        update_cells(-2, 'prev_sec_row_label_list', set_default=True)
-    else:
-        update_cells(-2, 'prev_sec_row_label_list')
+def prefetch_joint_neighbourhood(widmg, datmg, root):
+    # Runs when Tk is idle: queue render state for joints N-depth..N+depth that are not cached yet
+    widmg.prefetch_after_id = None
+    render_context = widmg.row_render_context
+    if render_context is None or render_context['signature'] != widmg.row_render_signature:
+        return
+    active_tab = datmg.json_data_dict['active_tab']
+    joint_data = datmg.json_data_dict['report_data'][active_tab]['joint_data']
+    current_value = int(widmg.current_joint_number.get())
+
+    pending_joints = []
+    for distance in range(1, get_prefetch_depth(widmg) + 1):
+        for joint_number in (current_value + distance, current_value - distance):
+            joint_key = f"Joint_{joint_number}"
+            joint_entry = joint_data.get(joint_key)
+            if joint_entry is None:
+                continue
+            cached = widmg.row_render_cache.get(joint_key)
+            if cached is None or cached[0] is not joint_entry:
+                pending_joints.append((joint_key, joint_entry))
+    if pending_joints:
+        widmg.submit_preview_render(render_context, pending_joints, prefetch=True)
+
+
+def compute_joint_cell_states(datmg, render_context, joint_entry):
+    # Runs on the render worker: validation and table based font fitting only, no Tk calls
+    cell_states = []
+    validation_ms = 0.0
+    fitting_ms = 0.0
+    for header in render_context['col_selects']:
+        if joint_entry is None or header not in joint_entry:
+            cell_states.append(None)
+            continue
+        header_value = joint_entry[header]
+        start_time = time.perf_counter()
+        value_class = datmg.classify_cell(header, header_value, render_context['validator'])
+        if header == 'UT' or (header in ('PIN', 'BOX') and render_context['report_type'] == "Drill Pipe Inspection Report"):
+            txt_color, bg_color, fontchange = datmg.color_code_dict[value_class]
+        else:
+            txt_color, bg_color, fontchange = 'black', 'systemButtonFace', render_context['default_font']
+        validated_time = time.perf_counter()
+        # The adjusted font is returned without truncating the text
+        fontchange = TextFitEngine.fit_font_from_tables(header_value, fontchange, render_context['wrap_length'],
+                                                        render_context['label_height'], render_context['tables'], min_size=6)
+        validation_ms += (validated_time - start_time) * 1000
+        fitting_ms += (time.perf_counter() - validated_time) * 1000
+        cell_states.append((header_value, txt_color, bg_color, fontchange))
+    datmg.latency.record('update_all_row_cells.validation', validation_ms)
+    datmg.latency.record('update_all_row_cells.font_fitting', fitting_ms)
+    return cell_states
+
+
+def apply_rendered_preview_rows(widmg, datmg, root, render_context, results):
+    # Back on the Tk thread; results for a joint edited or a layout changed in the meantime are dropped
+    if render_context['signature'] != widmg.row_render_signature:
+        return
+    active_tab = datmg.json_data_dict['active_tab']
+    col_selects = datmg.json_data_dict['report_data'][active_tab]['users_column_select']
+    joint_data = datmg.json_data_dict['report_data'][active_tab]['joint_data']
+    for joint_key, joint_entry, cell_states in results:
+        if joint_data.get(joint_key) is joint_entry:
+            widmg.row_render_cache[joint_key] = (joint_entry, cell_states)
 
-    update_cells(1, 'next_first_row_label_list')
-    update_cells(2, 'next_second_row_label_list')
+    try:
+        for row_var_list, joint_key in widmg.row_render_targets.items():
+            cached = widmg.row_render_cache.get(joint_key)
+            if joint_key is not None and cached is not None and cached[0] is joint_data.get(joint_key):
+                apply_row_cell_states(widmg, row_var_list, col_selects, cached[1])
+    except tk.TclError as e:
+        logging.error(f"Error applying preview rows: {e}", exc_info=True)
 
 
+def apply_row_cell_states(widmg, row_var_list, col_selects, cell_states):
+    cells = getattr(widmg, row_var_list)
+    row_dict = widmg.main_table_display_widgets['display_frame'][row_var_list]
+    widget_dict_id = id(row_dict)
+
+    # Rows keep their widgets while joints scroll through them, so only cells whose state differs are touched;
+    # a column the joint has no value for is blanked like a missing joint
+    for idx, header in enumerate(col_selects):
+        cell_state = cell_states[idx]
+        if cell_state is None:
+            cell_state = ("-", 'black', 'systemButtonFace', ('TKDefaultFont', 12, 'normal'))
+        label_key = f"{header}_{idx}"
+        up_lab_widget = widmg.get_label_widget(widmg, row_var_list, label_key)
+        applied_key = (str(up_lab_widget), str(cells[idx]))
+        if widmg.row_applied_states.get(applied_key) == cell_state:
+            continue
+        adjusted_text, txt_color, bg_color, fontchange = cell_state
+        cells[idx].set(adjusted_text)
+        up_lab_widget.config(bg=bg_color, fg=txt_color, font=fontchange)
+        if widget_dict_id in widmg.font_widgets and label_key in widmg.font_widgets[widget_dict_id]:
+            widmg.font_widgets[widget_dict_id][label_key]['initial_font'] = fontchange
+        widmg.row_applied_states[applied_key] = cell_state
 
 
 
 
-def validate_ut(header_value, header, datmg):
-    active_tab = datmg.json_data_dict['active_tab']
-    connection_size = datmg.json_data_dict['report_user_metadata']['connection_size_choice']
-    conn_type_select = datmg.json_data_dict['report_user_metadata']['connection_type_choice'] 
-    report_type = datmg.json_data_dict['report_type']
-    if report_type == 'Drill Pipe Inspection Report':
-        nominal_wall = 1000 * (datmg.dp_conn_size_nom_rel_dict[connection_size])
-    elif report_type == 'Tubing/Casing Report':
-        nominal_wall = 1000 * (datmg.tube_conn_size_nom_rel_dict[connection_size][conn_type_select])
-
-    if header_value != '':
-        if len(header_value) != 3 or not header_value.isdigit() or (float(header_value) / nominal_wall) >= 1.15:
-            return datmg.color_code_dict["Invalid Syntax"]
-
-        elif header_value.isdigit() and len(header_value) == 3:
-            perc_nom_wall = float(header_value) / nominal_wall
-            if perc_nom_wall < 1.10 and perc_nom_wall > 0.80:
-                return datmg.color_code_dict["Good Nominal Wall"]
-            elif perc_nom_wall <= 0.80 and perc_nom_wall > 0.75:
-                return datmg.color_code_dict["Class 2"]
-            elif perc_nom_wall <= 0.75 and perc_nom_wall > 0.70:
-                return datmg.color_code_dict["Class 3"]
-            elif perc_nom_wall <= 0.70:
-                return datmg.color_code_dict["Invalid Validation"]
-            else:
-                return datmg.color_code_dict["Default"]
-        else:
-            return datmg.color_code_dict["Default"]
-    return datmg.color_code_dict["Default"]
-
-
-
-def validate_reface(header_value, header, datmg):
-    header_value = re.sub(r'(\d+)\s(\d+/\d+)', r'\1_\2', header_value)
-    data_chunks = header_value.split()
-    n = len(data_chunks)
-    reface_kws = ["R1", "R2", "R3", "R4", "R"]
-
-    conn_type = datmg.json_data_dict['report_user_metadata']['connection_type_choice']
-
-    boxcl_min_bef = str(datmg.dp_conn_type_vals_dict[conn_type][4]).split(".")[0]
-    boxcl_max_bef = str(datmg.dp_conn_type_vals_dict[conn_type][5]).split(".")[0]
-    pincl_min_bef = str(datmg.dp_conn_type_vals_dict[conn_type][6]).split(".")[0]
-    pincl_max_bef = str(datmg.dp_conn_type_vals_dict[conn_type][7]).split(".")[0]
-
-    minbox_reface, maxbox_reface = datmg.dp_conn_type_vals_dict[conn_type][4:6]
-    minpin_reface, maxpin_reface = datmg.dp_conn_type_vals_dict[conn_type][6:8]
-
-    if conn_type != "NC-50":
-        for chunk in data_chunks:
-            if chunk in reface_kws:
-                rf_index = data_chunks.index(chunk)
-                if rf_index < n - 1:
-                    nxt_idx = data_chunks[rf_index + 1]
-                    if nxt_idx.isdigit() and len(nxt_idx) == 6:
-                        if header == 'BOX':
-                            rbcl = float(f"{boxcl_min_bef}.{nxt_idx[:3]}")
-                            racl = float(f"{boxcl_max_bef}.{nxt_idx[3:]}") 
-                            if (rbcl < minbox_reface or rbcl > maxbox_reface) or \
-                            (racl < minbox_reface or racl > maxbox_reface):
-                                return datmg.color_code_dict["Invalid Validation"] 
-                        if header == 'PIN': 
-                            rbcl = float(f"{pincl_min_bef}.{nxt_idx[:3]}")
-                            racl = float(f"{pincl_max_bef}.{nxt_idx[3:]}")  
-                            if (rbcl < minpin_reface or rbcl > maxpin_reface) or \
-                            (racl < minpin_reface or racl > maxpin_reface):
-                                return datmg.color_code_dict["Invalid Validation"]
-                    elif nxt_idx.isdigit() and (len(nxt_idx) > 6 or len(nxt_idx) < 6):
-                        return datmg.color_code_dict["Invalid Syntax"]
-                        
-    return datmg.color_code_dict["Default"]
 
 
 
 def save_current_row_data(widmg, datmg, root):
     active_tab = datmg.json_data_dict['active_tab']
     col_selects = datmg.json_data_dict['report_data'][active_tab]['users_column_select']
-    col_head_frame = widmg.main_table_display_widgets['display_frame']['col_header_display_frame']['widget']
     current_value = int(widmg.current_joint_number.get())
     joint_key = f"Joint_{current_value}"
+    joint_data = datmg.json_data_dict['report_data'][active_tab]['joint_data']
+
+    # Nothing typed since the row was loaded, so the stored joint already matches the entries
+    if joint_key in joint_data and not any(widmg.joint_entry_dirty):
+        return
 
     entry_data = {}
     for idx, header in enumerate(col_selects):
-        entry_widget = col_head_frame.grid_slaves(row=1, column=idx)[0]
-        entry_data[header] = entry_widget.get() 
-
+        entry_data[header] = widmg.joint_entry_widgets[idx].get()
 
-    datmg.json_data_dict['report_data'][active_tab]['joint_data'][joint_key] = entry_data
+    # Unchanged joints keep their entry so the shard writer can skip untouched tabs
+    if joint_data.get(joint_key) != entry_data:
+        datmg.record_joint_edit(active_tab, joint_key, joint_data.get(joint_key), entry_data)
+        joint_data[joint_key] = entry_data
+        datmg.append_joint_to_journal(active_tab, joint_key, entry_data)
+    widmg.clear_entry_dirty()
 
 def load_row_data(widmg, datmg, root):
     active_tab = datmg.json_data_dict['active_tab']
     col_selects = datmg.json_data_dict['report_data'][active_tab]['users_column_select']
 
-    col_head_frame = widmg.main_table_display_widgets['display_frame']['col_header_display_frame']['widget']
     current_value = int(widmg.current_joint_number.get())
     joint_key = f"Joint_{current_value}"
 
     joint_data = datmg.json_data_dict['report_data'][active_tab]['joint_data']
     for idx, header in enumerate(col_selects):
-        entry_widget = col_head_frame.grid_slaves(row=1, column=idx)[0]
+        entry_widget = widmg.joint_entry_widgets[idx]
         entry_widget.delete(0, tk.END)
         if joint_key in joint_data and header in joint_data[joint_key]:
-            entry_widget.insert(0, datmg.json_data_dict['report_data'][active_tab]['joint_data'][joint_key][header])
+            entry_widget.insert(0, joint_data[joint_key][header])
+    widmg.clear_entry_dirty()
+
+
+def find_invalid_cells(datmg, tab):
+    validator = datmg.get_validator()
+    joint_data = datmg.json_data_dict['report_data'][tab].get('joint_data', {})
+    invalid_cells = []
+    for joint_key, joint_entry in joint_data.items():
+        for header, value in joint_entry.items():
+            value_class = datmg.classify_cell(header, value, validator)
+            if value_class in ("Invalid Syntax", "Invalid Validation"):
+                invalid_cells.append((int(joint_key.split('_')[1]), header, value, value_class))
+    return sorted(invalid_cells)
+
+def confirm_export_with_invalid_cells(datmg):
+    invalid_cells = find_invalid_cells(datmg, datmg.json_data_dict['active_tab'])
+    if not invalid_cells:
+        return True
+    listed = "\n".join(f"Joint {joint_number} {header}: {value} ({value_class})" for joint_number, header, value, value_class in invalid_cells[:10])
+    more = f"\n...and {len(invalid_cells) - 10} more" if len(invalid_cells) > 10 else ""
+    return messagebox.askyesno("Validation Errors", f"{len(invalid_cells)} cells failed validation:\n\n{listed}{more}\n\nExport anyway?")
+
+
+heatmap_colors = {"Good Nominal Wall": "green3", "Class 2": "yellow", "Class 3": "orange",
+                  "Invalid Validation": "red", "Invalid Syntax": "red4", "Default": "gray60"}
+
+def create_validation_heatmap_window(widmg, datmg, root):
+    # Joint-by-column map of the whole active tab; clicking a cell jumps the table to that joint
+    if hasattr(widmg, 'heatmap_window') and widmg.heatmap_window.winfo_exists():
+        widmg.heatmap_window.lift()
+        draw_validation_heatmap(widmg, datmg, root)
+        return
+
+    widmg.heatmap_window = tk.Toplevel(root)
+    widmg.heatmap_window.title("Tab Validation")
+    widmg.heatmap_window.geometry("900x560")
+
+    widmg.heatmap_canvas = tk.Canvas(widmg.heatmap_window, bg='white', highlightthickness=0)
+    widmg.heatmap_canvas.place(relx=0.01, rely=0.01, relwidth=0.96, relheight=0.80)
+    heatmap_scrollbar = tk.Scrollbar(widmg.heatmap_window, orient=tk.VERTICAL, command=widmg.heatmap_canvas.yview)
+    heatmap_scrollbar.place(relx=0.97, rely=0.01, relwidth=0.02, relheight=0.80)
+    widmg.heatmap_canvas.config(yscrollcommand=heatmap_scrollbar.set)
+
+    widmg.heatmap_status = tk.StringVar()
+    status_label = ttk.Label(widmg.heatmap_window, textvariable=widmg.heatmap_status, font=('Courier', 10), justify='left')
+    status_label.place(relx=0.02, rely=0.83, relwidth=0.70, relheight=0.15)
+
+    widmg.heatmap_canvas.bind("<Button-1>", lambda event: on_heatmap_click(event, widmg, datmg, root))
+    widmg.heatmap_canvas.bind("<Motion>", lambda event: on_heatmap_motion(event, widmg, datmg))
+    widmg.heatmap_canvas.bind("<MouseWheel>", lambda event: widmg.heatmap_canvas.yview_scroll(int(-event.delta / 120), "units"))
+
+    refresh_button = ttk.Button(widmg.heatmap_window, text="Recheck", command=lambda: draw_validation_heatmap(widmg, datmg, root))
+    refresh_button.place(relx=0.74, rely=0.86, relwidth=0.11, relheight=0.08)
+    close_button = ttk.Button(widmg.heatmap_window, text="Close", command=widmg.heatmap_window.destroy)
+    close_button.place(relx=0.87, rely=0.86, relwidth=0.11, relheight=0.08)
+    draw_validation_heatmap(widmg, datmg, root)
+
+def draw_validation_heatmap(widmg, datmg, root):
+    if widmg.joint_entry_widgets:
+        save_current_row_data(widmg, datmg, root)
+    active_tab = datmg.json_data_dict['active_tab']
+    columns = datmg.json_data_dict['report_data'][active_tab]['users_column_select']
+    joint_data = datmg.json_data_dict['report_data'][active_tab]['joint_data']
+
+    start_time = time.perf_counter()
+    validator = datmg.get_validator()
+    tab_classes = validator.classify_tab(joint_data, columns, lambda column, value: datmg.classify_cell(column, value, validator))
+    check_ms = (time.perf_counter() - start_time) * 1000
+    datmg.latency.record('validate_tab', check_ms)
+
+    # Joints run left to right in bands of heatmap_band_size, one cell row per column
+    canvas = widmg.heatmap_canvas
+    canvas.delete('all')
+    band_size, cell_width, cell_height, margin = widmg.heatmap_band_size, 8, 10, 70
+    band_height = len(columns) * cell_height + 14
+    last_joint = max(tab_classes) if tab_classes else 0
+    counts = {}
+    for band in range((last_joint + band_size - 1) // band_size):
+        band_top = band * band_height
+        canvas.create_text(2, band_top, anchor='nw', font=('Arial', 7), text=f"{band * band_size + 1}-{(band + 1) * band_size}")
+        canvas.create_rectangle(margin, band_top, margin + band_size * cell_width, band_top + len(columns) * cell_height, fill='gray90', outline='')
+        for col_idx, column in enumerate(columns):
+            row_top = band_top + col_idx * cell_height
+            canvas.create_text(margin - 4, row_top, anchor='ne', font=('Arial', 6), text=column)
+            # Runs of the same class are drawn as one rectangle to keep the item count down
+            run_start, run_class = 0, None
+            for offset in range(band_size + 1):
+                classes = tab_classes.get(band * band_size + offset + 1) if offset < band_size else None
+                value_class = classes[col_idx] if classes else None
+                if value_class is not None and offset < band_size:
+                    counts[value_class] = counts.get(value_class, 0) + 1
+                if value_class != run_class:
+                    if run_class is not None:
+                        canvas.create_rectangle(margin + run_start * cell_width, row_top, margin + offset * cell_width, row_top + cell_height - 1,
+                                                fill=heatmap_colors[run_class], outline='')
+                    run_start, run_class = offset, value_class
+    canvas.config(scrollregion=(0, 0, margin + band_size * cell_width, max(1, (last_joint + band_size - 1) // band_size) * band_height))
+    widmg.heatmap_layout = (columns, band_size, cell_width, cell_height, margin, band_height, tab_classes)
+
+    summary = "  ".join(f"{value_class}: {counts[value_class]}" for value_class in heatmap_colors if value_class in counts)
+    widmg.heatmap_status.set(f"{len(tab_classes)} joints checked in {check_ms:.1f} ms\n{summary}")
+
+def get_heatmap_cell(event, widmg):
+    columns, band_size, cell_width, cell_height, margin, band_height, tab_classes = widmg.heatmap_layout
+    x = widmg.heatmap_canvas.canvasx(event.x) - margin
+    y = widmg.heatmap_canvas.canvasy(event.y)
+    band, band_y = divmod(int(y), band_height)
+    col_idx = band_y // cell_height
+    if x < 0 or x >= band_size * cell_width or col_idx >= len(columns):
+        return None
+    return band * band_size + int(x // cell_width) + 1, columns[col_idx], tab_classes
+
+def on_heatmap_motion(event, widmg, datmg):
+    cell = get_heatmap_cell(event, widmg)
+    if cell is None:
+        return
+    joint_number, column, tab_classes = cell
+    classes = tab_classes.get(joint_number)
+    value = datmg.json_data_dict['report_data'][datmg.json_data_dict['active_tab']]['joint_data'].get(f"Joint_{joint_number}", {}).get(column, '')
+    value_class = classes[widmg.heatmap_layout[0].index(column)] if classes else None
+    widmg.heatmap_window.title(f"Tab Validation - Joint {joint_number} {column}: {value} ({value_class or 'empty'})")
+
+def on_heatmap_click(event, widmg, datmg, root):
+    cell = get_heatmap_cell(event, widmg)
+    if cell is not None and widmg.joint_entry_widgets:
+        jump_to_joint(widmg, datmg, root, cell[0])
 
 
 def update_report_data(widmg, datmg, root):
@@ -2549,8 +4213,14 @@ def update_report_data(widmg, datmg, root):
     joint_data = datmg.json_data_dict['report_data'][active_tab]['joint_data']
 
     max_joint_number = int(widmg.update_rows_entry_widget.get())
+    old_joint_count = datmg.json_data_dict['report_data'][active_tab].get('joint_count')
     datmg.json_data_dict['report_data'][active_tab]['joint_count'] = int(widmg.update_rows_entry_widget.get())
     keys_to_delete = [key for key in joint_data.keys() if int(key.split('_')[1]) > max_joint_number]
+    # Trimming is one undo step, the row count rides along as an entry with no joint_key
+    step = [(active_tab, key, JointEditHistory.diff_joint_entry(joint_data[key], None)) for key in keys_to_delete]
+    if old_joint_count != max_joint_number:
+        step.append((active_tab, None, {'joint_count': (old_joint_count, max_joint_number)}))
+    datmg.edit_history.push(step)
     for key in keys_to_delete:
         del joint_data[key]
     datmg.save_dict_to_file()
@@ -2677,15 +4347,6 @@ def move_related_pdfs(excel_filename, pdf_abs_location, incomplete_reports_folde
 
 
 
-def delete_excel_from_incomplete_reports(datmg, excel_file, incomplete_reports_folder):
-    excel_filename = os.path.basename(excel_file)
-    old_excel_location = os.path.join(incomplete_reports_folder, excel_filename)
-    if os.path.exists(old_excel_location):
-        os.remove(old_excel_location)
-    if os.path.exists(datmg.json_tct_filepath):
-        os.remove(datmg.json_tct_filepath)
-
-
 def update_new_report_metadata(datmg, widmg, typrep):
     # Step 1: Clear the 'report_data' section but keep the key
     widmg.tab_data_header.set(typrep)
@@ -2699,6 +4360,7 @@ def update_new_report_metadata(datmg, widmg, typrep):
         datmg.json_data_dict['active_tab'] = 'Prop Subs Inp Report'
     else:
         raise ValueError("Invalid typrep value. Expected 'PDPIR', 'HWDP', or 'SUBS'.")
+    datmg.materialize_tab(datmg.json_data_dict['active_tab'])
 
 
 def hide_main_report_scrn_dp_tab_new_json(datmg, widmg, root):
@@ -2710,7 +4372,34 @@ def hide_main_report_scrn_dp_tab_new_json(datmg, widmg, root):
 
     create_report_metadata_input_widgets(widmg, datmg, root, editing=False)
 
-def open_continue_dp_report_window(widmg, datmg, root, workbook, excel_filepath, undo_filepath, undo_jsontct_filepath, pdf_filename, pdf_to_delete, report_type, incomplete_reports_folder, summary_data):
+def stage_nd_pdpir_export(widmg, datmg, root, workbook, excel_filepath, pdf_filename, summary_data, jsontct_filepath=None):
+    # Build the export into the staging folder; artifacts staged by an earlier attempt are reused
+    building = None
+    try:
+        staged_excel, excel_ready = datmg.get_staged_artifact('excel', excel_filepath)
+        if not excel_ready:
+            building = staged_excel
+            workbook.save(staged_excel)
+
+        staged_pdf, pdf_ready = datmg.get_staged_artifact('pdf', pdf_filename)
+        if not pdf_ready:
+            building = staged_pdf
+            generate_pdf_copy(summary_data, staged_pdf, widmg, datmg, root)
+
+        if jsontct_filepath is not None:
+            staged_tct, _ = datmg.get_staged_artifact('tct', jsontct_filepath)
+            building = staged_tct
+            datmg.save_tab_status_table_to_json(staged_tct)
+        building = None
+    except Exception as e:
+        if building is not None and os.path.exists(building):
+            os.remove(building)
+        logging.error(f"Error staging export files: {e}", exc_info=True)
+        messagebox.showerror("Error", f"Report files could not be created: {e}")
+        return False
+    return True
+
+def open_continue_dp_report_window(widmg, datmg, root, workbook, excel_filepath, jsontct_filepath, pdf_filename, pdf_to_delete, report_type, incomplete_reports_folder, summary_data):
     # Load the Excel workbook and access the "Data Sheet" tab
 
     # Create a new top-level window (this is the pop-up)
@@ -2762,66 +4451,56 @@ def open_continue_dp_report_window(widmg, datmg, root, workbook, excel_filepath,
         buttons[1].place(relx=0.5, rely=0.25, relheight=0.5, anchor="n", relwidth=0.25)
         buttons[2].place(relx=0.8, rely=0.25, relheight=0.5, anchor="n", relwidth=0.25)
 
-    def on_button_click(datmg, widmg, root, workbook, excel_filepath, report_type, new_window, pdf_to_delete, pdf_filename):
-        datmg.editing_spec_tab = False
-        if datmg.xel_file_path is None:
-            datmg.xel_file_path = datmg.new_excel_fp
+    def commit_to_incomplete_reports(excel_filepath):
+        if not stage_nd_pdpir_export(widmg, datmg, root, workbook, excel_filepath, pdf_filename, summary_data, jsontct_filepath):
+            return False
 
-        datmg.save_tab_status_table_to_json(datmg.json_tct_filepath)
-        
         excel_file = os.path.join(incomplete_reports_folder, os.path.basename(excel_filepath))
-        workbook.save(excel_file)
+        try:
+            datmg.commit_export_staging(
+                {'excel': excel_file, 'tct': jsontct_filepath, 'pdf': os.path.join(incomplete_reports_folder, pdf_filename)},
+                [datmg.xel_file_path, datmg.json_tct_filepath, pdf_to_delete])
+        except Exception as e:
+            logging.error(f"Error committing staged export: {e}", exc_info=True)
+            messagebox.showerror("Error", f"Report files could not be saved: {e}")
+            return False
+        datmg.xel_file_path = excel_file
+        datmg.json_tct_filepath = jsontct_filepath
+        return True
 
-        pdf_abs_location = os.path.join(incomplete_reports_folder, pdf_filename)
-        generate_pdf_copy(summary_data, pdf_abs_location, widmg, datmg, root)
-        
-        if pdf_to_delete is not None:
-            if os.path.exists(pdf_to_delete):
-                os.remove(pdf_to_delete)
-        
+    def on_button_click(datmg, widmg, root, workbook, excel_filepath, report_type, new_window, pdf_to_delete, pdf_filename):
+        if not commit_to_incomplete_reports(excel_filepath):
+            return
+        datmg.editing_spec_tab = False
 
         update_new_report_metadata(datmg, widmg, report_type)
         new_window.destroy()
         hide_main_report_scrn_dp_tab_new_json(datmg, widmg, root)
 
-    def close_to_edit_button_action(datmg, widmg, root, new_window, undo_filepath, undo_jsontct_filepath):
-        datmg.excel_files_tct[report_type]["Completed?"] = "No"
-
-        if datmg.xel_file_path is not None:
-            os.rename(datmg.xel_file_path, undo_filepath)
-            os.rename(datmg.json_tct_filepath, undo_jsontct_filepath)
-            datmg.xel_file_path = undo_filepath
-            datmg.json_tct_filepath = undo_jsontct_filepath
-            datmg.save_tab_status_table_to_json(datmg.json_tct_filepath)
+    def close_to_edit_button_action(datmg, widmg, root, new_window):
+        # Nothing was committed, so the live files are untouched; staged files stay for a retry
+        datmg.cancel_export_staging()
 
         # Close both windows
         new_window.destroy()
 
     def close_to_save_button_action(datmg, widmg, root, excel_filepath, new_window, pdf_to_delete):
-        excel_filepath = os.path.join(incomplete_reports_folder, os.path.basename(excel_filepath))
-        workbook.save(excel_filepath)
-        datmg.save_tab_status_table_to_json(datmg.json_tct_filepath)
-
-        pdf_abs_location = os.path.join(incomplete_reports_folder, pdf_filename)
-        generate_pdf_copy(summary_data, pdf_abs_location, widmg, datmg, root)
+        if not commit_to_incomplete_reports(excel_filepath):
+            return
 
-        if pdf_to_delete is not None:
-            if os.path.exists(pdf_to_delete):
-                os.remove(pdf_to_delete)
-        
         new_window.destroy()
         datmg.editing_spec_tab = False
         datmg.xel_file_path = None
         back_bridge_step(widmg, datmg, root)
         
-    new_window.protocol("WM_DELETE_WINDOW", lambda: close_to_edit_button_action(datmg, widmg, root, new_window, undo_filepath, undo_jsontct_filepath))
+    new_window.protocol("WM_DELETE_WINDOW", lambda: close_to_edit_button_action(datmg, widmg, root, new_window))
 
     # Add a close button to close the pop-up window, place it near the bottom
     close_to_save_button = ttk.Button(new_window, text=f"Save {widmg.tab_data_header.get()} Report and Go To HOME Screen", command=lambda: close_to_save_button_action(datmg, widmg, root, excel_filepath, new_window, pdf_to_delete))    
     close_to_save_button.place(relx=0.5, rely=0.635, relwidth=0.75, relheight=0.15, anchor="n")  # Center it at the bottom
 
     # Add a close button to close the pop-up window, place it near the bottom
-    close_to_edit_button = ttk.Button(new_window, text=f"Continue Editing {widmg.tab_data_header.get()} Report", command=lambda: close_to_edit_button_action(datmg, widmg, root, new_window, undo_filepath, undo_jsontct_filepath))    
+    close_to_edit_button = ttk.Button(new_window, text=f"Continue Editing {widmg.tab_data_header.get()} Report", command=lambda: close_to_edit_button_action(datmg, widmg, root, new_window))    
     close_to_edit_button.place(relx=0.5, rely=0.80, relwidth=0.75, relheight=0.15, anchor="n")  # Center it at the bottom
 
 
@@ -2829,6 +4508,9 @@ def open_continue_dp_report_window(widmg, datmg, root, workbook, excel_filepath,
 
 def confirm_joints_button(widmg, datmg, root, confirmation_window):
     update_report_data(widmg, datmg, root)
+    if not confirm_export_with_invalid_cells(datmg):
+        return
+    datmg.flush_saves()
     metadata = datmg.json_data_dict['report_user_metadata']
     report_data = datmg.json_data_dict["report_data"]
 
@@ -2850,104 +4532,50 @@ def confirm_joints_button(widmg, datmg, root, confirmation_window):
 
     if metadata['branch'] == "ND":
         if metadata['report_type'] == 'Drill Pipe Inspection Report':
-            workbook, undo_filepath, undo_jsontct_filepath, pdf_to_delete, pdffilename = create_modify_excel_document_nd_pdpir(incomplete_reports_folder, widmg, datmg, root)
-            excel_filepath = datmg.xel_file_path if datmg.xel_file_path is not None else datmg.new_excel_fp
-           
-            if metadata['active_tab'] == 'Prop Drill Pipe Inp Report':
-                report_type = "PDPIR"
-                write_report_data_all_nd_pdpir(datmg, report_data, workbook, metadata['active_tab'])
-                tot_joints = len(report_data)
-                summary_data = generate_summary_entry_nd_dp(tot_joints, datmg.keyword_tally_dict, datmg)
+            report_types = {'Prop Drill Pipe Inp Report': "PDPIR", 'Prop HWDP Inp Report': "HWDP", 'Prop Subs Inp Report': "SUBS"}
+            if metadata['active_tab'] in report_types:
+                report_type = report_types[metadata['active_tab']]
+                fingerprint = zlib.crc32(json.dumps(
+                    [metadata, report_data, datmg.xel_file_path, datmg.json_tct_filepath, datmg.editing_spec_tab, widmg.update_rows_entry_widget.get()],
+                    sort_keys=True, default=str).encode('utf-8'))
+                plan = datmg.begin_export_staging(incomplete_reports_folder, fingerprint)
+
+                if plan['result'] is None:
+                    workbook, excel_filepath, jsontct_filepath, pdf_to_delete, pdffilename = create_modify_excel_document_nd_pdpir(incomplete_reports_folder, widmg, datmg, root)
+                    write_report_data_all_nd_pdpir(datmg, report_data, workbook, metadata['active_tab'])
+                    tot_joints = len(report_data)
+                    summary_data = generate_summary_entry_nd_dp(tot_joints, datmg.keyword_tally_dict, datmg)
+                    plan['result'] = (workbook, excel_filepath, jsontct_filepath, pdf_to_delete, pdffilename, summary_data)
+                    plan['tab_status_built'] = datmg.copy_tab_status_table()
+                else:
+                    workbook, excel_filepath, jsontct_filepath, pdf_to_delete, pdffilename, summary_data = plan['result']
                 check_and_update_dpnd_complete(datmg, report_type)
 
                 if datmg.excel_files_tct["REPORT_COMPLETE"] == "Incomplete":
-                    open_continue_dp_report_window(widmg, datmg, root, workbook, excel_filepath, undo_filepath, undo_jsontct_filepath, pdffilename, pdf_to_delete, report_type, incomplete_reports_folder, summary_data)
+                    open_continue_dp_report_window(widmg, datmg, root, workbook, excel_filepath, jsontct_filepath, pdffilename, pdf_to_delete, report_type, incomplete_reports_folder, summary_data)
                 else:
-
                     folder_selected = filedialog.askdirectory(title='Select Folder to save Report Files')
                     if not folder_selected:
-                        if datmg.xel_file_path is not None:
-                            os.rename(datmg.xel_file_path, undo_filepath)
-                            os.rename(datmg.json_tct_filepath, undo_jsontct_filepath)
-                            datmg.xel_file_path = undo_filepath
-                            datmg.json_tct_filepath = undo_jsontct_filepath
-                            datmg.save_tab_status_table_to_json(datmg.json_tct_filepath)
+                        datmg.cancel_export_staging()
                         messagebox.showerror("Error", "Please select folder to store excel report.")
                         confirmation_window.destroy()
                         return
-                    excel_filepath = os.path.join(folder_selected, os.path.basename(excel_filepath))
-                    pdf_abs_location = os.path.join(folder_selected, pdffilename)
-                    generate_pdf_copy(summary_data, pdf_abs_location, widmg, datmg, root)
-                    move_related_pdfs(excel_filepath, pdf_abs_location, incomplete_reports_folder, folder_selected)
-                    delete_excel_from_incomplete_reports(datmg, excel_filepath, incomplete_reports_folder)
-                    workbook.save(excel_filepath)
-                    messagebox.showinfo("Success", f"{excel_filepath} Saved Successfully to {folder_selected}" )
-                    datmg.editing_spec_tab = False
-                    back_bridge_step(widmg, datmg, root)
-                # write_summary_notes_nd_dp()
-
-
-            elif metadata['active_tab'] == 'Prop HWDP Inp Report':
-                report_type = "HWDP"
-                write_report_data_all_nd_pdpir(datmg, report_data, workbook, metadata['active_tab'])
-                tot_joints = len(report_data)
-                summary_data = generate_summary_entry_nd_dp(tot_joints, datmg.keyword_tally_dict, datmg)
-                check_and_update_dpnd_complete(datmg, report_type)
-
-
-                if datmg.excel_files_tct["REPORT_COMPLETE"] == "Incomplete":
-                    open_continue_dp_report_window(widmg, datmg, root, workbook, excel_filepath, undo_filepath, undo_jsontct_filepath, pdffilename, pdf_to_delete, report_type, incomplete_reports_folder, summary_data)
-                else:
-                    excel_filepath = datmg.xel_file_path if datmg.xel_file_path is not None else datmg.new_excel_fp
-                    folder_selected = filedialog.askdirectory(title='Select Folder to save Report Files')
-                    if not folder_selected:
-                        if datmg.xel_file_path is not None:
-                            os.rename(datmg.xel_file_path, undo_filepath)
-                            os.rename(datmg.json_tct_filepath, undo_jsontct_filepath)
-                            datmg.xel_file_path = undo_filepath
-                            datmg.json_tct_filepath = undo_jsontct_filepath
-                            datmg.save_tab_status_table_to_json(datmg.json_tct_filepath)
-                        messagebox.showerror("Error", "Please select folder to store excel report.")
+                    if not stage_nd_pdpir_export(widmg, datmg, root, workbook, excel_filepath, pdffilename, summary_data):
+                        datmg.cancel_export_staging()
                         confirmation_window.destroy()
                         return
                     excel_filepath = os.path.join(folder_selected, os.path.basename(excel_filepath))
                     pdf_abs_location = os.path.join(folder_selected, pdffilename)
-                    generate_pdf_copy(summary_data, pdf_abs_location, widmg, datmg, root)
-                    move_related_pdfs(excel_filepath, pdf_abs_location, incomplete_reports_folder, folder_selected)
-                    delete_excel_from_incomplete_reports(datmg, excel_filepath, incomplete_reports_folder)
-                    workbook.save(excel_filepath)
-                    messagebox.showinfo("Success", f"{excel_filepath} Saved Successfully to {folder_selected}" )
-                    datmg.editing_spec_tab = False
-                    back_bridge_step(widmg, datmg, root)
-
-            elif metadata['active_tab'] == 'Prop Subs Inp Report':
-                report_type = "SUBS"
-                write_report_data_all_nd_pdpir(datmg, report_data, workbook, metadata['active_tab'])
-                tot_joints = len(report_data)
-                summary_data = generate_summary_entry_nd_dp(tot_joints, datmg.keyword_tally_dict, datmg)
-                check_and_update_dpnd_complete(datmg, report_type)
-
-                if datmg.excel_files_tct["REPORT_COMPLETE"] == "Incomplete":
-                    open_continue_dp_report_window(widmg, datmg, root, workbook, excel_filepath, undo_filepath, undo_jsontct_filepath, pdffilename, pdf_to_delete, report_type, incomplete_reports_folder, summary_data)
-                else:
-                    excel_filepath = datmg.xel_file_path if datmg.xel_file_path is not None else datmg.new_excel_fp
-                    folder_selected = filedialog.askdirectory(title='Select Folder to save Report Files')
-                    if not folder_selected:
-                        if datmg.xel_file_path is not None:
-                            os.rename(datmg.xel_file_path, undo_filepath)
-                            os.rename(datmg.json_tct_filepath, undo_jsontct_filepath)
-                            datmg.xel_file_path = undo_filepath
-                            datmg.json_tct_filepath = undo_jsontct_filepath
-                            datmg.save_tab_status_table_to_json(datmg.json_tct_filepath)
-                        messagebox.showerror("Error", "Please select folder to store excel report.")
+                    try:
+                        datmg.commit_export_staging({'excel': excel_filepath, 'pdf': pdf_abs_location},
+                                                    [datmg.xel_file_path, datmg.json_tct_filepath])
+                    except Exception as e:
+                        logging.error(f"Error committing staged export: {e}", exc_info=True)
+                        datmg.cancel_export_staging()
+                        messagebox.showerror("Error", f"Report files could not be saved: {e}")
                         confirmation_window.destroy()
                         return
-                    excel_filepath = os.path.join(folder_selected, os.path.basename(excel_filepath))
-                    pdf_abs_location = os.path.join(folder_selected, pdffilename)
-                    generate_pdf_copy(summary_data, pdf_abs_location, widmg, datmg, root)
                     move_related_pdfs(excel_filepath, pdf_abs_location, incomplete_reports_folder, folder_selected)
-                    delete_excel_from_incomplete_reports(datmg, excel_filepath, incomplete_reports_folder)
-                    workbook.save(excel_filepath)
                     messagebox.showinfo("Success", f"{excel_filepath} Saved Successfully to {folder_selected}" )
                     datmg.editing_spec_tab = False
                     back_bridge_step(widmg, datmg, root)
@@ -3055,6 +4683,206 @@ def find_highest_joint_num_for_export(widmg, datmg, root):
 
 
 
+def compile_row_formula(formula):
+    # Split a template formula once into literal text and relative row numbers, so cloning it to
+    # another row is a join instead of a full re-tokenize per cell
+    parts = ['=']
+    for token in Tokenizer(formula).items:
+        if token.type == Token.OPERAND and token.subtype == Token.RANGE:
+            sheet_prefix, bang, reference = token.value.rpartition('!')
+            parts.append(sheet_prefix + bang)
+            position = 0
+            for match in re.finditer(r'(\$?[A-Za-z]{1,3})(\$?)(\d+)', reference):
+                parts.append(reference[position:match.end(2)])
+                if match.group(2):
+                    parts.append(match.group(3))
+                else:
+                    parts.append(int(match.group(3)))
+                position = match.end()
+            parts.append(reference[position:])
+        else:
+            parts.append(token.value)
+
+    # Merge neighbouring literal text so rendering only joins a handful of pieces
+    merged = []
+    for part in parts:
+        if isinstance(part, str) and merged and isinstance(merged[-1], str):
+            merged[-1] += part
+        elif part != '':
+            merged.append(part)
+    return merged
+
+
+def render_row_formula(parts, row_delta):
+    return ''.join(part if isinstance(part, str) else str(part + row_delta) for part in parts)
+
+
+def extend_template_rows(sheet, template_row, last_row):
+    # Grow a report sheet past its template capacity by cloning the styled template row in bulk.
+    # Formulas are shifted like an Excel fill-down and numeric joint counters continue their series
+    column_templates = []
+    for template_cell in sheet[template_row]:
+        value = template_cell.value
+        previous_value = sheet.cell(row=template_row - 1, column=template_cell.column).value
+        if isinstance(value, str) and value.startswith('='):
+            kind, payload = 'formula', compile_row_formula(value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool) and isinstance(previous_value, (int, float)):
+            kind, payload = 'series', (value, value - previous_value)
+        else:
+            kind, payload = 'value', value
+        if value is None and not template_cell.has_style:
+            continue
+        column_templates.append((template_cell.column, template_cell._style, kind, payload))
+
+    row_height = sheet.row_dimensions[template_row].height
+    merged_in_row = [merged for merged in sheet.merged_cells.ranges if merged.min_row == merged.max_row == template_row]
+
+    for row in range(template_row + 1, last_row + 1):
+        row_delta = row - template_row
+        for column, style, kind, payload in column_templates:
+            cell = sheet.cell(row=row, column=column)
+            cell._style = copy(style)
+            if kind == 'formula':
+                cell.value = render_row_formula(payload, row_delta)
+            elif kind == 'series':
+                cell.value = payload[0] + payload[1] * row_delta
+            elif payload is not None:
+                cell.value = payload
+        if row_height is not None:
+            sheet.row_dimensions[row].height = row_height
+        for merged in merged_in_row:
+            sheet.merge_cells(start_row=row, start_column=merged.min_col, end_row=row, end_column=merged.max_col)
+
+
+range_reference_pattern = re.compile(r'^(\$?[A-Za-z]{1,3}\$?)(\d+):(\$?[A-Za-z]{1,3})(\$?)(\d+)$')
+range_end_pattern = re.compile(r':\$?[A-Za-z]{1,3}\$?(\d+)')
+
+def widen_range_reference(reference, template_last_row, last_row, absolute_only=False):
+    # 'B9:B1008' becomes 'B9:B{last_row}' when the range ends on or past the template's last row
+    match = range_reference_pattern.match(reference)
+    if match is None or (absolute_only and not match.group(4)):
+        return reference
+    start_row, end_row = int(match.group(2)), int(match.group(5))
+    if start_row > template_last_row or not template_last_row <= end_row < last_row:
+        return reference
+    return f"{match.group(1)}{start_row}:{match.group(3)}{match.group(4)}{last_row}"
+
+
+def widen_formula_ranges(formula, own_title, grown_title, template_last_row, last_row, absolute_only=False):
+    # Only ranges on the grown sheet are touched, the formula comes back unchanged when none are
+    # Most formulas end no range near the template's last row, those skip the tokenizer
+    if not any(template_last_row <= int(end_row) < last_row for end_row in range_end_pattern.findall(formula)):
+        return formula
+    body = formula if formula.startswith('=') else '=' + formula
+    parts = []
+    changed = False
+    for token in Tokenizer(body).items:
+        value = token.value
+        if token.type == Token.OPERAND and token.subtype == Token.RANGE:
+            sheet_prefix, bang, reference = value.rpartition('!')
+            target_title = sheet_prefix.strip("'").replace("''", "'") if bang else own_title
+            if target_title == grown_title:
+                widened = widen_range_reference(reference, template_last_row, last_row, absolute_only)
+                if widened != reference:
+                    value = sheet_prefix + bang + widened
+                    changed = True
+        parts.append(value)
+    if not changed:
+        return formula
+    return ('=' if formula.startswith('=') else '') + ''.join(parts)
+
+
+def widen_template_ranges(sheet, template_last_row, last_row):
+    # Counts, COUNTIFS on the summary sheets, conditional formats and validations written for the
+    # template's rows are stretched over the cloned rows, as Excel does when rows are inserted.
+    # On the template row itself only $-anchored ends are stretched, a relative end there is a fill-down
+    for worksheet in sheet.parent.worksheets:
+        # Only cells that exist, iter_rows would create every empty cell in the used range
+        for cell in list(worksheet._cells.values()):
+            value = cell.value
+            absolute_only = worksheet is sheet and cell.row >= template_last_row
+            if isinstance(value, str) and value.startswith('='):
+                widened = widen_formula_ranges(value, worksheet.title, sheet.title, template_last_row, last_row, absolute_only)
+                if widened is not value:
+                    cell.value = widened
+            elif isinstance(value, ArrayFormula) and isinstance(value.text, str):
+                value.text = widen_formula_ranges(value.text, worksheet.title, sheet.title, template_last_row, last_row, absolute_only)
+
+        widened_formatting = ConditionalFormattingList()
+        widened_formatting.max_priority = worksheet.conditional_formatting.max_priority
+        for formatting in worksheet.conditional_formatting:
+            sqref = str(formatting.sqref)
+            if worksheet is sheet:
+                sqref = " ".join(widen_range_reference(reference, template_last_row, last_row) for reference in sqref.split())
+            for rule in formatting.rules:
+                rule.formula = [widen_formula_ranges(formula, worksheet.title, sheet.title, template_last_row, last_row) for formula in rule.formula]
+                widened_formatting._cf_rules.setdefault(ConditionalFormatting(sqref), []).append(rule)
+        worksheet.conditional_formatting = widened_formatting
+
+    for validation in sheet.data_validations.dataValidation:
+        validation.sqref = MultiCellRange(" ".join(widen_range_reference(reference, template_last_row, last_row) for reference in str(validation.sqref).split()))
+
+
+def fit_sheet_to_joint_count(sheet, template_last_row, last_data_row):
+    # Trim unused template rows, or clone the template row when the tab outgrows the template
+    rows_to_delete = template_last_row - last_data_row
+    if rows_to_delete > 0:
+        sheet.delete_rows(last_data_row + 1, rows_to_delete)
+    elif last_data_row > template_last_row:
+        widen_template_ranges(sheet, template_last_row, last_data_row)
+        extend_template_rows(sheet, template_last_row, last_data_row)
+
+
+def benchmark_template_growth(joint_counts=(5000, 10000), template_path='DATE_INV_Inch DP Inspection_OPERATOR_CONTRACTOR.xlsx', sheet_name='Prop Drill Pipe Inp Report'):
+    # Time growing the drill pipe template to large joint counts, filling it, and saving it
+    results = {}
+    with tempfile.TemporaryDirectory() as bench_dir:
+        for joint_count in joint_counts:
+            wb = openpyxl.load_workbook(template_path)
+            sheet = wb[sheet_name]
+
+            start_time = time.perf_counter()
+            fit_sheet_to_joint_count(sheet, 1008, joint_count + 8)
+            extend_ms = (time.perf_counter() - start_time) * 1000
+
+            start_time = time.perf_counter()
+            for joint_num in range(1, joint_count + 1):
+                row_num = 9 + joint_num - 1
+                sheet[f"BG{row_num}"] = f"SN{joint_num}"
+                sheet[f"BT{row_num}"] = "362"
+            write_ms = (time.perf_counter() - start_time) * 1000
+
+            start_time = time.perf_counter()
+            wb.save(os.path.join(bench_dir, f"benchmark_{joint_count}.xlsx"))
+            save_ms = (time.perf_counter() - start_time) * 1000
+
+            results[joint_count] = {"extend_ms": extend_ms, "write_ms": write_ms, "save_ms": save_ms}
+    return results
+
+
+def benchmark_report_export(joint_count=1000):
+    # Time the per-joint cost of each exporter writing typical shorthand into its template sheet
+    pipe_joint = {"BOX": "TS 6 5/8 HB", "PIN": "MT 7 DS R1 123456", "TUBE": "MW", "UT": "0.350", "SERIAL": "1234",
+                  "ID": "3 1/4", "OD": "6 5/8", "TS-BOX": "", "TS-PIN": "", "DESCRIPTION": "", "COMMENTS": ""}
+    tubing_joint = {"BOX": "HB", "PIN": "", "TUBE": "SC 0.125 1234", "UT": "0.250", "COMMENTS": "", "Visual OD": "2 7/8"}
+    exporters = [
+        ("TX FD", process_for_write_report_tx_pdpir_fd, 'DATE_INV_Inch DP Inspection_OPERATOR_CONTRACTOR_FullDimensional_LnkFix.xlsx', 'Prop Drill Pipe Inp Report', pipe_joint, 9),
+        ("TX CL2 DBR", process_for_write_report_tx_pdpir_cl2dbr, 'DATE_INV_Inch DP Inspection_OPERATOR_CONTRACTOR_CL2DBR_Test.xlsx', 'Prop Drill Pipe Inp Report', pipe_joint, 9),
+        ("ND PDPIR", process_for_write_report_nd_pdpir, 'DATE_INV_Inch DP Inspection_OPERATOR_CONTRACTOR.xlsx', 'Prop Drill Pipe Inp Report', pipe_joint, 9),
+        ("ND Tubing", process_for_write_report_nd_tubing, 'DATE_INV_PRODUCER_2.375_2.875_Tubing_WELL_Grade_JTSJts.xlsx', 'Tubing Insp Report', tubing_joint, 10),
+    ]
+    results = {}
+    for label, exporter, template_path, sheet_name, joint_values, first_row in exporters:
+        sheet = openpyxl.load_workbook(template_path)[sheet_name]
+        datmg = SimpleNamespace(json_data_dict={'report_user_metadata': {'active_tab': sheet_name}},
+                                keyword_tally_dict={"Keyword Tallies": {}, "Joint Tallies": {}})
+        start_time = time.perf_counter()
+        for row_num in range(first_row, first_row + joint_count):
+            exporter(joint_values, row_num, sheet, datmg)
+        results[label] = (time.perf_counter() - start_time) * 1e6 / joint_count
+    return results
+
+
 def create_modify_excel_document_nd_tubing(folder_selected, widmg, datmg, root):
     if datmg.xel_file_path is None:
         wb = openpyxl.load_workbook('DATE_INV_PRODUCER_2.375_2.875_Tubing_WELL_Grade_JTSJts.xlsx')
@@ -3096,9 +4924,7 @@ def create_modify_excel_document_nd_tubing(folder_selected, widmg, datmg, root):
     total_joint_count = int(widmg.update_rows_entry_widget.get())
     total_joints = total_joint_count + 10
     prop_sheet = wb['Tubing Insp Report']
-    rows_to_delete = 709 - total_joints + 1
-    if rows_to_delete > 0:
-        prop_sheet.delete_rows(total_joints, rows_to_delete)
+    fit_sheet_to_joint_count(prop_sheet, 709, total_joints - 1)
     
     sheet_index = wb.sheetnames.index('Tubing Insp Report')       
     wb.active = sheet_index
@@ -3126,8 +4952,6 @@ def create_modify_excel_document_nd_pdpir(folder_selected, widmg, datmg, root):
     # Assuming you have the path to your Excel file in datmg.xel_file_path
     metadata = datmg.json_data_dict['report_user_metadata']
     pdf_to_delete = None
-    undo_filepath = None 
-    undo_jsontct_filepath = None 
 
     if datmg.xel_file_path is None:
         wb = openpyxl.load_workbook('DATE_INV_Inch DP Inspection_OPERATOR_CONTRACTOR.xlsx')
@@ -3139,8 +4963,6 @@ def create_modify_excel_document_nd_pdpir(folder_selected, widmg, datmg, root):
         }
     else:
         wb = openpyxl.load_workbook(datmg.xel_file_path)
-        undo_filepath = datmg.xel_file_path
-        undo_jsontct_filepath = datmg.json_tct_filepath
 
 
 
@@ -3240,16 +5062,15 @@ def create_modify_excel_document_nd_pdpir(folder_selected, widmg, datmg, root):
 
     if metadata['active_tab'] == 'Prop Drill Pipe Inp Report':
         prop_sheet = wb['Prop Drill Pipe Inp Report']
-        rows_to_delete = 1008 - total_joints + 1
+        template_last_row = 1008
     elif metadata['active_tab'] == 'Prop HWDP Inp Report':
         prop_sheet = wb['Prop HWDP Inp Report']
-        rows_to_delete = 608 - total_joints + 1
+        template_last_row = 608
     elif metadata['active_tab'] == 'Prop Subs Inp Report':
         prop_sheet = wb['Prop Subs Inp Report']
-        rows_to_delete = 158 - total_joints + 1
+        template_last_row = 158
 
-    if rows_to_delete > 0:
-        prop_sheet.delete_rows(total_joints, rows_to_delete)
+    fit_sheet_to_joint_count(prop_sheet, template_last_row, total_joints - 1)
 
     wb.active = sheet_index
 
@@ -3282,26 +5103,21 @@ def create_modify_excel_document_nd_pdpir(folder_selected, widmg, datmg, root):
         # Replace the count in the filename
         new_filename = re.sub(r'(\d+)JTS', f'{new_count}JTS', filename)
         new_jsontct_filename = re.sub(r'(\d+)JTS', f'{new_tct_count}JTS', json_tct_filename)
+        # The live files keep their names until the staged export is committed
         new_file_path = os.path.join(folder_selected, new_filename)
         new_jsontct_file_path = os.path.join(folder_selected, new_jsontct_filename)
 
-        # Rename the existing file to the new filename
-        os.rename(datmg.xel_file_path, new_file_path)
-        os.rename(datmg.json_tct_filepath, new_jsontct_file_path)
-        datmg.xel_file_path = new_file_path
-        datmg.json_tct_filepath = new_jsontct_file_path
-
-
     else:
         base_full_path = os.path.join(folder_selected, f"{metadata['date_choice'].replace('/', '.')}_INV{metadata['invoice_choice']}_{metadata['connection_size_choice']} Inch {typrep} Inspection Report_{metadata['operator_choice']}_{metadata['contractor_choice']}_{total_joint_count}JTS")
-        datmg.new_excel_fp = f"{base_full_path}.xlsx"
-        datmg.json_tct_filepath = f"{base_full_path}_tct.json"
+        new_file_path = f"{base_full_path}.xlsx"
+        new_jsontct_file_path = f"{base_full_path}_tct.json"
+        datmg.new_excel_fp = new_file_path
  
 
     pdffilename = f"{metadata['date_choice'].replace('/', '.')}_INV{metadata['invoice_choice']}_{metadata['connection_size_choice']} Inch {pdf_typrep} Inspection Report_{metadata['operator_choice']}_{metadata['contractor_choice']}_{total_joint_count}JTS_PDF-COPY.pdf"
 
 
-    return wb, undo_filepath, undo_jsontct_filepath, pdf_to_delete, pdffilename
+    return wb, new_file_path, new_jsontct_file_path, pdf_to_delete, pdffilename
 
 
 
@@ -3389,16 +5205,15 @@ def create_modify_excel_document_tx_multi(folder_selected, widmg, datmg, root):
 
     if metadata['active_tab'] == 'Prop Drill Pipe Inp Report':
         prop_sheet = wb['Prop Drill Pipe Inp Report']
-        rows_to_delete = 1008 - total_joints + 1
+        template_last_row = 1008
     elif metadata['active_tab'] == 'Prop HWDP Inp Report':
         prop_sheet = wb['Prop HWDP Inp Report']
-        rows_to_delete = 608 - total_joints + 1
+        template_last_row = 608
     elif metadata['active_tab'] == 'Prop Subs Inp Report':
         prop_sheet = wb['Prop Subs Inp Report']
-        rows_to_delete = 608 - total_joints + 1
+        template_last_row = 608
 
-    if rows_to_delete > 0:
-        prop_sheet.delete_rows(total_joints, rows_to_delete)
+    fit_sheet_to_joint_count(prop_sheet, template_last_row, total_joints - 1)
 
     if 'Prop Drill Pipe Inp Report' in wb.sheetnames:
         typrep = 'DP'
@@ -3460,1364 +5275,867 @@ def create_modify_excel_document_tx_multi(folder_selected, widmg, datmg, root):
     pdf_abs_location = os.path.join(folder_selected, pdffilename)
     return pdf_abs_location
 
-def process_for_write_report_tx_pdpir_fd(joint_values, row_num, sheet, datmg):
-    reptyp = datmg.json_data_dict['report_user_metadata']['active_tab']
+shorthand_fraction_pattern = re.compile(r'(\d+)\s(\d+/\d+)')
+shorthand_number_pattern = re.compile(r'^(\d+(\.\d+)?|\d+|\d+\s\d+/\d+|\d+/\d+)$')
+shorthand_measure_pattern = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
+shorthand_cell_cache = {}
+shorthand_cell_cache_limit = 20000
+shorthand_column_maps = {}
+
+
+def compile_shorthand_cell(col_value):
+    # Tokens are (text, display, is_number, is_measure, digit_count); the same shorthand repeats
+    # across hundreds of joints so each distinct cell is only split and typed once
+    compiled = shorthand_cell_cache.get(col_value)
+    if compiled is None:
+        cell_text = shorthand_fraction_pattern.sub(r'\1_\2', col_value)
+        tokens = []
+        first_index = {}
+        for i, text in enumerate(cell_text.split()):
+            display = text.replace('_', ' ')
+            tokens.append((text, display,
+                           shorthand_number_pattern.match(display) is not None,
+                           shorthand_measure_pattern.match(text) is not None,
+                           len(text) if text.isdigit() else 0))
+            first_index.setdefault(text, i)
+        compiled = (cell_text, tuple(tokens), first_index)
+        if len(shorthand_cell_cache) >= shorthand_cell_cache_limit:
+            shorthand_cell_cache.clear()
+        shorthand_cell_cache[col_value] = compiled
+    return compiled
+
+
+def shorthand_tally(group, keyword, per_column=True, capture=None, joint=None):
+    # Mark the keyword's tally column, optionally read the value that follows it, then count it
+    ops = [('mark', group, "X", None)]
+    if capture is not None:
+        ops.append(('capture',) + capture)
+    ops.append(('tally', keyword, per_column))
+    if joint is not None:
+        ops.append(('joint', joint))
+    return ops
+
+
+def shorthand_style(box_pin, columns):
+    # BOX and PIN share one keyword program; other columns are written straight through as
+    # 'raw' (as typed), 'display' (underscores back to spaces) or 'filled' (display, if not empty)
+    style = {'BOX': box_pin, 'PIN': box_pin}
+    style.update(columns)
+    return style
+
+
+def shorthand_program(keywords, critical_lengths=None, unrecognized='Not Recognized Keywords', numbers=None, serials=None):
+    return {'keywords': keywords, 'critical_lengths': critical_lengths, 'unrecognized': unrecognized,
+            'numbers': numbers, 'serials': serials}
+
+
+shorthand_r_keywords = ("R1", "R2", "R3", "R4")
+shorthand_unrecognized = [('mark', 'Not Recognized Keywords', None, None)]
+
+shorthand_styles = {
+    'tx_fd': shorthand_style(shorthand_program({
+            "TS": [('capture', 'Tong Space', None)],
+            "TJ": [('capture', 'Tool Joint', None)],
+            "BD": [('capture', 'Bevel Diameter', None)],
+            "MT": shorthand_tally('MT Tally', "MT", capture=('Tong Space', None)),
+            "MS": shorthand_tally('MS Tally', "MS"),
+            "DS": shorthand_tally('DS Tally', "DS"),
+            "DT": shorthand_tally('DT Tally', "DT"),
+            "DTS": shorthand_tally('DTS Tally', "DTS"),
+            "PIT": shorthand_tally('PIT Tally', "PIT"),
+            "OR": shorthand_tally('OR Tally', "OR"),
+            "DHB": shorthand_tally('DHB Tally', "DHB"),
+            "HB": shorthand_tally('HB Tally', "HB"),
+            "DBRHB": shorthand_tally('DBRHB Tally', "DBRHB"),
+            "HBCP": shorthand_tally('HBCP Tally', "HBCP"),
+            "MOD": shorthand_tally('MOD Tally', "MOD", False, capture=('Tool Joint', 'BOX')),
+            "R1": [('mark', 'R Tally', "X", None), ('mark', 'R Type', 1, None), ('r_value', 'R Value', shorthand_r_keywords), ('tally', "R1", True)],
+            "R2": [('mark', 'R Tally', "X", None), ('mark', 'R Type', 2, None), ('r_value', 'R Value', shorthand_r_keywords), ('tally', "R2", True)],
+            "R3": [('mark', 'R Tally', "X", None), ('mark', 'R Type', 3, None), ('r_value', 'R Value', shorthand_r_keywords), ('tally', "R3", True)],
+            "R4": [('mark', 'R Tally', "X", None), ('mark', 'R Type', 4, None), ('r_value', 'R Value', shorthand_r_keywords), ('tally', "R4", True)],
+            "ODAM": [('tab', 'Prop Drill Pipe Inp Report', [('mark', 'BOX/PIN Other Damages Tally', "X", None)], shorthand_unrecognized), ('tally', "ODAM", True)],
+            "ODAM1": shorthand_tally('Other Damages 1', "ODAM1", False),
+            "ODAM2": shorthand_tally('Other Damages 2', "ODAM2", False),
+            "ODAM3": shorthand_tally('Other Damages 3', "ODAM3", False),
+            "ODAM4": [('tab', 'Prop Drill Pipe Inp Report', [('mark', 'Other Damages 4', "X", None)], shorthand_unrecognized), ('tally', "ODAM4", False)],
+            "TR": shorthand_tally('TR Tally', "TR"),
+            "BVR": shorthand_tally('BVR Tally', "BVR"),
+        }, critical_lengths='Critical Lengths'), {
+        'TUBE': shorthand_program({
+            "MW": shorthand_tally('MW Tally', "MW", False),
+            "MOD": shorthand_tally('MOD Tally', "MOD", False, capture=('Tool Joint', 'BOX')),
+            "DAM": shorthand_tally('DAM Tally', "DAM", False),
+            "EMI": shorthand_tally('EMI Tally', "EMI", False),
+            "OTHER": shorthand_tally('OTHER Tally', "OTHER", False),
+            "BNT": shorthand_tally('BNT Tally', "BNT", False),
+            "BENT": shorthand_tally('BNT Tally', "BNT", False),
+            "ODAM1": shorthand_tally('Other Damages 1', "ODAM1"),
+            "ODAM2": shorthand_tally('Other Damages 2', "ODAM2"),
+            "ODAM3": shorthand_tally('Other Damages 3', "ODAM3"),
+            "ODAM4": [('tab', 'Prop Drill Pipe Inp Report', [('mark', 'Other Damages 4', "X", None)], shorthand_unrecognized), ('tally', "ODAM4", True)],
+        }),
+        'STRES REL GRV': shorthand_program({
+            "D": [('capture', 'Stress Relief Groove Diameter', None)],
+            "DIA": [('capture', 'Stress Relief Groove Diameter', None)],
+            "DIAMETER": [('capture', 'Stress Relief Groove Diameter', None)],
+            "L": [('capture', 'Stress Relief Groove Length', None)],
+            "LEN": [('capture', 'Stress Relief Groove Length', None)],
+            "LENGTH": [('capture', 'Stress Relief Groove Length', None)],
+        }, unrecognized=None),
+        'BORBAK': shorthand_program({
+            "D": [('capture', 'Boreback Dia', None)],
+            "DIA": [('capture', 'Boreback Dia', None)],
+            "L": [('capture', 'Boreback Length', None)],
+            "LEN": [('capture', 'Boreback Length', None)],
+        }, unrecognized=None),
+        'C BORE': shorthand_program({
+            "DEP": [('capture', 'C Bore Depth', None)],
+            "DEPTH": [('capture', 'C Bore Depth', None)],
+            "DE": [('capture', 'C Bore Depth', None)],
+            "DPTH": [('capture', 'C Bore Depth', None)],
+            "DIA": [('capture', 'C Bore Diameter', None)],
+            "DI": [('capture', 'C Bore Diameter', None)],
+            "DIAMETER": [('capture', 'C Bore Diameter', None)],
+            "DIAMTR": [('capture', 'C Bore Diameter', None)],
+        }, unrecognized=None),
+        'UT': ('raw', 'UT Value'),
+        'SERIAL': ('raw', 'Serial #'),
+        'DESCRIPTION': ('raw', 'Description'),
+        'SUBS CONN/DATA': ('raw', 'SUBS CONN/DATA'),
+        'COMMENTS': ('raw', 'COMMENTS'),
+        'ID': ('filled', 'Tool Joint'),
+        'OD': ('filled', 'Tool Joint'),
+        'TS-PIN': ('filled', 'Tong Space'),
+        'TS-BOX': ('filled', 'Tong Space'),
+        'BD-BOX': ('filled', 'Bevel Diameter'),
+        'BD-PIN': ('filled', 'Bevel Diameter'),
+        'SEAL WIDTH': ('display', 'Seal Width'),
+        'PIN NOSE DIA': ('display', 'Pin Nose Diameter'),
+    }),
+    'tx_cl2dbr': shorthand_style(shorthand_program({
+            "TS": [('capture', 'Tong Space', None)],
+            "TJ": [('capture', 'Tool Joint', None)],
+            "BD": [('capture', 'Bevel Diameter', None)],
+            "MT": shorthand_tally('MT Tally', "MT", capture=('Tong Space', None)),
+            "MBD": shorthand_tally('MBD Tally', "MBD", capture=('Bevel Diameter', None)),
+            "DS": shorthand_tally('DS Tally', "DS"),
+            "DT": shorthand_tally('DT Tally', "DT"),
+            "DTS": shorthand_tally('DTS Tally', "DTS"),
+            "PIT": shorthand_tally('PIT Tally', "PIT"),
+            "OR": shorthand_tally('OR Tally', "OR"),
+            "DHB": shorthand_tally('DHB Tally', "DHB"),
+            "HB": shorthand_tally('HB Tally', "HB"),
+            "DBRHB": shorthand_tally('DBRHB Tally', "DBRHB"),
+            "HBCP": shorthand_tally('HBCP Tally', "HBCP"),
+            "R1": [('mark', 'R Tally', "X", None), ('mark', 'R Type', 1, None), ('r_value', 'R Value', shorthand_r_keywords), ('tally', "R1", True)],
+            "R2": [('mark', 'R Tally', "X", None), ('mark', 'R Type', 2, None), ('r_value', 'R Value', shorthand_r_keywords), ('tally', "R2", True)],
+            "R3": [('mark', 'R Tally', "X", None), ('mark', 'R Type', 3, None), ('r_value', 'R Value', shorthand_r_keywords), ('tally', "R3", True)],
+            "R4": [('mark', 'R Tally', "X", None), ('mark', 'R Type', 4, None), ('r_value', 'R Value', shorthand_r_keywords), ('tally', "R4", True)],
+            "SW": shorthand_tally('SW Tally', "SW", False),
+            "SB": shorthand_tally('SB Tally', "SB", False, capture=('Tool Joint', 'BOX')),
+            "SP": shorthand_tally('SP Tally', "SP", False, capture=('Tool Joint', 'PIN')),
+            "ODAM": shorthand_tally('Other Damages Tally', "ODAM", False),
+        }, critical_lengths='Critical Lengths'), {
+        'TUBE': shorthand_program({
+            "MW": shorthand_tally('MW Tally', "MW", False),
+            "DAM": shorthand_tally('DAM Tally', "DAM", False),
+            "EMI": shorthand_tally('EMI Tally', "EMI", False),
+            "BNT": shorthand_tally('BNT Tally', "BNT", False),
+            "BENT": shorthand_tally('BNT Tally', "BNT", False),
+            "CRK": shorthand_tally('CRACKED Tally', "CRK", False),
+            "CL2": shorthand_tally('CLASS2 Tally', "CL2", False),
+            "UG": shorthand_tally('UG Tally', "UG", False),
+            "OTHER": shorthand_tally('OTHER DBR Tally', "OTHER", False),
+            "DHB": shorthand_tally('DHB Tally', "DHB", False),
+        }, critical_lengths='Critical Lengths'),
+        'UT': ('raw', 'UT Value'),
+        'SERIAL': ('raw', 'Serial #'),
+        'DESCRIPTION': ('raw', 'Description'),
+        'SUBS CONN/DATA': ('raw', 'SUBS CONN/DATA'),
+        'COMMENTS': ('raw', 'COMMENTS'),
+        'ID': ('filled', 'Tool Joint'),
+        'OD': ('filled', 'Tool Joint'),
+        'TS-PIN': ('filled', 'Tong Space'),
+        'TS-BOX': ('filled', 'Tong Space'),
+        'BD-BOX': ('filled', 'Bevel Diameter'),
+        'BD-PIN': ('filled', 'Bevel Diameter'),
+    }),
+    'nd_pdpir': shorthand_style(shorthand_program({
+            "TJ": [('capture', 'Tool Joint', None)],
+            "TS": [('capture', 'Tong Space', None)],
+            "BD": [('capture', 'Bevel Diameter', None)],
+            "MT": shorthand_tally('MT Tally', "MT", capture=('Tong Space', None), joint='Scrap'),
+            "MS": shorthand_tally('MS Tally', "MS", joint='Scrap'),
+            "DS": shorthand_tally('DS Tally', "DS", joint='Repairable'),
+            "DT": shorthand_tally('DT Tally', "DT", joint='Repairable'),
+            "OR": shorthand_tally('OR Tally', "OR", joint='Repairable'),
+            "DHB": shorthand_tally('DHB Tally', "DHB"),
+            "HB": shorthand_tally('HB Tally', "HB"),
+            "DBRHB": shorthand_tally('DBRHB Tally', "DBRHB"),
+            "HBCP": shorthand_tally('HBCP Tally', "HBCP"),
+            "MOD": shorthand_tally('MOD Tally', "MOD", False, capture=('Tool Joint', 'BOX')),
+            "R": [('mark', 'R Tally', "X", None), ('r_value', 'R Value', ("R",)), ('tally', "R", True)],
+            "SB": shorthand_tally('SB/SP Tally', "SB", False, capture=('Tool Joint', None), joint='Repairable'),
+            "SP": shorthand_tally('SB/SP Tally', "SP", False, capture=('Tool Joint', None), joint='Repairable'),
+            "LB": shorthand_tally('LB/LP Tally', "LB", False, capture=('Tool Joint', None), joint='Repairable'),
+            "LP": shorthand_tally('LB/LP Tally', "LP", False, capture=('Tool Joint', None), joint='Repairable'),
+            "ODAM": shorthand_tally('Other Damages Tally', "ODAM", joint='Repairable'),
+            "OTH": shorthand_tally('BOX/PIN Other Damages Tally', "OTH", joint='Repairable'),
+            "TR": shorthand_tally('TR Tally', "TR", joint='Repairable'),
+            "BVR": shorthand_tally('BVR Tally', "BVR", joint='Repairable'),
+        }, critical_lengths='Critical Lengths'), {
+        'TUBE': shorthand_program({
+            "MW": shorthand_tally('MW Tally', "MW", False, joint='Scrap'),
+            "MOD": shorthand_tally('MOD Tally', "MOD", False, capture=('Tool Joint', 'BOX'), joint='Scrap'),
+            "DAM": shorthand_tally('DAM Tally', "DAM", False, joint='Scrap'),
+            "EMI": shorthand_tally('EMI Tally', "EMI", False, joint='Scrap'),
+            "OTHER": shorthand_tally('OTHER Tally', "OTHER", False, joint='Scrap'),
+            "BNT": shorthand_tally('BNT Tally', "BNT", False, joint='Repairable'),
+            "BENT": shorthand_tally('BNT Tally', "BNT", False, joint='Repairable'),
+        }),
+        'UT': ('raw', 'UT Value'),
+        'SERIAL': ('raw', 'Serial #'),
+        'DESCRIPTION': ('raw', 'Description'),
+        'SUBS CONN/DATA': ('raw', 'SUBS CONN/DATA'),
+        'COMMENTS': ('raw', 'COMMENTS'),
+        'ID': ('filled', 'Tool Joint'),
+        'OD': ('filled', 'Tool Joint'),
+        'TS-PIN': ('filled', 'Tong Space'),
+        'TS-BOX': ('filled', 'Tong Space'),
+    }),
+    'nd_tubing': shorthand_style(shorthand_program({
+            "DP": [('flag', 'repair'), ('mark', 'DP', "DP", None), ('tally', "DP", False)],
+            "DB": [('flag', 'repair'), ('mark', 'DB', "DB", None), ('tally', "DB", False)],
+            "HB": [('flag', 'hb'), ('mark', 'Box/Pin', "HB", None), ('tally', "HB", True)],
+        }, numbers='Box/Pin'), {
+        'TUBE': shorthand_program({
+            "BNT": [('mark', 'Bent', "BENT", None), ('flag', 'repair'), ('tally', "BNT", False)],
+            "BT": [('mark', 'Bent', "BENT", None), ('flag', 'repair'), ('tally', "BNT", False)],
+            "DP": [('flag', 'repair'), ('mark', 'DP', "DP", None), ('tally', "DP", False)],
+            "DB": [('flag', 'repair'), ('mark', 'DB', "DB", None), ('tally', "DB", False)],
+            "BNTDBR": [('mark', 'Bent', "BENT DBR", None), ('flag', 'scrap'), ('tally', "BNTDBR", False)],
+            "BTDBR": [('mark', 'Bent', "BENT DBR", None), ('flag', 'scrap'), ('tally', "BNTDBR", False)],
+            "SC": [('flag', 'scrap'), ('mark', 'Tube Damage', "SC", None), ('capture', 'SC Measure', None), ('tally', "SC", False)],
+            "SCR": [('mark', 'Tube Damage', "SC-R", None), ('capture', 'SC Measure', None), ('tally', "SCR", False)],
+            "GOU": [('flag', 'scrap'), ('mark', 'Tube Damage', "GOU", None), ('capture', 'SC Measure', None), ('tally', "GOU", False)],
+            "TC": [('flag', 'scrap'), ('mark', 'Tube Damage', "TC", None), ('capture', 'SC Measure', None), ('tally', "TC", False)],
+            "MW": [('flag', 'scrap'), ('mark', 'Wall', "MW", None), ('tally', "MW", False)],
+            "RW": [('flag', 'scrap'), ('mark', 'Wall', "RW", None), ('tally', "RW", False)],
+            "PIT": [('flag', 'scrap'), ('mark', 'Wall', "Pit", None), ('tally', "PIT", False)],
+            "MASH": [('flag', 'scrap'), ('mark', 'Wall', "Mashed", None), ('tally', "MASH", False)],
+            "NODRIFT": [('flag', 'scrap'), ('mark', 'Drift', "NO", None), ('tally', "NODRIFT", False)],
+            "EMI": [('flag', 'scrap'), ('mark', 'EMI', "EMI", None), ('tally', "EMI", False)],
+            "OTHER": [('flag', 'scrap'), ('mark', 'Wall', "OTHER", None), ('tally', "OTHER", False)],
+            "BB": [('mark', 'BB', "X", None), ('tally', "BB", False)],
+            "YB": [('mark', 'YB', "X", None), ('tally', "YB", False)],
+        }, serials='Tube Serial'),
+        'UT': ('raw', 'UT'),
+        'COMMENTS': ('raw', 'COMMENTS'),
+        'Visual OD': ('display', 'Visual OD'),
+    }),
+}
+
+
+def shorthand_column_map(style_name, col_chooser, reptyp=None):
+    # Resolve an exporter's col_chooser letters for one tab into column numbers, once per export
+    # layout instead of once per joint. Groups with no entry for the tab are left out, so writing
+    # to them still raises KeyError as it did when the letters were looked up per write.
+    key = (style_name, reptyp)
+    columns = shorthand_column_maps.get(key)
+    if columns is None:
+        columns = {}
+        for group, group_columns in col_chooser.items():
+            columns[group] = {}
+            for col_name, letters in group_columns.items():
+                letter = letters.get(reptyp) if isinstance(letters, dict) else letters
+                if letter is not None:
+                    columns[group][col_name] = column_index_from_string(letter)
+        shorthand_column_maps[key] = columns
+    return columns
+
+
+def write_shorthand_joint(style, joint_values, row_num, sheet, datmg, columns, reptyp=None):
+    # Shared by every exporter; columns comes from shorthand_column_map so each exporter keeps its
+    # own layout. Returns the status flags raised by keywords.
+    cell = sheet.cell
     taldict = datmg.keyword_tally_dict["Keyword Tallies"]
     joint_dict = datmg.keyword_tally_dict["Joint Tallies"]
+    flags = set()
+
+    def run_ops(ops, col_name, keyword, tokens, first_index):
+        for op in ops:
+            kind = op[0]
+            if kind == 'mark':
+                cell(row=row_num, column=columns[op[1]][op[3] or col_name], value=keyword if op[2] is None else op[2])
+            elif kind == 'tally':
+                key = f"{op[1]}-{col_name}" if op[2] else op[1]
+                taldict[key] = taldict.get(key, 0) + 1
+            elif kind == 'capture':
+                index = first_index[keyword] + 1
+                if index < len(tokens) and tokens[index][3]:
+                    cell(row=row_num, column=columns[op[1]][op[2] or col_name], value=tokens[index][1])
+            elif kind == 'r_value':
+                r_keyword = None
+                for token in tokens:
+                    if token[0] in op[2]:
+                        r_keyword = token[0]
+                index = first_index[r_keyword] + 1
+                if index < len(tokens) and tokens[index][4] == 6:
+                    cell(row=row_num, column=columns[op[1]][col_name], value=tokens[index][0])
+            elif kind == 'joint':
+                joint_dict[op[1]] = joint_dict.get(op[1], 0) + 1
+            elif kind == 'flag':
+                flags.add(op[1])
+            elif kind == 'tab':
+                run_ops(op[2] if reptyp == op[1] else op[3], col_name, keyword, tokens, first_index)
 
-    def update_keyword_tally(tally_dict, keyword):
-        if keyword not in tally_dict:
-            tally_dict[keyword] = 0
-        tally_dict[keyword] += 1
-
-    col_chooser = {
-        "Not Recognized Keywords": {
-            "BOX": {"Prop Drill Pipe Inp Report": "DO" , "Prop HWDP Inp Report": "DH" , "Prop Subs Inp Report": "DH" },
-            "PIN": {"Prop Drill Pipe Inp Report": "DQ" , "Prop HWDP Inp Report": "DJ" , "Prop Subs Inp Report": "DJ" },
-            "TUBE": {"Prop Drill Pipe Inp Report": "DP" , "Prop HWDP Inp Report": "DI" , "Prop Subs Inp Report": "DI" }
-        },
-        "Tong Space": {
-            "BOX": {"Prop Drill Pipe Inp Report": "L" , "Prop HWDP Inp Report": "J" , "Prop Subs Inp Report": "J" },
-            "PIN": {"Prop Drill Pipe Inp Report": "M", "Prop HWDP Inp Report": "K", "Prop Subs Inp Report": "K" },
-            "TS-BOX": {"Prop Drill Pipe Inp Report": "L" , "Prop HWDP Inp Report": "J" , "Prop Subs Inp Report": "J" },
-            "TS-PIN": {"Prop Drill Pipe Inp Report": "M", "Prop HWDP Inp Report": "K", "Prop Subs Inp Report": "K" }
-        },
-        "Bevel Diameter": {
-            "BD-BOX": {"Prop Drill Pipe Inp Report": "J", "Prop HWDP Inp Report": "L", "Prop Subs Inp Report": "L"},
-            "BD-PIN": {"Prop Drill Pipe Inp Report": "K", "Prop HWDP Inp Report": "M", "Prop Subs Inp Report": "M"},
-            "BOX": {"Prop Drill Pipe Inp Report": "J", "Prop HWDP Inp Report": "L", "Prop Subs Inp Report": "L"},
-            "PIN": {"Prop Drill Pipe Inp Report": "K", "Prop HWDP Inp Report": "M", "Prop Subs Inp Report": "M"},
-        },
-        "Tool Joint": {
-            "BOX": {"Prop Drill Pipe Inp Report": "H", "Prop HWDP Inp Report": "G", "Prop Subs Inp Report": "G" },
-            "PIN": {"Prop Drill Pipe Inp Report": "I", "Prop HWDP Inp Report": "H", "Prop Subs Inp Report": "H"},
-            "ID": {"Prop Drill Pipe Inp Report": "I", "Prop HWDP Inp Report": "H", "Prop Subs Inp Report": "H"},
-            "OD": {"Prop Drill Pipe Inp Report": "H", "Prop HWDP Inp Report": "G", "Prop Subs Inp Report": "G" },
-            "TUBE": {"Prop Drill Pipe Inp Report": "H", "Prop HWDP Inp Report": "G", "Prop Subs Inp Report": "G" }
-
-        },
-        "Stress Relief Groove Diameter": {
-            "STRES REL GRV": {"Prop HWDP Inp Report": "P", "Prop Subs Inp Report": "P"}
-        },
-        "Stress Relief Groove Length": {
-            "STRES REL GRV": {"Prop HWDP Inp Report": "Q", "Prop Subs Inp Report": "Q"}
-        },
-
-        "C Bore Depth": {
-            "C BORE": {"Prop Drill Pipe Inp Report": "N", "Prop HWDP Inp Report": "R", "Prop Subs Inp Report": "R"}
-        },
-        "C Bore Diameter": {
-            "C BORE": {"Prop Drill Pipe Inp Report": "O", "Prop HWDP Inp Report": "S", "Prop Subs Inp Report": "S"}
-        },
-        "Boreback Dia": {
-            "BORBAK": {"Prop HWDP Inp Report": "N", "Prop Subs Inp Report": "N"}
-        },
-        "Boreback Length": {
-            "BORBAK": {"Prop HWDP Inp Report": "O", "Prop Subs Inp Report": "O"}
-        },
-        "Seal Width": {
-            "SEAL WIDTH": {"Prop Drill Pipe Inp Report": "P", "Prop HWDP Inp Report": "T", "Prop Subs Inp Report": "T"}
-        },
-        "Pin Nose Diameter": {
-            "PIN NOSE DIA": {"Prop Drill Pipe Inp Report": "Q", "Prop HWDP Inp Report": "U", "Prop Subs Inp Report": "U"}
-        },
-
-        "Serial #": {
-            "SERIAL": {"Prop Drill Pipe Inp Report": "C" , "Prop HWDP Inp Report": "D" , "Prop Subs Inp Report": "D"},
-        },
-        "Critical Lengths": {
-            "BOX": {"Prop Drill Pipe Inp Report": "DI", "Prop HWDP Inp Report": "DB"},
-            "PIN": {"Prop Drill Pipe Inp Report": "DL", "Prop HWDP Inp Report": "DE"}
-        },
-
-        "R Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "V" , "Prop HWDP Inp Report": "Z" , "Prop Subs Inp Report": "Z" },
-            "PIN": {"Prop Drill Pipe Inp Report": "X" , "Prop HWDP Inp Report": "AB" , "Prop Subs Inp Report": "AB" }
-        },
-        "R Type": {
-            "BOX": {"Prop Drill Pipe Inp Report": "W" , "Prop HWDP Inp Report": "AA" , "Prop Subs Inp Report": "AA" },
-            "PIN": {"Prop Drill Pipe Inp Report": "Y" , "Prop HWDP Inp Report": "AC" , "Prop Subs Inp Report": "AC" }
-        },
-        "R Value": {
-            "BOX": {"Prop Drill Pipe Inp Report": "DH" , "Prop HWDP Inp Report": "DA" , "Prop Subs Inp Report": "DA" },
-            "PIN": {"Prop Drill Pipe Inp Report": "DK" , "Prop HWDP Inp Report": "DD" , "Prop Subs Inp Report": "DD" }
-        },
-
-        "UT Value": {
-            "UT": {"Prop Drill Pipe Inp Report": "DN" , "Prop HWDP Inp Report": "DG" , "Prop Subs Inp Report": "DG" },
-        },
-        "DS Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "Z" , "Prop HWDP Inp Report": "AD" , "Prop Subs Inp Report": "AD" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AA" , "Prop HWDP Inp Report": "AE" , "Prop Subs Inp Report": "AE" }
-        },
-        "DT Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AB" , "Prop HWDP Inp Report": "AF" , "Prop Subs Inp Report": "AF" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AC" , "Prop HWDP Inp Report": "AG" , "Prop Subs Inp Report": "AG" }
-        },
-        "DTS Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AD" , "Prop HWDP Inp Report": "AH" , "Prop Subs Inp Report": "AH" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AE" , "Prop HWDP Inp Report": "AI" , "Prop Subs Inp Report": "AI" }
-        },
-        "PIT Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AF" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AG" }
-        },
-        "OR Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AH" , "Prop HWDP Inp Report": "AJ" , "Prop Subs Inp Report": "AJ" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AI" , "Prop HWDP Inp Report": "AK" , "Prop Subs Inp Report": "AK" }
-        },
-        "BNT Tally": {
-            "TUBE": {"Prop Drill Pipe Inp Report": "AJ" , "Prop HWDP Inp Report": "AL" , "Prop Subs Inp Report": "AL"}
-        },
-        "Other Damages 1": {
-            "TUBE": {"Prop Drill Pipe Inp Report": "AK", "Prop HWDP Inp Report": "AM", "Prop Subs Inp Report": "AM"},
-            "BOX": {"Prop Drill Pipe Inp Report": "AK", "Prop HWDP Inp Report": "AM", "Prop Subs Inp Report": "AM"},
-            "PIN": {"Prop Drill Pipe Inp Report": "AK", "Prop HWDP Inp Report": "AM", "Prop Subs Inp Report": "AM"}
-        },
-        "Other Damages 2": {
-            "TUBE": {"Prop Drill Pipe Inp Report": "AL", "Prop HWDP Inp Report": "AN", "Prop Subs Inp Report": "AN"},
-            "BOX": {"Prop Drill Pipe Inp Report": "AL", "Prop HWDP Inp Report": "AN", "Prop Subs Inp Report": "AN"},
-            "PIN": {"Prop Drill Pipe Inp Report": "AL", "Prop HWDP Inp Report": "AN", "Prop Subs Inp Report": "AN"}
-        },
-        "Other Damages 3": {
-            "TUBE": {"Prop Drill Pipe Inp Report": "AM", "Prop HWDP Inp Report": "AO", "Prop Subs Inp Report": "AO"},
-            "BOX": {"Prop Drill Pipe Inp Report": "AM", "Prop HWDP Inp Report": "AO", "Prop Subs Inp Report": "AO"},
-            "PIN": {"Prop Drill Pipe Inp Report": "AM", "Prop HWDP Inp Report": "AO", "Prop Subs Inp Report": "AO"}
-        },
-        "Other Damages 4": {
-            "TUBE": {"Prop Drill Pipe Inp Report": "AN"},
-            "BOX": {"Prop Drill Pipe Inp Report": "AN"},
-            "PIN": {"Prop Drill Pipe Inp Report": "AN"}
-        },
-        "DHB Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AO" , "Prop HWDP Inp Report": "AP" , "Prop Subs Inp Report": "AP" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AP" , "Prop HWDP Inp Report": "AQ" , "Prop Subs Inp Report": "AQ" }
-        },
-        "HB Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AQ" , "Prop HWDP Inp Report": "AR" , "Prop Subs Inp Report": "AR" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AT" , "Prop HWDP Inp Report": "AU" , "Prop Subs Inp Report": "AU" }
-        },
-
-        "HBCP Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AR" , "Prop HWDP Inp Report": "AS" , "Prop Subs Inp Report": "AS" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AS" , "Prop HWDP Inp Report": "AT" , "Prop Subs Inp Report": "AT" }
-        },
-        "DBRHB Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AU" , "Prop HWDP Inp Report": "AV" , "Prop Subs Inp Report": "AV" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AV" , "Prop HWDP Inp Report": "AW" , "Prop Subs Inp Report": "AW" }
-        },
-        "MW Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AW" , "Prop HWDP Inp Report": "AX" , "Prop Subs Inp Report": "AX" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AW" , "Prop HWDP Inp Report": "AX" , "Prop Subs Inp Report": "AX" },
-            "TUBE": {"Prop Drill Pipe Inp Report": "AW" , "Prop HWDP Inp Report": "AX" , "Prop Subs Inp Report": "AX" }
-        },
-        "MT Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AX" , "Prop HWDP Inp Report": "AY" , "Prop Subs Inp Report": "AY" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AY" , "Prop HWDP Inp Report": "AZ" , "Prop Subs Inp Report": "AZ" },
-        },
-        "MS Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AZ" , "Prop HWDP Inp Report": "BA" , "Prop Subs Inp Report": "BA" },
-            "PIN": {"Prop Drill Pipe Inp Report": "BA" , "Prop HWDP Inp Report": "BB" , "Prop Subs Inp Report": "BB" },
-        },
-        "MOD Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "BB" , "Prop HWDP Inp Report": "BC" , "Prop Subs Inp Report": "BC" },
-            "PIN": {"Prop Drill Pipe Inp Report": "BB" , "Prop HWDP Inp Report": "BC" , "Prop Subs Inp Report": "BC" },
-            "TUBE": {"Prop Drill Pipe Inp Report": "BB" , "Prop HWDP Inp Report": "BC" , "Prop Subs Inp Report": "BC" },
-        },
-        "DAM Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "BC" , "Prop HWDP Inp Report": "BD" , "Prop Subs Inp Report": "BD" },
-            "PIN": {"Prop Drill Pipe Inp Report": "BC" , "Prop HWDP Inp Report": "BD" , "Prop Subs Inp Report": "BD" },
-            "TUBE": {"Prop Drill Pipe Inp Report": "BC" , "Prop HWDP Inp Report": "BD" , "Prop Subs Inp Report": "BD" },
-        },
-
-        "EMI Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "BD" , "Prop HWDP Inp Report": "BE" , "Prop Subs Inp Report": "BE" },
-            "PIN": {"Prop Drill Pipe Inp Report": "BD" , "Prop HWDP Inp Report": "BE" , "Prop Subs Inp Report": "BE" },
-            "TUBE": {"Prop Drill Pipe Inp Report": "BD" , "Prop HWDP Inp Report": "BE" , "Prop Subs Inp Report": "BE" },
-        },
-
-        "OTHER Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "BE" , "Prop HWDP Inp Report": "BF" , "Prop Subs Inp Report": "BF" },
-            "PIN": {"Prop Drill Pipe Inp Report": "BE" , "Prop HWDP Inp Report": "BF" , "Prop Subs Inp Report": "BF" },
-            "TUBE": {"Prop Drill Pipe Inp Report": "BE" , "Prop HWDP Inp Report": "BF" , "Prop Subs Inp Report": "BF" },
-        },
-        "TR Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "BF" , "Prop HWDP Inp Report": "BG" , "Prop Subs Inp Report": "BG" },
-            "PIN": {"Prop Drill Pipe Inp Report": "BG" , "Prop HWDP Inp Report": "BH" , "Prop Subs Inp Report": "BH" },
-        },
-        "BVR Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "BH" , "Prop HWDP Inp Report": "BI" , "Prop Subs Inp Report": "BI" },
-            "PIN": {"Prop Drill Pipe Inp Report": "BI" , "Prop HWDP Inp Report": "BJ" , "Prop Subs Inp Report": "BJ" },
-        },
-        "SUBS CONN/DATA": {
-            "SUBS CONN/DATA": {"Prop Subs Inp Report": "V"}
-        },
-        "COMMENTS": {
-            "COMMENTS": {"Prop Drill Pipe Inp Report": "DR", "Prop HWDP Inp Report": "DK", "Prop Subs Inp Report": "DK" }
-        }
+    for col_name, col_value in joint_values.items():
+        col_value, tokens, first_index = compile_shorthand_cell(col_value)
+        rule = style.get(col_name)
+        if rule is None:
+            continue
+        if isinstance(rule, tuple):
+            if rule[0] == 'raw':
+                cell(row=row_num, column=columns[rule[1]][col_name], value=col_value)
+            elif rule[0] == 'display' or col_value != "":
+                cell(row=row_num, column=columns[rule[1]][col_name], value=col_value.replace('_', ' '))
+            continue
+
+        keywords = rule['keywords']
+        n = len(tokens)
+        for i, (keyword, display, is_number, is_measure, digit_count) in enumerate(tokens):
+            if digit_count == 3 and rule['critical_lengths']:
+                cell(row=row_num, column=columns[rule['critical_lengths']][col_name], value=keyword)
+            elif keyword in keywords:
+                run_ops(keywords[keyword], col_name, keyword, tokens, first_index)
+            elif not is_number:
+                if rule['unrecognized']:
+                    if i + 1 < n and tokens[i + 1][2]:
+                        keyword = f"{keyword} {tokens[i + 1][1]}"
+                    cell(row=row_num, column=columns[rule['unrecognized']][col_name], value=keyword)
+            elif rule['numbers'] and is_measure:
+                cell(row=row_num, column=columns[rule['numbers']][col_name], value=display)
+        if rule['serials']:
+            for token in tokens:
+                if token[4] == 4:
+                    cell(row=row_num, column=columns[rule['serials']][col_name], value=token[0])
+    return flags
+
+
+tx_fd_col_chooser = {
+    "Not Recognized Keywords": {
+        "BOX": {"Prop Drill Pipe Inp Report": "DO" , "Prop HWDP Inp Report": "DH" , "Prop Subs Inp Report": "DH" },
+        "PIN": {"Prop Drill Pipe Inp Report": "DQ" , "Prop HWDP Inp Report": "DJ" , "Prop Subs Inp Report": "DJ" },
+        "TUBE": {"Prop Drill Pipe Inp Report": "DP" , "Prop HWDP Inp Report": "DI" , "Prop Subs Inp Report": "DI" }
+    },
+    "Tong Space": {
+        "BOX": {"Prop Drill Pipe Inp Report": "L" , "Prop HWDP Inp Report": "J" , "Prop Subs Inp Report": "J" },
+        "PIN": {"Prop Drill Pipe Inp Report": "M", "Prop HWDP Inp Report": "K", "Prop Subs Inp Report": "K" },
+        "TS-BOX": {"Prop Drill Pipe Inp Report": "L" , "Prop HWDP Inp Report": "J" , "Prop Subs Inp Report": "J" },
+        "TS-PIN": {"Prop Drill Pipe Inp Report": "M", "Prop HWDP Inp Report": "K", "Prop Subs Inp Report": "K" }
+    },
+    "Bevel Diameter": {
+        "BD-BOX": {"Prop Drill Pipe Inp Report": "J", "Prop HWDP Inp Report": "L", "Prop Subs Inp Report": "L"},
+        "BD-PIN": {"Prop Drill Pipe Inp Report": "K", "Prop HWDP Inp Report": "M", "Prop Subs Inp Report": "M"},
+        "BOX": {"Prop Drill Pipe Inp Report": "J", "Prop HWDP Inp Report": "L", "Prop Subs Inp Report": "L"},
+        "PIN": {"Prop Drill Pipe Inp Report": "K", "Prop HWDP Inp Report": "M", "Prop Subs Inp Report": "M"},
+    },
+    "Tool Joint": {
+        "BOX": {"Prop Drill Pipe Inp Report": "H", "Prop HWDP Inp Report": "G", "Prop Subs Inp Report": "G" },
+        "PIN": {"Prop Drill Pipe Inp Report": "I", "Prop HWDP Inp Report": "H", "Prop Subs Inp Report": "H"},
+        "ID": {"Prop Drill Pipe Inp Report": "I", "Prop HWDP Inp Report": "H", "Prop Subs Inp Report": "H"},
+        "OD": {"Prop Drill Pipe Inp Report": "H", "Prop HWDP Inp Report": "G", "Prop Subs Inp Report": "G" },
+        "TUBE": {"Prop Drill Pipe Inp Report": "H", "Prop HWDP Inp Report": "G", "Prop Subs Inp Report": "G" }
+
+    },
+    "Stress Relief Groove Diameter": {
+        "STRES REL GRV": {"Prop HWDP Inp Report": "P", "Prop Subs Inp Report": "P"}
+    },
+    "Stress Relief Groove Length": {
+        "STRES REL GRV": {"Prop HWDP Inp Report": "Q", "Prop Subs Inp Report": "Q"}
+    },
+
+    "C Bore Depth": {
+        "C BORE": {"Prop Drill Pipe Inp Report": "N", "Prop HWDP Inp Report": "R", "Prop Subs Inp Report": "R"}
+    },
+    "C Bore Diameter": {
+        "C BORE": {"Prop Drill Pipe Inp Report": "O", "Prop HWDP Inp Report": "S", "Prop Subs Inp Report": "S"}
+    },
+    "Boreback Dia": {
+        "BORBAK": {"Prop HWDP Inp Report": "N", "Prop Subs Inp Report": "N"}
+    },
+    "Boreback Length": {
+        "BORBAK": {"Prop HWDP Inp Report": "O", "Prop Subs Inp Report": "O"}
+    },
+    "Seal Width": {
+        "SEAL WIDTH": {"Prop Drill Pipe Inp Report": "P", "Prop HWDP Inp Report": "T", "Prop Subs Inp Report": "T"}
+    },
+    "Pin Nose Diameter": {
+        "PIN NOSE DIA": {"Prop Drill Pipe Inp Report": "Q", "Prop HWDP Inp Report": "U", "Prop Subs Inp Report": "U"}
+    },
+
+    "Serial #": {
+        "SERIAL": {"Prop Drill Pipe Inp Report": "C" , "Prop HWDP Inp Report": "D" , "Prop Subs Inp Report": "D"},
+    },
+    "Critical Lengths": {
+        "BOX": {"Prop Drill Pipe Inp Report": "DI", "Prop HWDP Inp Report": "DB"},
+        "PIN": {"Prop Drill Pipe Inp Report": "DL", "Prop HWDP Inp Report": "DE"}
+    },
+
+    "R Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "V" , "Prop HWDP Inp Report": "Z" , "Prop Subs Inp Report": "Z" },
+        "PIN": {"Prop Drill Pipe Inp Report": "X" , "Prop HWDP Inp Report": "AB" , "Prop Subs Inp Report": "AB" }
+    },
+    "R Type": {
+        "BOX": {"Prop Drill Pipe Inp Report": "W" , "Prop HWDP Inp Report": "AA" , "Prop Subs Inp Report": "AA" },
+        "PIN": {"Prop Drill Pipe Inp Report": "Y" , "Prop HWDP Inp Report": "AC" , "Prop Subs Inp Report": "AC" }
+    },
+    "R Value": {
+        "BOX": {"Prop Drill Pipe Inp Report": "DH" , "Prop HWDP Inp Report": "DA" , "Prop Subs Inp Report": "DA" },
+        "PIN": {"Prop Drill Pipe Inp Report": "DK" , "Prop HWDP Inp Report": "DD" , "Prop Subs Inp Report": "DD" }
+    },
+
+    "UT Value": {
+        "UT": {"Prop Drill Pipe Inp Report": "DN" , "Prop HWDP Inp Report": "DG" , "Prop Subs Inp Report": "DG" },
+    },
+    "DS Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "Z" , "Prop HWDP Inp Report": "AD" , "Prop Subs Inp Report": "AD" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AA" , "Prop HWDP Inp Report": "AE" , "Prop Subs Inp Report": "AE" }
+    },
+    "DT Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AB" , "Prop HWDP Inp Report": "AF" , "Prop Subs Inp Report": "AF" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AC" , "Prop HWDP Inp Report": "AG" , "Prop Subs Inp Report": "AG" }
+    },
+    "DTS Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AD" , "Prop HWDP Inp Report": "AH" , "Prop Subs Inp Report": "AH" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AE" , "Prop HWDP Inp Report": "AI" , "Prop Subs Inp Report": "AI" }
+    },
+    "PIT Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AF" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AG" }
+    },
+    "OR Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AH" , "Prop HWDP Inp Report": "AJ" , "Prop Subs Inp Report": "AJ" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AI" , "Prop HWDP Inp Report": "AK" , "Prop Subs Inp Report": "AK" }
+    },
+    "BNT Tally": {
+        "TUBE": {"Prop Drill Pipe Inp Report": "AJ" , "Prop HWDP Inp Report": "AL" , "Prop Subs Inp Report": "AL"}
+    },
+    "Other Damages 1": {
+        "TUBE": {"Prop Drill Pipe Inp Report": "AK", "Prop HWDP Inp Report": "AM", "Prop Subs Inp Report": "AM"},
+        "BOX": {"Prop Drill Pipe Inp Report": "AK", "Prop HWDP Inp Report": "AM", "Prop Subs Inp Report": "AM"},
+        "PIN": {"Prop Drill Pipe Inp Report": "AK", "Prop HWDP Inp Report": "AM", "Prop Subs Inp Report": "AM"}
+    },
+    "Other Damages 2": {
+        "TUBE": {"Prop Drill Pipe Inp Report": "AL", "Prop HWDP Inp Report": "AN", "Prop Subs Inp Report": "AN"},
+        "BOX": {"Prop Drill Pipe Inp Report": "AL", "Prop HWDP Inp Report": "AN", "Prop Subs Inp Report": "AN"},
+        "PIN": {"Prop Drill Pipe Inp Report": "AL", "Prop HWDP Inp Report": "AN", "Prop Subs Inp Report": "AN"}
+    },
+    "Other Damages 3": {
+        "TUBE": {"Prop Drill Pipe Inp Report": "AM", "Prop HWDP Inp Report": "AO", "Prop Subs Inp Report": "AO"},
+        "BOX": {"Prop Drill Pipe Inp Report": "AM", "Prop HWDP Inp Report": "AO", "Prop Subs Inp Report": "AO"},
+        "PIN": {"Prop Drill Pipe Inp Report": "AM", "Prop HWDP Inp Report": "AO", "Prop Subs Inp Report": "AO"}
+    },
+    "Other Damages 4": {
+        "TUBE": {"Prop Drill Pipe Inp Report": "AN"},
+        "BOX": {"Prop Drill Pipe Inp Report": "AN"},
+        "PIN": {"Prop Drill Pipe Inp Report": "AN"}
+    },
+    "DHB Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AO" , "Prop HWDP Inp Report": "AP" , "Prop Subs Inp Report": "AP" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AP" , "Prop HWDP Inp Report": "AQ" , "Prop Subs Inp Report": "AQ" }
+    },
+    "HB Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AQ" , "Prop HWDP Inp Report": "AR" , "Prop Subs Inp Report": "AR" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AT" , "Prop HWDP Inp Report": "AU" , "Prop Subs Inp Report": "AU" }
+    },
+
+    "HBCP Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AR" , "Prop HWDP Inp Report": "AS" , "Prop Subs Inp Report": "AS" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AS" , "Prop HWDP Inp Report": "AT" , "Prop Subs Inp Report": "AT" }
+    },
+    "DBRHB Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AU" , "Prop HWDP Inp Report": "AV" , "Prop Subs Inp Report": "AV" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AV" , "Prop HWDP Inp Report": "AW" , "Prop Subs Inp Report": "AW" }
+    },
+    "MW Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AW" , "Prop HWDP Inp Report": "AX" , "Prop Subs Inp Report": "AX" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AW" , "Prop HWDP Inp Report": "AX" , "Prop Subs Inp Report": "AX" },
+        "TUBE": {"Prop Drill Pipe Inp Report": "AW" , "Prop HWDP Inp Report": "AX" , "Prop Subs Inp Report": "AX" }
+    },
+    "MT Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AX" , "Prop HWDP Inp Report": "AY" , "Prop Subs Inp Report": "AY" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AY" , "Prop HWDP Inp Report": "AZ" , "Prop Subs Inp Report": "AZ" },
+    },
+    "MS Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AZ" , "Prop HWDP Inp Report": "BA" , "Prop Subs Inp Report": "BA" },
+        "PIN": {"Prop Drill Pipe Inp Report": "BA" , "Prop HWDP Inp Report": "BB" , "Prop Subs Inp Report": "BB" },
+    },
+    "MOD Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "BB" , "Prop HWDP Inp Report": "BC" , "Prop Subs Inp Report": "BC" },
+        "PIN": {"Prop Drill Pipe Inp Report": "BB" , "Prop HWDP Inp Report": "BC" , "Prop Subs Inp Report": "BC" },
+        "TUBE": {"Prop Drill Pipe Inp Report": "BB" , "Prop HWDP Inp Report": "BC" , "Prop Subs Inp Report": "BC" },
+    },
+    "DAM Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "BC" , "Prop HWDP Inp Report": "BD" , "Prop Subs Inp Report": "BD" },
+        "PIN": {"Prop Drill Pipe Inp Report": "BC" , "Prop HWDP Inp Report": "BD" , "Prop Subs Inp Report": "BD" },
+        "TUBE": {"Prop Drill Pipe Inp Report": "BC" , "Prop HWDP Inp Report": "BD" , "Prop Subs Inp Report": "BD" },
+    },
+
+    "EMI Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "BD" , "Prop HWDP Inp Report": "BE" , "Prop Subs Inp Report": "BE" },
+        "PIN": {"Prop Drill Pipe Inp Report": "BD" , "Prop HWDP Inp Report": "BE" , "Prop Subs Inp Report": "BE" },
+        "TUBE": {"Prop Drill Pipe Inp Report": "BD" , "Prop HWDP Inp Report": "BE" , "Prop Subs Inp Report": "BE" },
+    },
+
+    "OTHER Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "BE" , "Prop HWDP Inp Report": "BF" , "Prop Subs Inp Report": "BF" },
+        "PIN": {"Prop Drill Pipe Inp Report": "BE" , "Prop HWDP Inp Report": "BF" , "Prop Subs Inp Report": "BF" },
+        "TUBE": {"Prop Drill Pipe Inp Report": "BE" , "Prop HWDP Inp Report": "BF" , "Prop Subs Inp Report": "BF" },
+    },
+    "TR Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "BF" , "Prop HWDP Inp Report": "BG" , "Prop Subs Inp Report": "BG" },
+        "PIN": {"Prop Drill Pipe Inp Report": "BG" , "Prop HWDP Inp Report": "BH" , "Prop Subs Inp Report": "BH" },
+    },
+    "BVR Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "BH" , "Prop HWDP Inp Report": "BI" , "Prop Subs Inp Report": "BI" },
+        "PIN": {"Prop Drill Pipe Inp Report": "BI" , "Prop HWDP Inp Report": "BJ" , "Prop Subs Inp Report": "BJ" },
+    },
+    "SUBS CONN/DATA": {
+        "SUBS CONN/DATA": {"Prop Subs Inp Report": "V"}
+    },
+    "COMMENTS": {
+        "COMMENTS": {"Prop Drill Pipe Inp Report": "DR", "Prop HWDP Inp Report": "DK", "Prop Subs Inp Report": "DK" }
+    },
+    "Description": {
+        "DESCRIPTION": {"Prop Drill Pipe Inp Report": "C", "Prop HWDP Inp Report": "C", "Prop Subs Inp Report": "C"}
     }
+}
 
-    def process_tube_col(col_name, col_value, row_num, sheet):
-        keywords = col_value.split()
-        n = len(keywords)
-        for i in range(n):
-            keyword = keywords[i]
-            if keyword == "MW":
-                sheet[f"{col_chooser['MW Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "MOD":
-                sheet[f"{col_chooser['MOD Tally'][col_name][reptyp]}{row_num}"] = "X"
-                process_mod_keyword(col_name, keywords, keyword, row_num, sheet)
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "DAM":
-                sheet[f"{col_chooser['DAM Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "EMI":
-                sheet[f"{col_chooser['EMI Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "OTHER":
-                sheet[f"{col_chooser['OTHER Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "BNT" or keyword == "BENT":
-                sheet[f"{col_chooser['BNT Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, "BNT")
-            elif keyword == "ODAM1":
-                sheet[f"{col_chooser['Other Damages 1'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "ODAM2":
-                sheet[f"{col_chooser['Other Damages 2'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "ODAM3":
-                sheet[f"{col_chooser['Other Damages 3'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "ODAM4":
-                if reptyp != 'Prop Drill Pipe Inp Report':
-                    sheet[f"{col_chooser['Not Recognized Keywords'][col_name][reptyp]}{row_num}"] = keyword
-                else:
-                    sheet[f"{col_chooser['Other Damages 4'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif not re.match(r'^(\d+(\.\d+)?|\d+|\d+\s\d+/\d+|\d+/\d+)$', keyword.replace('_', ' ')):
-                if i + 1 < n:  
-                    next_keyword = keywords[i + 1].replace('_', ' ')
-                    if re.match(r'^(\d+(\.\d+)?|\d+|\d+\s\d+/\d+|\d+/\d+)$', next_keyword):
-                        sheet[f"{col_chooser['Not Recognized Keywords'][col_name][reptyp]}{row_num}"] = f"{keyword} {next_keyword}"
-                        continue  
-                sheet[f"{col_chooser['Not Recognized Keywords'][col_name][reptyp]}{row_num}"] = keyword
-
-
-
-    def process_box_pin_col(col_name, col_value, row_num, sheet):
-        keywords = col_value.split()
-        n = len(keywords)
-        for i in range(n):
-            keyword = keywords[i]
-            if len(keyword) == 3 and keyword.isdigit():
-                sheet[f"{col_chooser['Critical Lengths'][col_name][reptyp]}{row_num}"] = keyword
-            elif keyword == "TS":
-                process_ts_keyword(col_name, keywords, keyword, row_num, sheet)
-            elif keyword == "TJ":
-                process_tj_keyword(col_name, keywords, keyword, row_num, sheet)
-            elif keyword == "BD":
-                process_bd_keyword(col_name, keywords, keyword, row_num, sheet)
-            elif keyword == "MT":
-                sheet[f"{col_chooser['MT Tally'][col_name][reptyp]}{row_num}"] = "X"
-                process_mtong_keyword(col_name, keywords, keyword, row_num, sheet)
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "MS":
-                sheet[f"{col_chooser['MS Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "DS":
-                sheet[f"{col_chooser['DS Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "DT":
-                sheet[f"{col_chooser['DT Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "DTS":
-                sheet[f"{col_chooser['DTS Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "PIT":
-                sheet[f"{col_chooser['PIT Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "OR":
-                sheet[f"{col_chooser['OR Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "DHB":
-                sheet[f"{col_chooser['DHB Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "HB":
-                sheet[f"{col_chooser['HB Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "DBRHB":
-                sheet[f"{col_chooser['DBRHB Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "HBCP":
-                sheet[f"{col_chooser['HBCP Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "MOD":
-                sheet[f"{col_chooser['MOD Tally'][col_name][reptyp]}{row_num}"] = "X"
-                process_mod_keyword(col_name, keywords, keyword, row_num, sheet)
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "R1":
-                sheet[f"{col_chooser['R Tally'][col_name][reptyp]}{row_num}"] = "X"
-                sheet[f"{col_chooser['R Type'][col_name][reptyp]}{row_num}"] = 1
-                process_r_keyword(col_name, keywords, row_num, sheet)
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "R2":
-                sheet[f"{col_chooser['R Tally'][col_name][reptyp]}{row_num}"] = "X"
-                sheet[f"{col_chooser['R Type'][col_name][reptyp]}{row_num}"] = 2
-                process_r_keyword(col_name, keywords, row_num, sheet)
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "R3":
-                sheet[f"{col_chooser['R Tally'][col_name][reptyp]}{row_num}"] = "X"
-                sheet[f"{col_chooser['R Type'][col_name][reptyp]}{row_num}"] = 3
-                process_r_keyword(col_name, keywords, row_num, sheet)
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "R4":
-                sheet[f"{col_chooser['R Tally'][col_name][reptyp]}{row_num}"] = "X"
-                sheet[f"{col_chooser['R Type'][col_name][reptyp]}{row_num}"] = 4
-                process_r_keyword(col_name, keywords, row_num, sheet)
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "ODAM":
-                if reptyp == "Prop Drill Pipe Inp Report":
-                    sheet[f"{col_chooser['BOX/PIN Other Damages Tally'][col_name][reptyp]}{row_num}"] = "X"
-                else:
-                    sheet[f"{col_chooser['Not Recognized Keywords'][col_name][reptyp]}{row_num}"] = keyword
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "ODAM1":
-                sheet[f"{col_chooser['Other Damages 1'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}")
-            elif keyword == "ODAM2":
-                sheet[f"{col_chooser['Other Damages 2'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}")
-            elif keyword == "ODAM3":
-                sheet[f"{col_chooser['Other Damages 3'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}")
-            elif keyword == "ODAM4":
-                if reptyp != 'Prop Drill Pipe Inp Report':
-                    sheet[f"{col_chooser['Not Recognized Keywords'][col_name][reptyp]}{row_num}"] = keyword
-                else:
-                    sheet[f"{col_chooser['Other Damages 4'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}")
-            elif keyword == "TR":
-                sheet[f"{col_chooser['TR Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "BVR":
-                sheet[f"{col_chooser['BVR Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif not re.match(r'^(\d+(\.\d+)?|\d+|\d+\s\d+/\d+|\d+/\d+)$', keyword.replace('_', ' ')):
-                if i + 1 < n:  
-                    next_keyword = keywords[i + 1].replace('_', ' ')
-                    if re.match(r'^(\d+(\.\d+)?|\d+|\d+\s\d+/\d+|\d+/\d+)$', next_keyword):
-                        sheet[f"{col_chooser['Not Recognized Keywords'][col_name][reptyp]}{row_num}"] = f"{keyword} {next_keyword}"
-                        continue  
-                sheet[f"{col_chooser['Not Recognized Keywords'][col_name][reptyp]}{row_num}"] = keyword
-
-
-
-
-    def process_ts_keyword(col_name, keywords, keyword, row_num, sheet):
-        keywords = col_value.split()
-        n = len(keywords)
-        ts_index = keywords.index(keyword)
-        if ts_index < n - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[ts_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Tong Space'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ')
-    def process_tj_keyword(col_name, keywords, keyword, row_num, sheet):
-        keywords = col_value.split()
-        n = len(keywords)
-        tj_index = keywords.index(keyword)
-        if tj_index < n - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[tj_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Tool Joint'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ')
-    def process_bd_keyword(col_name, keywords, keyword, row_num, sheet):
-        keywords = col_value.split()
-        n = len(keywords)
-        bd_index = keywords.index(keyword)
-        if bd_index < n - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[bd_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Bevel Diameter'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ')
-
-
-
-    def process_stres_rel_grv_col(col_name, col_value, row_num, sheet):
-        keywords = col_value.split()
-        n = len(keywords)
-        for i in range(n):
-            keyword = keywords[i]
-            if keyword in ["D", "DIA", "DIAMETER"]:
-                process_srg_dia_keyword(col_name, keywords, keyword, row_num, sheet)
-            elif keyword in ["L", "LEN", "LENGTH"]:
-                process_srg_len_keyword(col_name, keywords, keyword, row_num, sheet)
-    def process_srg_dia_keyword(col_name, keywords, keyword, row_num, sheet):
-        dia_index = keywords.index(keyword)
-        if dia_index < len(keywords) - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[dia_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Stress Relief Groove Diameter'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ')
-    def process_srg_len_keyword(col_name, keywords, keyword, row_num, sheet):
-        len_index = keywords.index(keyword)
-        if len_index < len(keywords) - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[len_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Stress Relief Groove Length'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ')
-
-
-
-
-    def process_borbak_col(col_name, col_value, row_num, sheet):
-        keywords = col_value.split()
-        n = len(keywords)
-        for i in range(n):
-            keyword = keywords[i]
-            if keyword in ["D", "DIA"]:
-                process_borbak_dia_keyword(col_name, keywords, keyword, row_num, sheet)
-            elif keyword in ["L", "LEN"]:
-                process_borbak_len_keyword(col_name, keywords, keyword, row_num, sheet)
-    def process_borbak_dia_keyword(col_name, keywords, keyword, row_num, sheet):
-        dia_index = keywords.index(keyword)
-        if dia_index < len(keywords) - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[dia_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Boreback Dia'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ')
-    def process_borbak_len_keyword(col_name, keywords, keyword, row_num, sheet):
-        len_index = keywords.index(keyword)
-        if len_index < len(keywords) - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[len_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Boreback Length'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ')
-
-
-
-    def process_cbore_col(col_name, col_value, row_num, sheet):
-        keywords = col_value.split()
-        n = len(keywords)
-        for i in range(n):
-            keyword = keywords[i]
-            if keyword in ["DEP", "DEPTH", "DE", "DPTH"]:
-                process_cbore_depth_keyword(col_name, keywords, keyword, row_num, sheet)
-            elif keyword in ["DIA", "DI", "DIAMETER", "DIAMTR"]:
-                process_cbore_dia_keyword(col_name, keywords, keyword, row_num, sheet)
-    def process_cbore_dia_keyword(col_name, keywords, keyword, row_num, sheet):
-        dia_index = keywords.index(keyword)
-        if dia_index < len(keywords) - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[dia_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['C Bore Diameter'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ')
-    def process_cbore_depth_keyword(col_name, keywords, keyword, row_num, sheet):
-        depth_index = keywords.index(keyword)
-        if depth_index < len(keywords) - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[depth_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['C Bore Depth'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ')
-
-
-
-    def process_short_keywords(col_name, keywords, keyword, row_num, sheet):
-        sb_index = keywords.index(keyword) if keyword == "SB" else None
-        sp_index = keywords.index(keyword) if keyword == "SP" else None 
-        short_index = sb_index if sb_index is not None else sp_index
-        if short_index < len(keywords) -1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[short_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Tool Joint'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ') 
-
-    def process_long_keywords(col_name, keywords, keyword, row_num, sheet):
-        lp_index = keywords.index(keyword) if keyword == "LP" else None  
-        lb_index = keywords.index(keyword) if keyword == "LB" else None
-        long_index = lp_index if lp_index is not None else lb_index
-        if long_index < len(keywords) - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[long_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Tool Joint'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ') 
-
-
-    def process_mtong_keyword(col_name, keywords, keyword, row_num, sheet):
-        mt_index = keywords.index(keyword)
-        if mt_index < len(keywords) - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[mt_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Tong Space'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ')
-
-
-    def process_mod_keyword(col_name, keywords, keyword, row_num, sheet):
-        mod_index = keywords.index(keyword)
-        if mod_index < len(keywords) - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[mod_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Tool Joint']['BOX'][reptyp]}{row_num}"]  = val_match.replace('_', ' ')
-
-    def process_r_keyword(col_name, keywords, row_num, sheet):
-        for keyword in keywords:
-            if keyword in ["R1", "R2", "R3", "R4"]:
-                r_index = keywords.index(keyword)
-        if r_index < len(keywords) - 1 and keywords[r_index + 1].isdigit() and len(keywords[r_index + 1]) == 6:
-            sheet[f"{col_chooser['R Value'][col_name][reptyp]}{row_num}"] = keywords[r_index + 1]
-
-
-
-
-    for col_name, col_value in joint_values.items():
-        col_value = re.sub(r'(\d+)\s(\d+/\d+)', r'\1_\2', col_value)
-        if col_name in ["BOX", "PIN"]:
-            process_box_pin_col(col_name, col_value, row_num, sheet)
-        elif col_name == "UT":
-            sheet[f"{col_chooser['UT Value'][col_name][reptyp]}{row_num}"] = col_value
-        elif col_name == "SERIAL":
-            sheet[f"{col_chooser['Serial #'][col_name][reptyp]}{row_num}"]  = col_value
-        elif col_name == "TUBE":
-            process_tube_col(col_name, col_value, row_num, sheet)
-        elif col_name == "BORBAK":
-            process_borbak_col(col_name, col_value, row_num, sheet)
-        elif col_name == "C BORE":
-            process_cbore_col(col_name, col_value, row_num, sheet)
-        elif col_name == "SEAL WIDTH":
-            sheet[f"{col_chooser['Seal Width'][col_name][reptyp]}{row_num}"] = col_value.replace('_', ' ')
-        elif col_name == "PIN NOSE DIA":
-            sheet[f"{col_chooser['Pin Nose Diameter'][col_name][reptyp]}{row_num}"] = col_value.replace('_', ' ')
-        elif col_name == "STRES REL GRV":
-            process_stres_rel_grv_col(col_name, col_value, row_num, sheet)
-        elif col_name == "BD-BOX":
-            if col_value != "":
-                sheet[f"{col_chooser['Bevel Diameter'][col_name][reptyp]}{row_num}"] = col_value.replace('_', ' ')
-        elif col_name == "BD-PIN":
-            if col_value != "":
-                sheet[f"{col_chooser['Bevel Diameter'][col_name][reptyp]}{row_num}"] = col_value.replace('_', ' ')
-        elif col_name == "ID":
-            if col_value != "":
-                sheet[f"{col_chooser['Tool Joint'][col_name][reptyp]}{row_num}"] = col_value.replace('_', ' ')
-        elif col_name == "OD":
-            if col_value != "":
-                sheet[f"{col_chooser['Tool Joint'][col_name][reptyp]}{row_num}"] = col_value.replace('_', ' ')
-        elif col_name == "TS-PIN":
-            if col_value != "":
-                sheet[f"{col_chooser['Tong Space'][col_name][reptyp]}{row_num}"] = col_value.replace('_', ' ')
-        elif col_name == "TS-BOX":
-            if col_value != "":
-                sheet[f"{col_chooser['Tong Space'][col_name][reptyp]}{row_num}"] = col_value.replace('_', ' ')
-        elif col_name == "DESCRIPTION":
-            sheet[f"C{row_num}"] = col_value
-        elif col_name == "SUBS CONN/DATA":
-            sheet[f"{col_chooser['SUBS CONN/DATA'][col_name][reptyp]}{row_num}"] = col_value
-        elif col_name == "COMMENTS":
-            sheet[f"{col_chooser['COMMENTS'][col_name][reptyp]}{row_num}"] = col_value
 
+def process_for_write_report_tx_pdpir_fd(joint_values, row_num, sheet, datmg):
+    reptyp = datmg.json_data_dict['report_user_metadata']['active_tab']
+    write_shorthand_joint(shorthand_styles['tx_fd'], joint_values, row_num, sheet, datmg, shorthand_column_map('tx_fd', tx_fd_col_chooser, reptyp), reptyp)
+
+
+tx_cl2dbr_col_chooser = {
+    "SUBS CONN/DATA": {
+        "SUBS CONN/DATA": {"Prop Subs Inp Report": "N"}
+    },
+    "COMMENTS": {
+        "COMMENTS": {"Prop Drill Pipe Inp Report": "DD", "Prop HWDP Inp Report": "DD", "Prop Subs Inp Report": "DD" }
+    },
+    "Serial #": {
+        "SERIAL": {"Prop Drill Pipe Inp Report": "C" , "Prop HWDP Inp Report": "D" , "Prop Subs Inp Report": "D"},
+    },
+    "UT Value": {
+        "UT": {"Prop Drill Pipe Inp Report": "CZ" , "Prop HWDP Inp Report": "CZ" , "Prop Subs Inp Report": "CZ" },
+    },
+    "Tool Joint": {
+        "BOX": {"Prop Drill Pipe Inp Report": "H", "Prop HWDP Inp Report": "G", "Prop Subs Inp Report": "G" },
+        "PIN": {"Prop Drill Pipe Inp Report": "I", "Prop HWDP Inp Report": "H", "Prop Subs Inp Report": "H"},
+        "ID": {"Prop Drill Pipe Inp Report": "I", "Prop HWDP Inp Report": "H", "Prop Subs Inp Report": "H"},
+        "OD": {"Prop Drill Pipe Inp Report": "H", "Prop HWDP Inp Report": "G", "Prop Subs Inp Report": "G" },
+        "TUBE": {"Prop Drill Pipe Inp Report": "H", "Prop HWDP Inp Report": "G", "Prop Subs Inp Report": "G" }
+
+    },
+    "Bevel Diameter": {
+        "BD-BOX": {"Prop Drill Pipe Inp Report": "J", "Prop HWDP Inp Report": "L", "Prop Subs Inp Report": "L"},
+        "BD-PIN": {"Prop Drill Pipe Inp Report": "K", "Prop HWDP Inp Report": "M", "Prop Subs Inp Report": "M"},
+        "BOX": {"Prop Drill Pipe Inp Report": "J", "Prop HWDP Inp Report": "L", "Prop Subs Inp Report": "L"},
+        "PIN": {"Prop Drill Pipe Inp Report": "K", "Prop HWDP Inp Report": "M", "Prop Subs Inp Report": "M"},
+    },
+
+    "Tong Space": {
+        "BOX": {"Prop Drill Pipe Inp Report": "L" , "Prop HWDP Inp Report": "J" , "Prop Subs Inp Report": "J" },
+        "PIN": {"Prop Drill Pipe Inp Report": "M", "Prop HWDP Inp Report": "K", "Prop Subs Inp Report": "K" },
+        "TS-BOX": {"Prop Drill Pipe Inp Report": "L" , "Prop HWDP Inp Report": "J" , "Prop Subs Inp Report": "J" },
+        "TS-PIN": {"Prop Drill Pipe Inp Report": "M", "Prop HWDP Inp Report": "K", "Prop Subs Inp Report": "K" }
+    },
+    "Critical Lengths": {
+        "BOX": {"Prop Drill Pipe Inp Report": "CU", "Prop HWDP Inp Report": "CU"},
+        "PIN": {"Prop Drill Pipe Inp Report": "CX", "Prop HWDP Inp Report": "CX"}
+    },
+    "R Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "R" , "Prop HWDP Inp Report": "R" , "Prop Subs Inp Report": "R" },
+        "PIN": {"Prop Drill Pipe Inp Report": "T" , "Prop HWDP Inp Report": "T" , "Prop Subs Inp Report": "T" }
+    },
+    "R Type": {
+        "BOX": {"Prop Drill Pipe Inp Report": "S" , "Prop HWDP Inp Report": "S" , "Prop Subs Inp Report": "S" },
+        "PIN": {"Prop Drill Pipe Inp Report": "U" , "Prop HWDP Inp Report": "U" , "Prop Subs Inp Report": "U" }
+    },
+    "R Value": {
+        "BOX": {"Prop Drill Pipe Inp Report": "CT" , "Prop HWDP Inp Report": "CT" , "Prop Subs Inp Report": "CT" },
+        "PIN": {"Prop Drill Pipe Inp Report": "CW" , "Prop HWDP Inp Report": "CW" , "Prop Subs Inp Report": "CW" }
+    },
+    "DS Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "V" , "Prop HWDP Inp Report": "V" , "Prop Subs Inp Report": "V" },
+        "PIN": {"Prop Drill Pipe Inp Report": "W" , "Prop HWDP Inp Report": "W" , "Prop Subs Inp Report": "W" }
+    },
+    "DT Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "X" , "Prop HWDP Inp Report": "X" , "Prop Subs Inp Report": "X" },
+        "PIN": {"Prop Drill Pipe Inp Report": "Y" , "Prop HWDP Inp Report": "Y" , "Prop Subs Inp Report": "Y" }
+    },
+    "DTS Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "Z"},
+        "PIN": {"Prop Drill Pipe Inp Report": "AA"}
+    },
+    "PIT Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AB", "Prop HWDP Inp Report": "AE", "Prop Subs Inp Report": "AE"},
+        "PIN": {"Prop Drill Pipe Inp Report": "AC", "Prop HWDP Inp Report": "AF", "Prop Subs Inp Report": "AF"}
+    },
+    "OR Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AD" , "Prop HWDP Inp Report": "AC" , "Prop Subs Inp Report": "AC" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AE" , "Prop HWDP Inp Report": "AD" , "Prop Subs Inp Report": "AD" }
+    },
+    "BNT Tally": {
+        "TUBE": {"Prop Drill Pipe Inp Report": "AF" , "Prop HWDP Inp Report": "AB" , "Prop Subs Inp Report": "AB"}
+    },
+    "SW Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AG", "Prop HWDP Inp Report": "Z", "Prop Subs Inp Report": "Z"},
+        "TUBE": {"Prop Drill Pipe Inp Report": "AG", "Prop HWDP Inp Report": "Z", "Prop Subs Inp Report": "Z"},
+        "PIN": {"Prop Drill Pipe Inp Report": "AG", "Prop HWDP Inp Report": "Z", "Prop Subs Inp Report": "Z"}
+    },
+    "SP Tally": {
+        "PIN": {"Prop Drill Pipe Inp Report": "AH", "Prop HWDP Inp Report": "AA", "Prop Subs Inp Report": "AA"},
+        "BOX": {"Prop Drill Pipe Inp Report": "AH", "Prop HWDP Inp Report": "AA", "Prop Subs Inp Report": "AA"}
+    },
+    "SB Tally": {
+        "PIN": {"Prop Drill Pipe Inp Report": "AI"},
+        "BOX": {"Prop Drill Pipe Inp Report": "AI"}
+    },
+    "Other Damages Tally": {
+        "BOX": {"Prop HWDP Inp Report": "AG" , "Prop Subs Inp Report": "AG" },
+        "PIN": {"Prop HWDP Inp Report": "AG" , "Prop Subs Inp Report": "AG" },
+        "TUBE": {"Prop HWDP Inp Report": "AG" , "Prop Subs Inp Report": "AG" }
+    },
+    "OTHER DBR Tally": {
+        "BOX": {"Prop HWDP Inp Report": "AY" , "Prop Subs Inp Report": "AY"},
+        "PIN": {"Prop HWDP Inp Report": "AY" , "Prop Subs Inp Report": "AY"},
+        "TUBE": {"Prop HWDP Inp Report": "AY" , "Prop Subs Inp Report": "AY"},
+    },
+    "UG Tally": {
+        "BOX": {"Prop HWDP Inp Report": "AV" , "Prop Subs Inp Report": "AV"},
+        "PIN": {"Prop HWDP Inp Report": "AV" , "Prop Subs Inp Report": "AV"},
+        "TUBE": {"Prop HWDP Inp Report": "AV" , "Prop Subs Inp Report": "AV"},
+    },
+    "DHB Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AJ" , "Prop HWDP Inp Report": "AI" , "Prop Subs Inp Report": "AI" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AK" , "Prop HWDP Inp Report": "AJ" , "Prop Subs Inp Report": "AJ" },
+        "TUBE": {"Prop HWDP Inp Report": "AH", "Prop Subs Inp Report": "AH" } #FOR 'CWP'
+    },
+    "DHBCWP Tally": {
+        "BOX": {"Prop HWDP Inp Report": "AH" , "Prop Subs Inp Report": "AH" },
+        "PIN": {"Prop HWDP Inp Report": "AH" , "Prop Subs Inp Report": "AH" }
+    },
+    "HBCP Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AM" , "Prop HWDP Inp Report": "AL" , "Prop Subs Inp Report": "AL" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AN" , "Prop HWDP Inp Report": "AM" , "Prop Subs Inp Report": "AM" }
+    },
+    "HB Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AL" , "Prop HWDP Inp Report": "AK" , "Prop Subs Inp Report": "AK" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AO" , "Prop HWDP Inp Report": "AN" , "Prop Subs Inp Report": "AN" }
+    },
+    "DBRHB Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AP" , "Prop HWDP Inp Report": "AO" , "Prop Subs Inp Report": "AO" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AQ" , "Prop HWDP Inp Report": "AP" , "Prop Subs Inp Report": "AP" }
+    },
+    "MW Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AR" , "Prop HWDP Inp Report": "AQ" , "Prop Subs Inp Report": "AQ" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AR" , "Prop HWDP Inp Report": "AQ" , "Prop Subs Inp Report": "AQ" },
+        "TUBE": {"Prop Drill Pipe Inp Report": "AR" , "Prop HWDP Inp Report": "AQ" , "Prop Subs Inp Report": "AQ" }
+    },
+    "MT Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AS" , "Prop HWDP Inp Report": "AR" , "Prop Subs Inp Report": "AR" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AT" , "Prop HWDP Inp Report": "AS" , "Prop Subs Inp Report": "AS" },
+    },
+    "MBD Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AU", "Prop HWDP Inp Report": "AT", "Prop Subs Inp Report": "AT"},
+        "PIN": {"Prop Drill Pipe Inp Report": "AV", "Prop HWDP Inp Report": "AU", "Prop Subs Inp Report": "AU"}
+    },
+    "CRACKED Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AW", "Prop Subs Inp Report": "AX"},
+        "PIN": {"Prop Drill Pipe Inp Report": "AW", "Prop Subs Inp Report": "AX"},
+        "TUBE": {"Prop Drill Pipe Inp Report": "AW", "Prop Subs Inp Report": "AX"},
+    },
+    "DAM Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AX" , "Prop HWDP Inp Report": "AW" , "Prop Subs Inp Report": "AW" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AX" , "Prop HWDP Inp Report": "AW" , "Prop Subs Inp Report": "AW" },
+        "TUBE": {"Prop Drill Pipe Inp Report": "AX" , "Prop HWDP Inp Report": "AW" , "Prop Subs Inp Report": "AW" },
+    },
+    "CLASS2 Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AY"},
+        "PIN": {"Prop Drill Pipe Inp Report": "AY"},
+        "TUBE": {"Prop Drill Pipe Inp Report": "AY"},
+    },
+    "EMI Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AZ" , "Prop HWDP Inp Report": "AX"},
+        "PIN": {"Prop Drill Pipe Inp Report": "AZ" , "Prop HWDP Inp Report": "AX"},
+        "TUBE": {"Prop Drill Pipe Inp Report": "AZ" , "Prop HWDP Inp Report": "AX"},
+    },
+    "Not Recognized Keywords": {
+        "BOX": {"Prop Drill Pipe Inp Report": "DA" , "Prop HWDP Inp Report": "DA" , "Prop Subs Inp Report": "DA" },
+        "PIN": {"Prop Drill Pipe Inp Report": "DC" , "Prop HWDP Inp Report": "DC" , "Prop Subs Inp Report": "DC" },
+        "TUBE": {"Prop Drill Pipe Inp Report": "DB" , "Prop HWDP Inp Report": "DB" , "Prop Subs Inp Report": "DB" }
+    },
+    "Description": {
+        "DESCRIPTION": {"Prop Drill Pipe Inp Report": "C", "Prop HWDP Inp Report": "C", "Prop Subs Inp Report": "C"}
+    }
+}
 
 
 def process_for_write_report_tx_pdpir_cl2dbr(joint_values, row_num, sheet, datmg):
     reptyp = datmg.json_data_dict['report_user_metadata']['active_tab']
-    taldict = datmg.keyword_tally_dict["Keyword Tallies"]
-    joint_dict = datmg.keyword_tally_dict["Joint Tallies"]
-
-
-    def update_keyword_tally(tally_dict, keyword):
-        if keyword not in tally_dict:
-            tally_dict[keyword] = 0
-        tally_dict[keyword] += 1
-
-    col_chooser = {
-        "SUBS CONN/DATA": {
-            "SUBS CONN/DATA": {"Prop Subs Inp Report": "N"}
-        },
-        "COMMENTS": {
-            "COMMENTS": {"Prop Drill Pipe Inp Report": "DD", "Prop HWDP Inp Report": "DD", "Prop Subs Inp Report": "DD" }
-        },
-        "Serial #": {
-            "SERIAL": {"Prop Drill Pipe Inp Report": "C" , "Prop HWDP Inp Report": "D" , "Prop Subs Inp Report": "D"},
-        },
-        "UT Value": {
-            "UT": {"Prop Drill Pipe Inp Report": "CZ" , "Prop HWDP Inp Report": "CZ" , "Prop Subs Inp Report": "CZ" },
-        },
-        "Tool Joint": {
-            "BOX": {"Prop Drill Pipe Inp Report": "H", "Prop HWDP Inp Report": "G", "Prop Subs Inp Report": "G" },
-            "PIN": {"Prop Drill Pipe Inp Report": "I", "Prop HWDP Inp Report": "H", "Prop Subs Inp Report": "H"},
-            "ID": {"Prop Drill Pipe Inp Report": "I", "Prop HWDP Inp Report": "H", "Prop Subs Inp Report": "H"},
-            "OD": {"Prop Drill Pipe Inp Report": "H", "Prop HWDP Inp Report": "G", "Prop Subs Inp Report": "G" },
-            "TUBE": {"Prop Drill Pipe Inp Report": "H", "Prop HWDP Inp Report": "G", "Prop Subs Inp Report": "G" }
-
-        },
-        "Bevel Diameter": {
-            "BD-BOX": {"Prop Drill Pipe Inp Report": "J", "Prop HWDP Inp Report": "L", "Prop Subs Inp Report": "L"},
-            "BD-PIN": {"Prop Drill Pipe Inp Report": "K", "Prop HWDP Inp Report": "M", "Prop Subs Inp Report": "M"},
-            "BOX": {"Prop Drill Pipe Inp Report": "J", "Prop HWDP Inp Report": "L", "Prop Subs Inp Report": "L"},
-            "PIN": {"Prop Drill Pipe Inp Report": "K", "Prop HWDP Inp Report": "M", "Prop Subs Inp Report": "M"},
-        },
-
-        "Tong Space": {
-            "BOX": {"Prop Drill Pipe Inp Report": "L" , "Prop HWDP Inp Report": "J" , "Prop Subs Inp Report": "J" },
-            "PIN": {"Prop Drill Pipe Inp Report": "M", "Prop HWDP Inp Report": "K", "Prop Subs Inp Report": "K" },
-            "TS-BOX": {"Prop Drill Pipe Inp Report": "L" , "Prop HWDP Inp Report": "J" , "Prop Subs Inp Report": "J" },
-            "TS-PIN": {"Prop Drill Pipe Inp Report": "M", "Prop HWDP Inp Report": "K", "Prop Subs Inp Report": "K" }
-        },
-        "Critical Lengths": {
-            "BOX": {"Prop Drill Pipe Inp Report": "CU", "Prop HWDP Inp Report": "CU"},
-            "PIN": {"Prop Drill Pipe Inp Report": "CX", "Prop HWDP Inp Report": "CX"}
-        },
-        "R Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "R" , "Prop HWDP Inp Report": "R" , "Prop Subs Inp Report": "R" },
-            "PIN": {"Prop Drill Pipe Inp Report": "T" , "Prop HWDP Inp Report": "T" , "Prop Subs Inp Report": "T" }
-        },
-        "R Type": {
-            "BOX": {"Prop Drill Pipe Inp Report": "S" , "Prop HWDP Inp Report": "S" , "Prop Subs Inp Report": "S" },
-            "PIN": {"Prop Drill Pipe Inp Report": "U" , "Prop HWDP Inp Report": "U" , "Prop Subs Inp Report": "U" }
-        },
-        "R Value": {
-            "BOX": {"Prop Drill Pipe Inp Report": "CT" , "Prop HWDP Inp Report": "CT" , "Prop Subs Inp Report": "CT" },
-            "PIN": {"Prop Drill Pipe Inp Report": "CW" , "Prop HWDP Inp Report": "CW" , "Prop Subs Inp Report": "CW" }
-        },
-        "DS Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "V" , "Prop HWDP Inp Report": "V" , "Prop Subs Inp Report": "V" },
-            "PIN": {"Prop Drill Pipe Inp Report": "W" , "Prop HWDP Inp Report": "W" , "Prop Subs Inp Report": "W" }
-        },
-        "DT Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "X" , "Prop HWDP Inp Report": "X" , "Prop Subs Inp Report": "X" },
-            "PIN": {"Prop Drill Pipe Inp Report": "Y" , "Prop HWDP Inp Report": "Y" , "Prop Subs Inp Report": "Y" }
-        },
-        "DTS Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "Z"},
-            "PIN": {"Prop Drill Pipe Inp Report": "AA"}
-        },
-        "PIT Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AB", "Prop HWDP Inp Report": "AE", "Prop Subs Inp Report": "AE"},
-            "PIN": {"Prop Drill Pipe Inp Report": "AC", "Prop HWDP Inp Report": "AF", "Prop Subs Inp Report": "AF"}
-        },
-        "OR Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AD" , "Prop HWDP Inp Report": "AC" , "Prop Subs Inp Report": "AC" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AE" , "Prop HWDP Inp Report": "AD" , "Prop Subs Inp Report": "AD" }
-        },
-        "BNT Tally": {
-            "TUBE": {"Prop Drill Pipe Inp Report": "AF" , "Prop HWDP Inp Report": "AB" , "Prop Subs Inp Report": "AB"}
-        },
-        "SW Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AG", "Prop HWDP Inp Report": "Z", "Prop Subs Inp Report": "Z"},
-            "TUBE": {"Prop Drill Pipe Inp Report": "AG", "Prop HWDP Inp Report": "Z", "Prop Subs Inp Report": "Z"},
-            "PIN": {"Prop Drill Pipe Inp Report": "AG", "Prop HWDP Inp Report": "Z", "Prop Subs Inp Report": "Z"}
-        },
-        "SP Tally": {
-            "PIN": {"Prop Drill Pipe Inp Report": "AH", "Prop HWDP Inp Report": "AA", "Prop Subs Inp Report": "AA"},
-            "BOX": {"Prop Drill Pipe Inp Report": "AH", "Prop HWDP Inp Report": "AA", "Prop Subs Inp Report": "AA"}
-        },
-        "SB Tally": {
-            "PIN": {"Prop Drill Pipe Inp Report": "AI"},
-            "BOX": {"Prop Drill Pipe Inp Report": "AI"}
-        },
-        "Other Damages Tally": {
-            "BOX": {"Prop HWDP Inp Report": "AG" , "Prop Subs Inp Report": "AG" },
-            "PIN": {"Prop HWDP Inp Report": "AG" , "Prop Subs Inp Report": "AG" },
-            "TUBE": {"Prop HWDP Inp Report": "AG" , "Prop Subs Inp Report": "AG" }
-        },
-        "OTHER DBR Tally": {
-            "BOX": {"Prop HWDP Inp Report": "AY" , "Prop Subs Inp Report": "AY"},
-            "PIN": {"Prop HWDP Inp Report": "AY" , "Prop Subs Inp Report": "AY"},
-            "TUBE": {"Prop HWDP Inp Report": "AY" , "Prop Subs Inp Report": "AY"},
-        },
-        "UG Tally": {
-            "BOX": {"Prop HWDP Inp Report": "AV" , "Prop Subs Inp Report": "AV"},
-            "PIN": {"Prop HWDP Inp Report": "AV" , "Prop Subs Inp Report": "AV"},
-            "TUBE": {"Prop HWDP Inp Report": "AV" , "Prop Subs Inp Report": "AV"},
-        },
-        "DHB Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AJ" , "Prop HWDP Inp Report": "AI" , "Prop Subs Inp Report": "AI" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AK" , "Prop HWDP Inp Report": "AJ" , "Prop Subs Inp Report": "AJ" },
-            "TUBE": {"Prop HWDP Inp Report": "AH", "Prop Subs Inp Report": "AH" } #FOR 'CWP'
-        },
-        "DHBCWP Tally": {
-            "BOX": {"Prop HWDP Inp Report": "AH" , "Prop Subs Inp Report": "AH" },
-            "PIN": {"Prop HWDP Inp Report": "AH" , "Prop Subs Inp Report": "AH" }
-        },
-        "HBCP Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AM" , "Prop HWDP Inp Report": "AL" , "Prop Subs Inp Report": "AL" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AN" , "Prop HWDP Inp Report": "AM" , "Prop Subs Inp Report": "AM" }
-        },
-        "HB Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AL" , "Prop HWDP Inp Report": "AK" , "Prop Subs Inp Report": "AK" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AO" , "Prop HWDP Inp Report": "AN" , "Prop Subs Inp Report": "AN" }
-        },
-        "DBRHB Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AP" , "Prop HWDP Inp Report": "AO" , "Prop Subs Inp Report": "AO" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AQ" , "Prop HWDP Inp Report": "AP" , "Prop Subs Inp Report": "AP" }
-        },
-        "MW Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AR" , "Prop HWDP Inp Report": "AQ" , "Prop Subs Inp Report": "AQ" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AR" , "Prop HWDP Inp Report": "AQ" , "Prop Subs Inp Report": "AQ" },
-            "TUBE": {"Prop Drill Pipe Inp Report": "AR" , "Prop HWDP Inp Report": "AQ" , "Prop Subs Inp Report": "AQ" }
-        },
-        "MT Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AS" , "Prop HWDP Inp Report": "AR" , "Prop Subs Inp Report": "AR" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AT" , "Prop HWDP Inp Report": "AS" , "Prop Subs Inp Report": "AS" },
-        },
-        "MBD Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AU", "Prop HWDP Inp Report": "AT", "Prop Subs Inp Report": "AT"},
-            "PIN": {"Prop Drill Pipe Inp Report": "AV", "Prop HWDP Inp Report": "AU", "Prop Subs Inp Report": "AU"}
-        },
-        "CRACKED Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AW", "Prop Subs Inp Report": "AX"},
-            "PIN": {"Prop Drill Pipe Inp Report": "AW", "Prop Subs Inp Report": "AX"},
-            "TUBE": {"Prop Drill Pipe Inp Report": "AW", "Prop Subs Inp Report": "AX"},
-        },
-        "DAM Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AX" , "Prop HWDP Inp Report": "AW" , "Prop Subs Inp Report": "AW" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AX" , "Prop HWDP Inp Report": "AW" , "Prop Subs Inp Report": "AW" },
-            "TUBE": {"Prop Drill Pipe Inp Report": "AX" , "Prop HWDP Inp Report": "AW" , "Prop Subs Inp Report": "AW" },
-        },
-        "CLASS2 Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AY"},
-            "PIN": {"Prop Drill Pipe Inp Report": "AY"},
-            "TUBE": {"Prop Drill Pipe Inp Report": "AY"},
-        },
-        "EMI Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AZ" , "Prop HWDP Inp Report": "AX"},
-            "PIN": {"Prop Drill Pipe Inp Report": "AZ" , "Prop HWDP Inp Report": "AX"},
-            "TUBE": {"Prop Drill Pipe Inp Report": "AZ" , "Prop HWDP Inp Report": "AX"},
-        },
-        "Not Recognized Keywords": {
-            "BOX": {"Prop Drill Pipe Inp Report": "DA" , "Prop HWDP Inp Report": "DA" , "Prop Subs Inp Report": "DA" },
-            "PIN": {"Prop Drill Pipe Inp Report": "DC" , "Prop HWDP Inp Report": "DC" , "Prop Subs Inp Report": "DC" },
-            "TUBE": {"Prop Drill Pipe Inp Report": "DB" , "Prop HWDP Inp Report": "DB" , "Prop Subs Inp Report": "DB" }
-        },
+    write_shorthand_joint(shorthand_styles['tx_cl2dbr'], joint_values, row_num, sheet, datmg, shorthand_column_map('tx_cl2dbr', tx_cl2dbr_col_chooser, reptyp), reptyp)
+
+
+nd_pdpir_col_chooser = {
+    "Tong Space": {
+        "BOX": {"Prop Drill Pipe Inp Report": "L" , "Prop HWDP Inp Report": "J" , "Prop Subs Inp Report": "J" },
+        "PIN": {"Prop Drill Pipe Inp Report": "M", "Prop HWDP Inp Report": "K", "Prop Subs Inp Report": "K" },
+        "TS-BOX": {"Prop Drill Pipe Inp Report": "L" , "Prop HWDP Inp Report": "J" , "Prop Subs Inp Report": "J" },
+        "TS-PIN": {"Prop Drill Pipe Inp Report": "M", "Prop HWDP Inp Report": "K", "Prop Subs Inp Report": "K" }
+    },
+    "Bevel Diameter": {
+        "BOX": {"Prop Drill Pipe Inp Report": "J", "Prop HWDP Inp Report": "L", "Prop Subs Inp Report": "L"},
+        "PIN": {"Prop Drill Pipe Inp Report": "K", "Prop HWDP Inp Report": "M", "Prop Subs Inp Report": "M"},
+    },
+    "Tool Joint": {
+        "BOX": {"Prop Drill Pipe Inp Report": "H", "Prop HWDP Inp Report": "G", "Prop Subs Inp Report": "G" },
+        "PIN": {"Prop Drill Pipe Inp Report": "I", "Prop HWDP Inp Report": "H", "Prop Subs Inp Report": "H"},
+        "ID": {"Prop Drill Pipe Inp Report": "I", "Prop HWDP Inp Report": "H", "Prop Subs Inp Report": "H"},
+        "OD": {"Prop Drill Pipe Inp Report": "H", "Prop HWDP Inp Report": "G", "Prop Subs Inp Report": "G" },
+        "TUBE": {"Prop Drill Pipe Inp Report": "H", "Prop HWDP Inp Report": "G", "Prop Subs Inp Report": "G" }
+    },
+    "Serial #": {
+        "SERIAL": {"Prop Drill Pipe Inp Report": "C" , "Prop HWDP Inp Report": "D" , "Prop Subs Inp Report": "D"},
+    },
+    "Critical Lengths": {
+        "BOX": {"Prop Drill Pipe Inp Report": "BO", "Prop HWDP Inp Report": "BO", "Prop Subs Inp Report": "BO" },
+        "PIN": {"Prop Drill Pipe Inp Report": "BR", "Prop HWDP Inp Report": "BR", "Prop Subs Inp Report": "BR" }
+    },
+    "R Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "R" , "Prop HWDP Inp Report": "R" , "Prop Subs Inp Report": "O" },
+        "PIN": {"Prop Drill Pipe Inp Report": "S" , "Prop HWDP Inp Report": "S" , "Prop Subs Inp Report": "P" }
+    },
+    "R Value": {
+        "BOX": {"Prop Drill Pipe Inp Report": "BN" , "Prop HWDP Inp Report": "BN" , "Prop Subs Inp Report": "BN" },
+        "PIN": {"Prop Drill Pipe Inp Report": "BQ" , "Prop HWDP Inp Report": "BQ" , "Prop Subs Inp Report": "BQ" }
+    },
+    "UT Value": {
+        "UT": {"Prop Drill Pipe Inp Report": "BT" , "Prop HWDP Inp Report": "BT" , "Prop Subs Inp Report": "BT" },
+    },
+    "DS Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "T" , "Prop HWDP Inp Report": "T" , "Prop Subs Inp Report": "Q" },
+        "PIN": {"Prop Drill Pipe Inp Report": "U" , "Prop HWDP Inp Report": "U" , "Prop Subs Inp Report": "R" }
+    },
+    "DT Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "V" , "Prop HWDP Inp Report": "V" , "Prop Subs Inp Report": "S" },
+        "PIN": {"Prop Drill Pipe Inp Report": "W" , "Prop HWDP Inp Report": "W" , "Prop Subs Inp Report": "T" }
+    },
+    "SB/SP Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "X" , "Prop HWDP Inp Report": "X" , "Prop Subs Inp Report": "U" },
+        "PIN": {"Prop Drill Pipe Inp Report": "X" , "Prop HWDP Inp Report": "X" , "Prop Subs Inp Report": "U" }
+    },
+    "LB/LP Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "Y" , "Prop HWDP Inp Report": "Y" , "Prop Subs Inp Report": "V" },
+        "PIN": {"Prop Drill Pipe Inp Report": "Y" , "Prop HWDP Inp Report": "Y" , "Prop Subs Inp Report": "V" }
+    },
+    "OR Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "Z" , "Prop HWDP Inp Report": "Z" , "Prop Subs Inp Report": "W" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AA" , "Prop HWDP Inp Report": "AA" , "Prop Subs Inp Report": "X" }
+    },
+    "BNT Tally": {
+        "TUBE": {"Prop Drill Pipe Inp Report": "AB" , "Prop HWDP Inp Report": "AB" , "Prop Subs Inp Report": "Y"}
+    },
+    "Other Damages Tally": {
+        "TUBE": {"Prop Drill Pipe Inp Report": "AC" , "Prop HWDP Inp Report": "AC" , "Prop Subs Inp Report": "AB" },
+        "BOX": {"Prop Drill Pipe Inp Report": "AC" , "Prop HWDP Inp Report": "AC" , "Prop Subs Inp Report": "AC" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AD" , "Prop HWDP Inp Report": "AD" , "Prop Subs Inp Report": "AC" }
+    },
+    "BOX/PIN Other Damages Tally": {
+        "TUBE": {"Prop Drill Pipe Inp Report": "AD" , "Prop HWDP Inp Report": "AD" , "Prop Subs Inp Report": "AC" },
+        "BOX": {"Prop Drill Pipe Inp Report": "AE" , "Prop HWDP Inp Report": "AE" , "Prop Subs Inp Report": "Z" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AF" , "Prop HWDP Inp Report": "AF" , "Prop Subs Inp Report": "AA" }
+    },
+    "DHB Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AG" , "Prop HWDP Inp Report": "AG" , "Prop Subs Inp Report": "AD" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AH" , "Prop HWDP Inp Report": "AH" , "Prop Subs Inp Report": "AE" }
+    },
+    "HB Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AI" , "Prop HWDP Inp Report": "AI" , "Prop Subs Inp Report": "AF" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AL" , "Prop HWDP Inp Report": "AL" , "Prop Subs Inp Report": "AI" }
+    },
+    "HBCP Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AJ" , "Prop HWDP Inp Report": "AJ" , "Prop Subs Inp Report": "AG" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AK" , "Prop HWDP Inp Report": "AK" , "Prop Subs Inp Report": "AH" }
+    },
+    "DBRHB Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AM" , "Prop HWDP Inp Report": "AM" , "Prop Subs Inp Report": "AJ" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AN" , "Prop HWDP Inp Report": "AN" , "Prop Subs Inp Report": "AK" }
+    },
+    "MW Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AO" , "Prop HWDP Inp Report": "AO" , "Prop Subs Inp Report": "AL" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AO" , "Prop HWDP Inp Report": "AO" , "Prop Subs Inp Report": "AL" },
+        "TUBE": {"Prop Drill Pipe Inp Report": "AO" , "Prop HWDP Inp Report": "AO" , "Prop Subs Inp Report": "AL" }
+    },
+    "MT Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AP" , "Prop HWDP Inp Report": "AP" , "Prop Subs Inp Report": "AM" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AQ" , "Prop HWDP Inp Report": "AQ" , "Prop Subs Inp Report": "AN" },
+    },
+    "MS Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AR" , "Prop HWDP Inp Report": "AR" , "Prop Subs Inp Report": "AO" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AS" , "Prop HWDP Inp Report": "AS" , "Prop Subs Inp Report": "AP" },
+    },
+    "MOD Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AT" , "Prop HWDP Inp Report": "AT" , "Prop Subs Inp Report": "AQ" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AT" , "Prop HWDP Inp Report": "AT" , "Prop Subs Inp Report": "AQ" },
+        "TUBE": {"Prop Drill Pipe Inp Report": "AT" , "Prop HWDP Inp Report": "AT" , "Prop Subs Inp Report": "AQ" },
+    },
+    "DAM Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AU" , "Prop HWDP Inp Report": "AU" , "Prop Subs Inp Report": "AR" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AU" , "Prop HWDP Inp Report": "AU" , "Prop Subs Inp Report": "AR" },
+        "TUBE": {"Prop Drill Pipe Inp Report": "AU" , "Prop HWDP Inp Report": "AU" , "Prop Subs Inp Report": "AR" },
+    },
+    "EMI Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AV" , "Prop HWDP Inp Report": "AV" , "Prop Subs Inp Report": "AS" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AV" , "Prop HWDP Inp Report": "AV" , "Prop Subs Inp Report": "AS" },
+        "TUBE": {"Prop Drill Pipe Inp Report": "AV" , "Prop HWDP Inp Report": "AV" , "Prop Subs Inp Report": "AS" },
+    },
+    "OTHER Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AW" , "Prop HWDP Inp Report": "AW" , "Prop Subs Inp Report": "AT" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AW" , "Prop HWDP Inp Report": "AW" , "Prop Subs Inp Report": "AT" },
+        "TUBE": {"Prop Drill Pipe Inp Report": "AW" , "Prop HWDP Inp Report": "AW" , "Prop Subs Inp Report": "AT" },
+    },
+    "TR Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AX" , "Prop HWDP Inp Report": "AX" , "Prop Subs Inp Report": "AU" },
+        "PIN": {"Prop Drill Pipe Inp Report": "AY" , "Prop HWDP Inp Report": "AY" , "Prop Subs Inp Report": "AV" },
+    },
+    "BVR Tally": {
+        "BOX": {"Prop Drill Pipe Inp Report": "AZ" , "Prop HWDP Inp Report": "AZ" , "Prop Subs Inp Report": "AW" },
+        "PIN": {"Prop Drill Pipe Inp Report": "BA" , "Prop HWDP Inp Report": "BA" , "Prop Subs Inp Report": "AX" },
+    },
+    "Not Recognized Keywords": {
+        "BOX": {"Prop Drill Pipe Inp Report": "BU" , "Prop HWDP Inp Report": "BU" , "Prop Subs Inp Report": "BU" },
+        "PIN": {"Prop Drill Pipe Inp Report": "BW" , "Prop HWDP Inp Report": "BW" , "Prop Subs Inp Report": "BW" },
+        "TUBE": {"Prop Drill Pipe Inp Report": "BV" , "Prop HWDP Inp Report": "BV" , "Prop Subs Inp Report": "BV" }
+    },
+    "Description": {
+        "DESCRIPTION": {"Prop Drill Pipe Inp Report": "C", "Prop HWDP Inp Report": "C", "Prop Subs Inp Report": "C"}
+    },
+    "SUBS CONN/DATA": {
+        "SUBS CONN/DATA": {"Prop Drill Pipe Inp Report": "N", "Prop HWDP Inp Report": "N", "Prop Subs Inp Report": "N"}
+    },
+    "COMMENTS": {
+        "COMMENTS": {"Prop Drill Pipe Inp Report": "BX", "Prop HWDP Inp Report": "BX", "Prop Subs Inp Report": "BX"}
     }
+}
 
 
-    
-    def process_tube_col(col_name, col_value, row_num, sheet):
-        keywords = col_value.split()
-        n = len(keywords)
-        for i in range(n):
-            keyword = keywords[i]
-            if keyword == "MW":
-                sheet[f"{col_chooser['MW Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "DAM":
-                sheet[f"{col_chooser['DAM Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "EMI":
-                sheet[f"{col_chooser['EMI Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "BNT" or keyword == "BENT":
-                sheet[f"{col_chooser['BNT Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, "BNT")
-            elif keyword == "CRK":
-                sheet[f"{col_chooser['CRACKED Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "CL2":
-                sheet[f"{col_chooser['CLASS2 Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "UG":
-                sheet[f"{col_chooser['UG Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "OTHER":
-                sheet[f"{col_chooser['OTHER DBR Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "DHB":
-                sheet[f"{col_chooser['DHB Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-            elif not re.match(r'^(\d+(\.\d+)?|\d+|\d+\s\d+/\d+|\d+/\d+)$', keyword.replace('_', ' ')):
-                if i + 1 < n:  
-                    next_keyword = keywords[i + 1].replace('_', ' ')
-                    if re.match(r'^(\d+(\.\d+)?|\d+|\d+\s\d+/\d+|\d+/\d+)$', next_keyword):
-                        sheet[f"{col_chooser['Not Recognized Keywords'][col_name][reptyp]}{row_num}"] = f"{keyword} {next_keyword}"
-                        continue  
-                sheet[f"{col_chooser['Not Recognized Keywords'][col_name][reptyp]}{row_num}"] = keyword
-
-
-
-            if len(keyword) == 3 and keyword.isdigit():
-                sheet[f"{col_chooser['Critical Lengths'][col_name][reptyp]}{row_num}"] = keyword
-
-
-
-
-    def process_box_pin_col(col_name, col_value, row_num, sheet):
-        keywords = col_value.split()
-        n = len(keywords)
-        for i in range(n):
-            keyword = keywords[i]
-            if len(keyword) == 3 and keyword.isdigit():
-                sheet[f"{col_chooser['Critical Lengths'][col_name][reptyp]}{row_num}"] = keyword
-            elif keyword == "TS":
-                process_ts_keyword(col_name, keywords, keyword, row_num, sheet)
-            elif keyword == "TJ":
-                process_tj_keyword(col_name, keywords, keyword, row_num, sheet)
-            elif keyword == "BD":
-                process_bd_keyword(col_name, keywords, keyword, row_num, sheet)
-            elif keyword == "MT":
-                sheet[f"{col_chooser['MT Tally'][col_name][reptyp]}{row_num}"] = "X"
-                process_mtong_keyword(col_name, keywords, keyword, row_num, sheet)
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "MBD":
-                sheet[f"{col_chooser['MBD Tally'][col_name][reptyp]}{row_num}"] = "X"
-                process_mbd_keyword(col_name, keywords, keyword, row_num, sheet)
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "DS":
-                sheet[f"{col_chooser['DS Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "DT":
-                sheet[f"{col_chooser['DT Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "DTS":
-                sheet[f"{col_chooser['DTS Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "PIT":
-                sheet[f"{col_chooser['PIT Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "OR":
-                sheet[f"{col_chooser['OR Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "DHB":
-                sheet[f"{col_chooser['DHB Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "HB":
-                sheet[f"{col_chooser['HB Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "DBRHB":
-                sheet[f"{col_chooser['DBRHB Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "HBCP":
-                sheet[f"{col_chooser['HBCP Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "R1":
-                sheet[f"{col_chooser['R Tally'][col_name][reptyp]}{row_num}"] = "X"
-                sheet[f"{col_chooser['R Type'][col_name][reptyp]}{row_num}"] = 1
-                process_r_keyword(col_name, keywords, row_num, sheet)
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "R2":
-                sheet[f"{col_chooser['R Tally'][col_name][reptyp]}{row_num}"] = "X"
-                sheet[f"{col_chooser['R Type'][col_name][reptyp]}{row_num}"] = 2
-                process_r_keyword(col_name, keywords, row_num, sheet)
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "R3":
-                sheet[f"{col_chooser['R Tally'][col_name][reptyp]}{row_num}"] = "X"
-                sheet[f"{col_chooser['R Type'][col_name][reptyp]}{row_num}"] = 3
-                process_r_keyword(col_name, keywords, row_num, sheet)
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "R4":
-                sheet[f"{col_chooser['R Tally'][col_name][reptyp]}{row_num}"] = "X"
-                sheet[f"{col_chooser['R Type'][col_name][reptyp]}{row_num}"] = 4
-                process_r_keyword(col_name, keywords, row_num, sheet)
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "SW":
-                sheet[f"{col_chooser['SW Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "SB":
-                sheet[f"{col_chooser['SB Tally'][col_name][reptyp]}{row_num}"] = "X"
-                process_short_keywords(col_name, keywords, keyword, row_num, sheet)
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "SP":
-                sheet[f"{col_chooser['SP Tally'][col_name][reptyp]}{row_num}"] = "X"
-                process_short_keywords(col_name, keywords, keyword, row_num, sheet)
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "ODAM":
-                sheet[f"{col_chooser['Other Damages Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-            elif not re.match(r'^(\d+(\.\d+)?|\d+|\d+\s\d+/\d+|\d+/\d+)$', keyword.replace('_', ' ')):
-                if i + 1 < n:  
-                    next_keyword = keywords[i + 1].replace('_', ' ')
-                    if re.match(r'^(\d+(\.\d+)?|\d+|\d+\s\d+/\d+|\d+/\d+)$', next_keyword):
-                        sheet[f"{col_chooser['Not Recognized Keywords'][col_name][reptyp]}{row_num}"] = f"{keyword} {next_keyword}"
-                        continue  
-                sheet[f"{col_chooser['Not Recognized Keywords'][col_name][reptyp]}{row_num}"] = keyword
-
-
-
-    def process_ts_keyword(col_name, keywords, keyword, row_num, sheet):
-        keywords = col_value.split()
-        n = len(keywords)
-        ts_index = keywords.index(keyword)
-        if ts_index < n - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[ts_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Tong Space'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ')
-    def process_tj_keyword(col_name, keywords, keyword, row_num, sheet):
-        keywords = col_value.split()
-        n = len(keywords)
-        tj_index = keywords.index(keyword)
-        if tj_index < n - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[tj_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Tool Joint'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ')
-    def process_bd_keyword(col_name, keywords, keyword, row_num, sheet):
-        keywords = col_value.split()
-        n = len(keywords)
-        bd_index = keywords.index(keyword)
-        if bd_index < n - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[bd_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Bevel Diameter'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ')
-
-
-    def process_short_keywords(col_name, keywords, keyword, row_num, sheet):
-        sb_index = keywords.index(keyword) if keyword == "SB" else None
-        sp_index = keywords.index(keyword) if keyword == "SP" else None 
-        short_index = sb_index if sb_index is not None else sp_index
-        if short_index < len(keywords) -1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[short_index + 1]
-            if fraction_dec_pat.match(val_match):
-                if keyword == "SB":
-                    sheet[f"{col_chooser['Tool Joint']['BOX'][reptyp]}{row_num}"] = val_match.replace('_', ' ') 
-                elif keyword == "SP":
-                    sheet[f"{col_chooser['Tool Joint']['PIN'][reptyp]}{row_num}"] = val_match.replace('_', ' ') 
-
-    def process_long_keywords(col_name, keywords, keyword, row_num, sheet):
-        lp_index = keywords.index(keyword) if keyword == "LP" else None  
-        lb_index = keywords.index(keyword) if keyword == "LB" else None
-        long_index = lp_index if lp_index is not None else lb_index
-        if long_index < len(keywords) - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[long_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Tool Joint'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ') 
-
-
-    def process_mtong_keyword(col_name, keywords, keyword, row_num, sheet):
-        mt_index = keywords.index(keyword)
-        if mt_index < len(keywords) - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[mt_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Tong Space'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ')
-    def process_mbd_keyword(col_name, keywords, keyword, row_num, sheet):
-        mbd_index = keywords.index(keyword)
-        if mbd_index < len(keywords) - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[mbd_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Bevel Diameter'][col_name][reptyp]}{row_num}"]  = val_match.replace('_', ' ')
-    def process_r_keyword(col_name, keywords, row_num, sheet):
-        for keyword in keywords:
-            if keyword in ["R1", "R2", "R3", "R4"]:
-                r_index = keywords.index(keyword)
-        if r_index < len(keywords) - 1 and keywords[r_index + 1].isdigit() and len(keywords[r_index + 1]) == 6:
-            sheet[f"{col_chooser['R Value'][col_name][reptyp]}{row_num}"] = keywords[r_index + 1]
-
-    for col_name, col_value in joint_values.items():
-        col_value = re.sub(r'(\d+)\s(\d+/\d+)', r'\1_\2', col_value)
-        if col_name in ["BOX", "PIN"]:
-            process_box_pin_col(col_name, col_value, row_num, sheet)
-        elif col_name == "UT":
-            sheet[f"{col_chooser['UT Value'][col_name][reptyp]}{row_num}"] = col_value
-        elif col_name == "SERIAL":
-            sheet[f"{col_chooser['Serial #'][col_name][reptyp]}{row_num}"]  = col_value
-        elif col_name == "TUBE":
-            process_tube_col(col_name, col_value, row_num, sheet)
-        elif col_name == "BD-BOX":
-            if col_value != "":
-                sheet[f"{col_chooser['Bevel Diameter'][col_name][reptyp]}{row_num}"] = col_value.replace('_', ' ')
-        elif col_name == "BD-PIN":
-            if col_value != "":
-                sheet[f"{col_chooser['Bevel Diameter'][col_name][reptyp]}{row_num}"] = col_value.replace('_', ' ')
-        elif col_name == "ID":
-            if col_value != "":
-                sheet[f"{col_chooser['Tool Joint'][col_name][reptyp]}{row_num}"] = col_value.replace('_', ' ')
-        elif col_name == "OD":
-            if col_value != "":
-                sheet[f"{col_chooser['Tool Joint'][col_name][reptyp]}{row_num}"] = col_value.replace('_', ' ')
-        elif col_name == "TS-PIN":
-            if col_value != "":
-                sheet[f"{col_chooser['Tong Space'][col_name][reptyp]}{row_num}"] = col_value.replace('_', ' ')
-        elif col_name == "TS-BOX":
-            if col_value != "":
-                sheet[f"{col_chooser['Tong Space'][col_name][reptyp]}{row_num}"] = col_value.replace('_', ' ')
-        elif col_name == "DESCRIPTION":
-            sheet[f"C{row_num}"] = col_value
-        elif col_name == "SUBS CONN/DATA":
-            sheet[f"{col_chooser['SUBS CONN/DATA'][col_name][reptyp]}{row_num}"] = col_value
-        elif col_name == "COMMENTS":
-            sheet[f"{col_chooser['COMMENTS'][col_name][reptyp]}{row_num}"] = col_value
-
 def process_for_write_report_nd_pdpir(joint_values, row_num, sheet, datmg):
     reptyp = datmg.json_data_dict['report_user_metadata']['active_tab']
-    taldict = datmg.keyword_tally_dict["Keyword Tallies"]
-    joint_dict = datmg.keyword_tally_dict["Joint Tallies"]
-
-    def update_keyword_tally(tally_dict, keyword):
-        if keyword not in tally_dict:
-            tally_dict[keyword] = 0
-        tally_dict[keyword] += 1
-
-    col_chooser = {
-        "Tong Space": {
-            "BOX": {"Prop Drill Pipe Inp Report": "L" , "Prop HWDP Inp Report": "J" , "Prop Subs Inp Report": "J" },
-            "PIN": {"Prop Drill Pipe Inp Report": "M", "Prop HWDP Inp Report": "K", "Prop Subs Inp Report": "K" },
-            "TS-BOX": {"Prop Drill Pipe Inp Report": "L" , "Prop HWDP Inp Report": "J" , "Prop Subs Inp Report": "J" },
-            "TS-PIN": {"Prop Drill Pipe Inp Report": "M", "Prop HWDP Inp Report": "K", "Prop Subs Inp Report": "K" }
-        },
-        "Bevel Diameter": {
-            "BOX": {"Prop Drill Pipe Inp Report": "J", "Prop HWDP Inp Report": "L", "Prop Subs Inp Report": "L"},
-            "PIN": {"Prop Drill Pipe Inp Report": "K", "Prop HWDP Inp Report": "M", "Prop Subs Inp Report": "M"},
-        },
-        "Tool Joint": {
-            "BOX": {"Prop Drill Pipe Inp Report": "H", "Prop HWDP Inp Report": "G", "Prop Subs Inp Report": "G" },
-            "PIN": {"Prop Drill Pipe Inp Report": "I", "Prop HWDP Inp Report": "H", "Prop Subs Inp Report": "H"},
-            "ID": {"Prop Drill Pipe Inp Report": "I", "Prop HWDP Inp Report": "H", "Prop Subs Inp Report": "H"},
-            "OD": {"Prop Drill Pipe Inp Report": "H", "Prop HWDP Inp Report": "G", "Prop Subs Inp Report": "G" },
-            "TUBE": {"Prop Drill Pipe Inp Report": "H", "Prop HWDP Inp Report": "G", "Prop Subs Inp Report": "G" }
-        },
-        "Serial #": {
-            "SERIAL": {"Prop Drill Pipe Inp Report": "C" , "Prop HWDP Inp Report": "D" , "Prop Subs Inp Report": "D"},
-        },
-        "Critical Lengths": {
-            "BOX": {"Prop Drill Pipe Inp Report": "BO", "Prop HWDP Inp Report": "BO", "Prop Subs Inp Report": "BO" },
-            "PIN": {"Prop Drill Pipe Inp Report": "BR", "Prop HWDP Inp Report": "BR", "Prop Subs Inp Report": "BR" }
-        },
-        "R Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "R" , "Prop HWDP Inp Report": "R" , "Prop Subs Inp Report": "O" },
-            "PIN": {"Prop Drill Pipe Inp Report": "S" , "Prop HWDP Inp Report": "S" , "Prop Subs Inp Report": "P" }
-        },
-        "R Value": {
-            "BOX": {"Prop Drill Pipe Inp Report": "BN" , "Prop HWDP Inp Report": "BN" , "Prop Subs Inp Report": "BN" },
-            "PIN": {"Prop Drill Pipe Inp Report": "BQ" , "Prop HWDP Inp Report": "BQ" , "Prop Subs Inp Report": "BQ" }
-        },
-        "UT Value": {
-            "UT": {"Prop Drill Pipe Inp Report": "BT" , "Prop HWDP Inp Report": "BT" , "Prop Subs Inp Report": "BT" },
-        },
-        "DS Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "T" , "Prop HWDP Inp Report": "T" , "Prop Subs Inp Report": "Q" },
-            "PIN": {"Prop Drill Pipe Inp Report": "U" , "Prop HWDP Inp Report": "U" , "Prop Subs Inp Report": "R" }
-        },
-        "DT Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "V" , "Prop HWDP Inp Report": "V" , "Prop Subs Inp Report": "S" },
-            "PIN": {"Prop Drill Pipe Inp Report": "W" , "Prop HWDP Inp Report": "W" , "Prop Subs Inp Report": "T" }
-        },
-        "SB/SP Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "X" , "Prop HWDP Inp Report": "X" , "Prop Subs Inp Report": "U" },
-            "PIN": {"Prop Drill Pipe Inp Report": "X" , "Prop HWDP Inp Report": "X" , "Prop Subs Inp Report": "U" }
-        },
-        "LB/LP Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "Y" , "Prop HWDP Inp Report": "Y" , "Prop Subs Inp Report": "V" },
-            "PIN": {"Prop Drill Pipe Inp Report": "Y" , "Prop HWDP Inp Report": "Y" , "Prop Subs Inp Report": "V" }
-        },
-        "OR Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "Z" , "Prop HWDP Inp Report": "Z" , "Prop Subs Inp Report": "W" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AA" , "Prop HWDP Inp Report": "AA" , "Prop Subs Inp Report": "X" }
-        },
-        "BNT Tally": {
-            "TUBE": {"Prop Drill Pipe Inp Report": "AB" , "Prop HWDP Inp Report": "AB" , "Prop Subs Inp Report": "Y"}
-        },
-        "Other Damages Tally": {
-            "TUBE": {"Prop Drill Pipe Inp Report": "AC" , "Prop HWDP Inp Report": "AC" , "Prop Subs Inp Report": "AB" },
-            "BOX": {"Prop Drill Pipe Inp Report": "AC" , "Prop HWDP Inp Report": "AC" , "Prop Subs Inp Report": "AC" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AD" , "Prop HWDP Inp Report": "AD" , "Prop Subs Inp Report": "AC" }
-        },
-        "BOX/PIN Other Damages Tally": {
-            "TUBE": {"Prop Drill Pipe Inp Report": "AD" , "Prop HWDP Inp Report": "AD" , "Prop Subs Inp Report": "AC" },
-            "BOX": {"Prop Drill Pipe Inp Report": "AE" , "Prop HWDP Inp Report": "AE" , "Prop Subs Inp Report": "Z" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AF" , "Prop HWDP Inp Report": "AF" , "Prop Subs Inp Report": "AA" }
-        },
-        "DHB Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AG" , "Prop HWDP Inp Report": "AG" , "Prop Subs Inp Report": "AD" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AH" , "Prop HWDP Inp Report": "AH" , "Prop Subs Inp Report": "AE" }
-        },
-        "HB Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AI" , "Prop HWDP Inp Report": "AI" , "Prop Subs Inp Report": "AF" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AL" , "Prop HWDP Inp Report": "AL" , "Prop Subs Inp Report": "AI" }
-        },
-        "HBCP Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AJ" , "Prop HWDP Inp Report": "AJ" , "Prop Subs Inp Report": "AG" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AK" , "Prop HWDP Inp Report": "AK" , "Prop Subs Inp Report": "AH" }
-        },
-        "DBRHB Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AM" , "Prop HWDP Inp Report": "AM" , "Prop Subs Inp Report": "AJ" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AN" , "Prop HWDP Inp Report": "AN" , "Prop Subs Inp Report": "AK" }
-        },
-        "MW Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AO" , "Prop HWDP Inp Report": "AO" , "Prop Subs Inp Report": "AL" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AO" , "Prop HWDP Inp Report": "AO" , "Prop Subs Inp Report": "AL" },
-            "TUBE": {"Prop Drill Pipe Inp Report": "AO" , "Prop HWDP Inp Report": "AO" , "Prop Subs Inp Report": "AL" }
-        },
-        "MT Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AP" , "Prop HWDP Inp Report": "AP" , "Prop Subs Inp Report": "AM" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AQ" , "Prop HWDP Inp Report": "AQ" , "Prop Subs Inp Report": "AN" },
-        },
-        "MS Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AR" , "Prop HWDP Inp Report": "AR" , "Prop Subs Inp Report": "AO" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AS" , "Prop HWDP Inp Report": "AS" , "Prop Subs Inp Report": "AP" },
-        },
-        "MOD Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AT" , "Prop HWDP Inp Report": "AT" , "Prop Subs Inp Report": "AQ" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AT" , "Prop HWDP Inp Report": "AT" , "Prop Subs Inp Report": "AQ" },
-            "TUBE": {"Prop Drill Pipe Inp Report": "AT" , "Prop HWDP Inp Report": "AT" , "Prop Subs Inp Report": "AQ" },
-        },
-        "DAM Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AU" , "Prop HWDP Inp Report": "AU" , "Prop Subs Inp Report": "AR" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AU" , "Prop HWDP Inp Report": "AU" , "Prop Subs Inp Report": "AR" },
-            "TUBE": {"Prop Drill Pipe Inp Report": "AU" , "Prop HWDP Inp Report": "AU" , "Prop Subs Inp Report": "AR" },
-        },
-        "EMI Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AV" , "Prop HWDP Inp Report": "AV" , "Prop Subs Inp Report": "AS" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AV" , "Prop HWDP Inp Report": "AV" , "Prop Subs Inp Report": "AS" },
-            "TUBE": {"Prop Drill Pipe Inp Report": "AV" , "Prop HWDP Inp Report": "AV" , "Prop Subs Inp Report": "AS" },
-        },
-        "OTHER Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AW" , "Prop HWDP Inp Report": "AW" , "Prop Subs Inp Report": "AT" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AW" , "Prop HWDP Inp Report": "AW" , "Prop Subs Inp Report": "AT" },
-            "TUBE": {"Prop Drill Pipe Inp Report": "AW" , "Prop HWDP Inp Report": "AW" , "Prop Subs Inp Report": "AT" },
-        },
-        "TR Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AX" , "Prop HWDP Inp Report": "AX" , "Prop Subs Inp Report": "AU" },
-            "PIN": {"Prop Drill Pipe Inp Report": "AY" , "Prop HWDP Inp Report": "AY" , "Prop Subs Inp Report": "AV" },
-        },
-        "BVR Tally": {
-            "BOX": {"Prop Drill Pipe Inp Report": "AZ" , "Prop HWDP Inp Report": "AZ" , "Prop Subs Inp Report": "AW" },
-            "PIN": {"Prop Drill Pipe Inp Report": "BA" , "Prop HWDP Inp Report": "BA" , "Prop Subs Inp Report": "AX" },
-        },
-        "Not Recognized Keywords": {
-            "BOX": {"Prop Drill Pipe Inp Report": "BU" , "Prop HWDP Inp Report": "BU" , "Prop Subs Inp Report": "BU" },
-            "PIN": {"Prop Drill Pipe Inp Report": "BW" , "Prop HWDP Inp Report": "BW" , "Prop Subs Inp Report": "BW" },
-            "TUBE": {"Prop Drill Pipe Inp Report": "BV" , "Prop HWDP Inp Report": "BV" , "Prop Subs Inp Report": "BV" }
-        }
-    }
-
-    def process_tube_col(col_name, col_value, row_num, sheet):
-        keywords = col_value.split()
-        n = len(keywords)
-        for i in range(n):
-            keyword = keywords[i]
-            if keyword == "MW":
-                sheet[f"{col_chooser['MW Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-                update_keyword_tally(joint_dict, 'Scrap')
-            elif keyword == "MOD":
-                sheet[f"{col_chooser['MOD Tally'][col_name][reptyp]}{row_num}"] = "X"
-                process_mod_keyword(col_name, keywords, keyword, row_num, sheet)
-                update_keyword_tally(taldict, keyword)
-                update_keyword_tally(joint_dict, 'Scrap')
-            elif keyword == "DAM":
-                sheet[f"{col_chooser['DAM Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-                update_keyword_tally(joint_dict, 'Scrap')
-            elif keyword == "EMI":
-                sheet[f"{col_chooser['EMI Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-                update_keyword_tally(joint_dict, 'Scrap')
-            elif keyword == "OTHER":
-                sheet[f"{col_chooser['OTHER Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-                update_keyword_tally(joint_dict, 'Scrap')
-            elif keyword == "BNT" or keyword == "BENT":
-                sheet[f"{col_chooser['BNT Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, "BNT")
-                update_keyword_tally(joint_dict, 'Repairable')
-            elif not re.match(r'^(\d+(\.\d+)?|\d+|\d+\s\d+/\d+|\d+/\d+)$', keyword.replace('_', ' ')):
-                if i + 1 < n:  
-                    next_keyword = keywords[i + 1].replace('_', ' ')
-                    if re.match(r'^(\d+(\.\d+)?|\d+|\d+\s\d+/\d+|\d+/\d+)$', next_keyword):
-                        sheet[f"{col_chooser['Not Recognized Keywords'][col_name][reptyp]}{row_num}"] = f"{keyword} {next_keyword}"
-                        continue  
-                sheet[f"{col_chooser['Not Recognized Keywords'][col_name][reptyp]}{row_num}"] = keyword
-
-
-
-    def process_box_pin_col(col_name, col_value, row_num, sheet):
-        keywords = col_value.split()
-        n = len(keywords)
-        for i in range(n):
-            keyword = keywords[i]
-            if len(keyword) == 3 and keyword.isdigit():
-                sheet[f"{col_chooser['Critical Lengths'][col_name][reptyp]}{row_num}"] = keyword
-            elif keyword == "TJ":
-                process_tj_keyword(col_name, keywords, keyword, row_num, sheet)
-            elif keyword == "TS":
-                process_ts_keyword(col_name, keywords, keyword, row_num, sheet)
-            elif keyword == "BD":
-                process_bd_keyword(col_name, keywords, keyword, row_num, sheet)
-            elif keyword == "MT":
-                sheet[f"{col_chooser['MT Tally'][col_name][reptyp]}{row_num}"] = "X"
-                process_mtong_keyword(col_name, keywords, keyword, row_num, sheet)
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-                update_keyword_tally(joint_dict, 'Scrap')
-            elif keyword == "MS":
-                sheet[f"{col_chooser['MS Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-                update_keyword_tally(joint_dict, 'Scrap')
-            elif keyword == "DS":
-                sheet[f"{col_chooser['DS Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-                update_keyword_tally(joint_dict, 'Repairable')
-            elif keyword == "DT":
-                sheet[f"{col_chooser['DT Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-                update_keyword_tally(joint_dict, 'Repairable')
-            elif keyword == "OR":
-                sheet[f"{col_chooser['OR Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-                update_keyword_tally(joint_dict, 'Repairable')
-            elif keyword == "DHB":
-                sheet[f"{col_chooser['DHB Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "HB":
-                sheet[f"{col_chooser['HB Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "DBRHB":
-                sheet[f"{col_chooser['DBRHB Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "HBCP":
-                sheet[f"{col_chooser['HBCP Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "MOD":
-                sheet[f"{col_chooser['MOD Tally'][col_name][reptyp]}{row_num}"] = "X"
-                process_mod_keyword(col_name, keywords, keyword, row_num, sheet)
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "R":
-                sheet[f"{col_chooser['R Tally'][col_name][reptyp]}{row_num}"] = "X"
-                process_r_keyword(col_name, keywords, row_num, sheet)
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-            elif keyword == "SB" or keyword == "SP":
-                sheet[f"{col_chooser['SB/SP Tally'][col_name][reptyp]}{row_num}"] = "X"
-                process_short_keywords(col_name, keywords, keyword, row_num, sheet)
-                update_keyword_tally(taldict, f"{keyword}")
-                update_keyword_tally(joint_dict, 'Repairable')
-            elif keyword == "LB" or keyword == "LP":
-                sheet[f"{col_chooser['LB/LP Tally'][col_name][reptyp]}{row_num}"] = "X"
-                process_long_keywords(col_name, keywords, keyword, row_num, sheet)
-                update_keyword_tally(taldict, f"{keyword}")
-                update_keyword_tally(joint_dict, 'Repairable')
-            elif keyword == "ODAM":
-                sheet[f"{col_chooser['Other Damages Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-                update_keyword_tally(joint_dict, 'Repairable')
-            elif keyword == "OTH":
-                sheet[f"{col_chooser['BOX/PIN Other Damages Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-                update_keyword_tally(joint_dict, 'Repairable')
-            elif keyword == "TR":
-                sheet[f"{col_chooser['TR Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-                update_keyword_tally(joint_dict, 'Repairable')
-            elif keyword == "BVR":
-                sheet[f"{col_chooser['BVR Tally'][col_name][reptyp]}{row_num}"] = "X"
-                update_keyword_tally(taldict, f"{keyword}-{col_name}")
-                update_keyword_tally(joint_dict, 'Repairable')
-            elif not re.match(r'^(\d+(\.\d+)?|\d+|\d+\s\d+/\d+|\d+/\d+)$', keyword.replace('_', ' ')):
-                if i + 1 < n:  
-                    next_keyword = keywords[i + 1].replace('_', ' ')
-                    if re.match(r'^(\d+(\.\d+)?|\d+|\d+\s\d+/\d+|\d+/\d+)$', next_keyword):
-                        sheet[f"{col_chooser['Not Recognized Keywords'][col_name][reptyp]}{row_num}"] = f"{keyword} {next_keyword}"
-                        continue  
-                sheet[f"{col_chooser['Not Recognized Keywords'][col_name][reptyp]}{row_num}"] = keyword
-
-
-
-    def process_ts_keyword(col_name, keywords, keyword, row_num, sheet):
-        keywords = col_value.split()
-        n = len(keywords)
-        ts_index = keywords.index(keyword)
-        if ts_index < n - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[ts_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Tong Space'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ')
-    def process_tj_keyword(col_name, keywords, keyword, row_num, sheet):
-        keywords = col_value.split()
-        n = len(keywords)
-        tj_index = keywords.index(keyword)
-        if tj_index < n - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[tj_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Tool Joint'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ')
-    def process_bd_keyword(col_name, keywords, keyword, row_num, sheet):
-        keywords = col_value.split()
-        n = len(keywords)
-        bd_index = keywords.index(keyword)
-        if bd_index < n - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[bd_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Bevel Diameter'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ')
-
-
-
-
-    def process_short_keywords(col_name, keywords, keyword, row_num, sheet):
-        sb_index = keywords.index(keyword) if keyword == "SB" else None
-        sp_index = keywords.index(keyword) if keyword == "SP" else None 
-        short_index = sb_index if sb_index is not None else sp_index
-        if short_index < len(keywords) -1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[short_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Tool Joint'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ') 
-
-    def process_long_keywords(col_name, keywords, keyword, row_num, sheet):
-        lp_index = keywords.index(keyword) if keyword == "LP" else None  
-        lb_index = keywords.index(keyword) if keyword == "LB" else None
-        long_index = lp_index if lp_index is not None else lb_index
-        if long_index < len(keywords) - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[long_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Tool Joint'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ') 
-
-
-    def process_mtong_keyword(col_name, keywords, keyword, row_num, sheet):
-        mt_index = keywords.index(keyword)
-        if mt_index < len(keywords) - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[mt_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Tong Space'][col_name][reptyp]}{row_num}"] = val_match.replace('_', ' ')
-
-
-    def process_mod_keyword(col_name, keywords, keyword, row_num, sheet):
-        mod_index = keywords.index(keyword)
-        if mod_index < len(keywords) - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[mod_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"{col_chooser['Tool Joint']['BOX'][reptyp]}{row_num}"]  = val_match.replace('_', ' ')
-
-    def process_r_keyword(col_name, keywords, row_num, sheet):
-        r_index = keywords.index("R")
-        if r_index < len(keywords) - 1 and keywords[r_index + 1].isdigit() and len(keywords[r_index + 1]) == 6:
-            sheet[f"{col_chooser['R Value'][col_name][reptyp]}{row_num}"] = keywords[r_index + 1]
+    write_shorthand_joint(shorthand_styles['nd_pdpir'], joint_values, row_num, sheet, datmg, shorthand_column_map('nd_pdpir', nd_pdpir_col_chooser, reptyp), reptyp)
 
-    for col_name, col_value in joint_values.items():
-        col_value = re.sub(r'(\d+)\s(\d+/\d+)', r'\1_\2', col_value)
-        if col_name in ["BOX", "PIN"]:
-            process_box_pin_col(col_name, col_value, row_num, sheet)
-        elif col_name == "UT":
-            sheet[f"{col_chooser['UT Value'][col_name][reptyp]}{row_num}"] = col_value
-        elif col_name == "SERIAL":
-            sheet[f"{col_chooser['Serial #'][col_name][reptyp]}{row_num}"]  = col_value
-        elif col_name == "TUBE":
-            process_tube_col(col_name, col_value, row_num, sheet)
-        elif col_name == "ID":
-            if col_value != "":
-                sheet[f"{col_chooser['Tool Joint'][col_name][reptyp]}{row_num}"] = col_value.replace('_', ' ')
-        elif col_name == "OD":
-            if col_value != "":
-                sheet[f"{col_chooser['Tool Joint'][col_name][reptyp]}{row_num}"] = col_value.replace('_', ' ')
-        elif col_name == "TS-PIN":
-            if col_value != "":
-                sheet[f"{col_chooser['Tong Space'][col_name][reptyp]}{row_num}"] = col_value.replace('_', ' ')
-        elif col_name == "TS-BOX":
-            if col_value != "":
-                sheet[f"{col_chooser['Tong Space'][col_name][reptyp]}{row_num}"] = col_value.replace('_', ' ')
-        elif col_name == "DESCRIPTION":
-            sheet[f"C{row_num}"] = col_value
-        elif col_name == "SUBS CONN/DATA":
-            sheet[f"N{row_num}"] = col_value
-        elif col_name == "COMMENTS":
-            sheet[f"BX{row_num}"] = col_value
 
 def generate_summary_entry_tx_fd(tot_joints, keyword_tally_dict, datmg):
     joint_tallies = keyword_tally_dict.get("Joint Tallies", {})
@@ -5182,183 +6500,50 @@ def generate_summary_entry_ndtube(keyword_tally_dict, datmg):
 
 
 
+nd_tubing_col_chooser = {
+    "Box/Pin": {"BOX": "J", "PIN": "L"},
+    "DB": {"BOX": "K", "PIN": "K", "TUBE": "K"},
+    "DP": {"BOX": "M", "PIN": "M", "TUBE": "M"},
+    "Bent": {"TUBE": "E"},
+    "Tube Damage": {"TUBE": "F"},
+    "Wall": {"TUBE": "G"},
+    "Drift": {"TUBE": "H"},
+    "EMI": {"TUBE": "I"},
+    "SC Measure": {"TUBE": "O"},
+    "YB": {"TUBE": "P"},
+    "BB": {"TUBE": "Q"},
+    "Tube Serial": {"TUBE": "AU"},
+    "Not Recognized Keywords": {"BOX": "AV", "PIN": "AV", "TUBE": "AV"},
+    "UT": {"UT": "AT"},
+    "COMMENTS": {"COMMENTS": "S"},
+    "Visual OD": {"Visual OD": "AX"},
+    "Final Class": {"JOINT": "N"}
+}
+
+
 def process_for_write_report_nd_tubing(joint_values, row_num, sheet, datmg):
-    taldict = datmg.keyword_tally_dict["Keyword Tallies"]
     joint_dict = datmg.keyword_tally_dict["Joint Tallies"]
+    columns = shorthand_column_map('nd_tubing', nd_tubing_col_chooser)
 
     def update_keyword_tally(tally_dict, keyword):
         if keyword not in tally_dict:
             tally_dict[keyword] = 0
         tally_dict[keyword] += 1
 
-
-    scrap_col = False  
-    repair_col = False 
-    ready_col = True
-    hb_col = False
-
     #START HERE -- NEED TO IMPLEMENT LOGIC FOR THE FINAL CLASS KEYS AND YB, BB, and TALLIES
-    def process_tube_ser_for_tally(col_name, col_value, row_num, sheet):
-        keywords = col_value.split()
-        for keyword in keywords:
-            if len(keyword) == 4 and keyword.isdigit():
-                sheet[f"AU{row_num}"] = keyword
-
-    def process_box_pin_col(col_name, col_value, row_num, sheet):
-        nonlocal scrap_col, repair_col, hb_col
-        keywords = col_value.split()
-        n = len(keywords)
-        for i in range(n):
-            keyword = keywords[i]
-            if keyword == "DP":
-                repair_col = True
-                sheet[f"M{row_num}"] = "DP"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "DB":
-                repair_col = True
-                sheet[f"K{row_num}"] = "DB"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "HB":
-                hb_col = True
-                if col_name == "BOX":
-                    sheet[f"J{row_num}"] = "HB"
-                    update_keyword_tally(taldict, "HB-BOX")
-                elif col_name == "PIN":
-                    sheet[f"L{row_num}"] = "HB"
-                    update_keyword_tally(taldict, "HB-PIN")
-            elif not re.match(r'^(\d+(\.\d+)?|\d+|\d+\s\d+/\d+|\d+/\d+)$', keyword.replace('_', ' ')):
-                if i + 1 < n:  
-                    next_keyword = keywords[i + 1].replace('_', ' ')
-                    if re.match(r'^(\d+(\.\d+)?|\d+|\d+\s\d+/\d+|\d+/\d+)$', next_keyword):
-                        sheet[f"AV{row_num}"] = f"{keyword} {next_keyword}"
-                        continue  
-                sheet[f"AV{row_num}"] = keyword
-            else:
-                fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-                if col_name == "BOX" and fraction_dec_pat.match(keyword):
-                    sheet[f"J{row_num}"] = keyword.replace('_', ' ') 
-                elif col_name == "PIN" and fraction_dec_pat.match(keyword):
-                    sheet[f"L{row_num}"] = keyword.replace('_', ' ') 
-
-    def process_tube_col(col_name, col_value, row_num, sheet):
-        nonlocal scrap_col, repair_col
-        keywords = col_value.split()
-        n = len(keywords)
-        for i in range(n):
-            keyword = keywords[i]
-            if keyword == "BNT" or keyword == "BT":
-                sheet[f"E{row_num}"] = "BENT"
-                repair_col = True
-                update_keyword_tally(taldict, "BNT")
-            elif keyword == "DP":
-                repair_col = True
-                sheet[f"M{row_num}"] = "DP"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "DB":
-                repair_col = True
-                sheet[f"K{row_num}"] = "DB"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "BNTDBR" or keyword == "BTDBR":
-                sheet[f"E{row_num}"] = "BENT DBR"
-                scrap_col = True
-                update_keyword_tally(taldict, "BNTDBR")
-            elif keyword == "SC":
-                scrap_col = True
-                sheet[f"F{row_num}"] = "SC"
-                process_sc_measure_keyword(col_name, keywords, keyword, row_num, sheet)
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "SCR":
-                sheet[f"F{row_num}"] = "SC-R"
-                process_sc_measure_keyword(col_name, keywords, keyword, row_num, sheet)
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "GOU":
-                scrap_col = True
-                sheet[f"F{row_num}"] = "GOU"
-                process_sc_measure_keyword(col_name, keywords, keyword, row_num, sheet)
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "TC": 
-                scrap_col = True 
-                sheet[f"F{row_num}"] = "TC"
-                process_sc_measure_keyword(col_name, keywords, keyword, row_num, sheet)
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "MW":
-                scrap_col = True
-                sheet[f"G{row_num}"] = "MW"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "RW":
-                scrap_col = True
-                sheet[f"G{row_num}"] = "RW"
-                update_keyword_tally(taldict, keyword)   
-            elif keyword == "PIT":
-                scrap_col = True
-                sheet[f"G{row_num}"] = "Pit"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "MASH":
-                scrap_col = True
-                sheet[f"G{row_num}"] = "Mashed"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "NODRIFT":
-                scrap_col = True
-                sheet[f"H{row_num}"] = "NO"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "EMI":
-                scrap_col = True
-                sheet[f"I{row_num}"] = "EMI"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "OTHER":
-                scrap_col = True 
-                sheet[f"G{row_num}"] = "OTHER"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "BB":
-                sheet[f"Q{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-            elif keyword == "YB":
-                sheet[f"P{row_num}"] = "X"
-                update_keyword_tally(taldict, keyword)
-            elif not re.match(r'^(\d+(\.\d+)?|\d+|\d+\s\d+/\d+|\d+/\d+)$', keyword.replace('_', ' ')):
-                if i + 1 < n:  
-                    next_keyword = keywords[i + 1].replace('_', ' ')
-                    if re.match(r'^(\d+(\.\d+)?|\d+|\d+\s\d+/\d+|\d+/\d+)$', next_keyword):
-                        sheet[f"AV{row_num}"] = f"{keyword} {next_keyword}"
-                        continue  
-                sheet[f"AV{row_num}"] = keyword
-
-    def process_sc_measure_keyword(col_name, keywords, keyword, row_num, sheet):
-        measure_index = keywords.index(keyword)
-        if measure_index < len(keywords) - 1:
-            fraction_dec_pat = re.compile(r'((\d+_)?\d+/\d+|\d+(\.\d{3})?)')
-            val_match = keywords[measure_index + 1]
-            if fraction_dec_pat.match(val_match):
-                sheet[f"O{row_num}"] = val_match.replace('_', ' ')  
-
-    def write_final_class_status(scrap_col, repair_col, ready_col, hb_col, row_num):
-        # Check if the item is marked as scrap
-        if scrap_col:
-            sheet[f"N{row_num}"] = 'Scrap'
-            update_keyword_tally(joint_dict, "Scrap")
-        elif repair_col:
-            sheet[f"N{row_num}"] = 'Repairable'
-            update_keyword_tally(joint_dict, "Repairable")
-        elif ready_col:
-            update_keyword_tally(joint_dict, "Ready")
-            if hb_col == True:
-                update_keyword_tally(joint_dict, "Hardband Joints")
-
-    for col_name, col_value in joint_values.items():
-        col_value = re.sub(r'(\d+)\s(\d+/\d+)', r'\1_\2', col_value)
-        if col_name in ["BOX", "PIN"]:
-            process_box_pin_col(col_name, col_value, row_num, sheet)
-        elif col_name == "UT":
-            sheet[f"AT{row_num}"] = col_value
-        elif col_name == "TUBE":
-            process_tube_col(col_name, col_value, row_num, sheet)
-            process_tube_ser_for_tally(col_name, col_value, row_num, sheet)
-        elif col_name == "COMMENTS":
-            sheet[f"S{row_num}"] = col_value
-        elif col_name == "Visual OD":
-            sheet[f"AX{row_num}"] = col_value.replace('_', ' ')
-
-    write_final_class_status(scrap_col, repair_col, ready_col, hb_col, row_num)
+    flags = write_shorthand_joint(shorthand_styles['nd_tubing'], joint_values, row_num, sheet, datmg, columns)
+
+    # Check if the item is marked as scrap
+    if 'scrap' in flags:
+        sheet.cell(row=row_num, column=columns["Final Class"]["JOINT"], value='Scrap')
+        update_keyword_tally(joint_dict, "Scrap")
+    elif 'repair' in flags:
+        sheet.cell(row=row_num, column=columns["Final Class"]["JOINT"], value='Repairable')
+        update_keyword_tally(joint_dict, "Repairable")
+    else:
+        update_keyword_tally(joint_dict, "Ready")
+        if 'hb' in flags:
+            update_keyword_tally(joint_dict, "Hardband Joints")
 
 
 def generate_pdf_copy(summary_data, filename, widmg, datmg, root):
@@ -5735,6 +6920,33 @@ def generate_pdf_copy(summary_data, filename, widmg, datmg, root):
     # Save the generated PDF
     pdf.output(filename)
 
+def on_main_window_close(widmg, datmg, root):
+    # Capture the joint being typed and make sure the autosave writer has finished before exiting
+    try:
+        if widmg.first_entry_widget is not None and widmg.first_entry_widget.winfo_ismapped():
+            save_current_row_data(widmg, datmg, root)
+        if datmg.filename:
+            datmg.flush_saves()
+    except Exception as e:
+        logging.error(f"Error flushing report on close: {e}", exc_info=True)
+    root.destroy()
+
+def retire_data_manager(datmg):
+    try:
+        if datmg.filename:
+            datmg.flush_saves()
+    except Exception as e:
+        logging.error(f"Error flushing report before leaving it: {e}", exc_info=True)
+    if datmg.fsync_timer is not None:
+        datmg.fsync_timer.cancel()
+        datmg.fsync_timer = None
+
+def bind_main_window_handlers(widmg, datmg, root):
+    # Rebound whenever the managers are replaced, a handler holding the old ones would act on a dropped report
+    root.bind("<Configure>", widmg.schedule_resize_fonts)
+    root.bind("<Control-Shift-D>", lambda event: create_latency_diagnostics_window(widmg, datmg, root))
+    root.protocol("WM_DELETE_WINDOW", lambda: on_main_window_close(widmg, datmg, root))
+
 def main():
     try:
         root = initialize_main_window()
@@ -5743,7 +6955,8 @@ def main():
         datmg.set_widget_manager(widmg)
         widmg.set_data_manager(datmg)
         start_inspection_screen(widmg, datmg, root)
-        root.bind("<Configure>", widmg.schedule_resize_fonts)
+        bind_main_window_handlers(widmg, datmg, root)
+        start_recovery_scan(widmg, datmg, root)
         root.mainloop()
     except Exception as e:
         logging.error("An error occurred", exc_info=True)
@@ -5752,6 +6965,25 @@ def main():
         messagebox.showerror("Error", "An unexpected error occurred. Please check the log file.")
         root.destroy()
 
+def run_command_line_benchmark(benchmark_name):
+    # python TSHillData_v1.0.py --benchmark template-growth|report-export, run from the folder holding the templates
+    if benchmark_name == 'template-growth':
+        lines = [f"{'Joints':<8}{'extend ms':>11}{'write ms':>10}{'save ms':>10}"]
+        for joint_count, result in benchmark_template_growth().items():
+            lines.append(f"{joint_count:<8}{result['extend_ms']:>11.1f}{result['write_ms']:>10.1f}{result['save_ms']:>10.1f}")
+    elif benchmark_name == 'report-export':
+        lines = [f"{'Exporter':<12}{'us/joint':>10}"]
+        for label, us_per_joint in benchmark_report_export().items():
+            lines.append(f"{label:<12}{us_per_joint:>10.1f}")
+    else:
+        raise SystemExit(f"Unknown benchmark {benchmark_name!r}, expected template-growth or report-export")
+    text = "\n".join(lines)
+    print(text)
+    LatencyTracker().dump(exe_dir, f"Benchmark {benchmark_name}\n{text}")
+
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) == 3 and sys.argv[1] == "--benchmark":
+        run_command_line_benchmark(sys.argv[2])
+    else:
+        main()
 